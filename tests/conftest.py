@@ -0,0 +1,27 @@
+import pytest
+
+
+class MemoryCache:
+    """The in-memory cache."""
+
+    def __init__(self) -> None:
+        """Initialize the object."""
+        self.values: dict[tuple[str, str], str] = {}
+
+    async def get(self, bucket: str, key: str) -> str | None:
+        """Get the value for `key`."""
+        return self.values.get((bucket, key))
+
+    async def put(self, bucket: str, key: str, value: str) -> None:
+        """Put the value for `key`."""
+        self.values[bucket, key] = value
+
+    async def clean(self) -> None:
+        """Clean the cache."""
+        self.values.clear()
+
+
+@pytest.fixture
+def memory_cache() -> MemoryCache:
+    """Fixture the in-memory cache."""
+    return MemoryCache()
@@ -0,0 +1,77 @@
+import pytest
+
+from weasel.domain.dtypes.probability import Probability
+from weasel.domain.services.exceptions import WeaselCacheError
+from weasel.domain.services.matcher import MatcherService
+from weasel.domain.types.language import LanguageType
+from weasel.infrastructure.adapters.estimator import EstimatorAdapter
+from weasel.infrastructure.adapters.fingerprinter import FingerprinterAdapter
+from weasel.infrastructure.adapters.text_store import TextStoreAdapter
+from weasel.infrastructure.languages.python import PythonLanguage
+
+
+class BrokenCache:
+    """The cache that always fails."""
+
+    async def get(self, _bucket: str, _key: str) -> str | None:
+        """Get the value for `key`."""
+        raise WeaselCacheError
+
+    async def put(self, _bucket: str, _key: str, _value: str) -> None:
+        """Put the value for `key`."""
+        raise WeaselCacheError
+
+    async def clean(self) -> None:
+        """Clean the cache."""
+
+
+class CountingExecutor:
+    """The executor that counts calls."""
+
+    def __init__(self) -> None:
+        """Initialize the object."""
+        self.matches = 0
+        self.recognitions = 0
+
+    async def recognizes(self, _language: LanguageType, _code: str) -> bool:
+        """Check if the code matches the language."""
+        self.recognitions += 1
+        return True
+
+    async def match(
+        self,
+        _language: LanguageType,
+        _source: str,
+        _target: str,
+        _digest: str,
+        _score: Probability | None = None,
+    ) -> tuple[Probability, list[str]]:
+        """Match `source` and `target`."""
+        self.matches += 1
+        return 1.0, []
+
+    async def close(self) -> None:
+        """Shut the worker processes down."""
+
+
+@pytest.fixture
+def executor() -> CountingExecutor:
+    """Fixture the executor."""
+    return CountingExecutor()
+
+
+@pytest.fixture
+def matcher(executor: CountingExecutor) -> MatcherService:
+    """Fixture the matcher."""
+    return MatcherService(
+        _cache=BrokenCache(),
+        _estimator=EstimatorAdapter(_precision=3, _workers=1),
+        _executor=executor,
+        _fingerprint_threshold=0.5,
+        _fingerprinter=FingerprinterAdapter(_kgram_size=2, _window_size=2),
+        _languages=[PythonLanguage()],
+        _match_salt="",
+        _persist_matches=True,
+        _persist_recognitions=True,
+        _text_store=TextStoreAdapter(_size_limit=1024 * 1024),
+    )
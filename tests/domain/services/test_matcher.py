@@ -0,0 +1,144 @@
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from weasel.domain.services.matcher import MatcherService
+
+
+if TYPE_CHECKING:
+    from tests.conftest import MemoryCache
+    from tests.domain.services.conftest import CountingExecutor
+
+
+TEXT = "print('Hello, World!')\n"
+
+
+class TestMatcherService:
+    """Test the matcher service."""
+
+    async def test__maybe_match(
+        self, matcher: MatcherService, executor: "CountingExecutor", tmp_path: Path
+    ) -> None:
+        """Test the `maybe_match` method. Case: recognitions are memoized."""
+        paths = [tmp_path / f"main{index}.py" for index in range(3)]
+
+        for path in paths:
+            path.write_text(TEXT)
+
+        for source in paths:
+            for target in paths:
+                assert await matcher.maybe_match(source, target)
+
+        assert executor.recognitions == 1
+
+    async def test__maybe_match__extensions(
+        self, matcher: MatcherService, executor: "CountingExecutor", tmp_path: Path
+    ) -> None:
+        """Test the `maybe_match` method. Case: unsupported extensions."""
+        source = tmp_path / "main.py"
+        source.write_text(TEXT)
+
+        target = tmp_path / "main.txt"
+        target.write_text(TEXT)
+
+        assert await matcher.maybe_match(source, target) is None
+        assert not executor.recognitions
+
+    async def test__maybe_match__fingerprints(
+        self, matcher: MatcherService, executor: "CountingExecutor", tmp_path: Path
+    ) -> None:
+        """Test the `maybe_match` method. Case: unrelated files are not mutated."""
+        source = tmp_path / "source.py"
+        source.write_text("for item in range(10):\n    total += item * item\n")
+
+        target = tmp_path / "target.py"
+        target.write_text("class Greeter:\n    name = 'World'\n")
+
+        match = await matcher.maybe_match(source, target)
+
+        assert match is not None
+        assert not match.labels
+        assert not executor.matches
+
+    async def test__maybe_match_both(
+        self, matcher: MatcherService, executor: "CountingExecutor", tmp_path: Path
+    ) -> None:
+        """Test the `maybe_match_both` method."""
+        file1 = tmp_path / "main1.py"
+        file1.write_text(TEXT)
+
+        file2 = tmp_path / "main2.py"
+        file2.write_text(TEXT)
+
+        matches = await matcher.maybe_match_both(file1, file2)
+
+        assert matches is not None
+        assert (matches[0].source, matches[0].target) == (file1, file2)
+        assert (matches[1].source, matches[1].target) == (file2, file1)
+        assert executor.recognitions == 1
+        assert executor.matches == 2
+
+    async def test__maybe_match__persisted(
+        self,
+        matcher: MatcherService,
+        executor: "CountingExecutor",
+        memory_cache: "MemoryCache",
+        tmp_path: Path,
+    ) -> None:
+        """Test the `maybe_match` method. Case: matches are persisted across runs."""
+        source = tmp_path / "main1.py"
+        source.write_text(TEXT)
+
+        target = tmp_path / "main2.py"
+        target.write_text(TEXT + "print(42)\n")
+
+        first_run = replace(matcher, _cache=memory_cache)
+        second_run = replace(matcher, _cache=memory_cache)
+
+        assert await first_run.maybe_match_both(source, target)
+        assert executor.matches == 2
+
+        assert await second_run.maybe_match_both(source, target)
+        assert executor.matches == 2
+
+    async def test__maybe_match__persisted_recognitions(
+        self,
+        matcher: MatcherService,
+        executor: "CountingExecutor",
+        memory_cache: "MemoryCache",
+        tmp_path: Path,
+    ) -> None:
+        """Test the `maybe_match` method. Case: recognitions are persisted per salt."""
+        source = tmp_path / "main1.py"
+        source.write_text(TEXT)
+
+        target = tmp_path / "main2.py"
+        target.write_text(TEXT)
+
+        first_run = replace(matcher, _cache=memory_cache)
+        second_run = replace(matcher, _cache=memory_cache)
+        upgraded_run = replace(matcher, _cache=memory_cache, _match_salt="upgraded")
+
+        assert await first_run.maybe_match(source, target)
+        assert executor.recognitions == 1
+
+        assert await second_run.maybe_match(source, target)
+        assert executor.recognitions == 1
+
+        assert await upgraded_run.maybe_match(source, target)
+        assert executor.recognitions == 2
+
+    async def test__digest(self, matcher: MatcherService, tmp_path: Path) -> None:
+        """Test the `digest` method."""
+        for root in (tmp_path / "a", tmp_path / "b"):
+            root.mkdir()
+            (root / "main.py").write_text(TEXT)
+
+        digest_a = await matcher.digest(tmp_path / "a", [tmp_path / "a" / "main.py"])
+        digest_b = await matcher.digest(tmp_path / "b", [tmp_path / "b" / "main.py"])
+
+        assert digest_a == digest_b
+
+        (tmp_path / "b" / "main.py").write_text(TEXT + "print(42)\n")
+
+        assert await matcher.digest(tmp_path / "b", [tmp_path / "b" / "main.py"]) != digest_a
@@ -0,0 +1,472 @@
+import asyncio
+import os
+
+from collections.abc import Awaitable, Callable
+from contextlib import aclosing
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+from uuid import uuid4
+
+import pytest
+
+from weasel.container import WEASEL_CONTAINER
+from weasel.domain.entities.comparison import ComparisonEntity
+from weasel.domain.entities.contest import ContestEntity
+from weasel.domain.entities.match import MatchEntity
+from weasel.domain.entities.metrics import MetricsEntity
+from weasel.domain.entities.report import ReportEntity
+from weasel.domain.entities.submission import SubmissionEntity
+from weasel.domain.entities.task import TaskEntity
+from weasel.domain.services.matcher import MatcherService
+from weasel.domain.services.scanner import MatchSelector, ScannerService
+from weasel.domain.types.language import LanguageType
+from weasel.infrastructure.adapters.metrics import MetricsAdapter
+from weasel.infrastructure.adapters.scheduler import SchedulerAdapter
+from weasel.infrastructure.adapters.sealer import SealerAdapter
+from weasel.infrastructure.languages.java import JavaLanguage
+from weasel.infrastructure.languages.python import PythonLanguage
+
+
+if TYPE_CHECKING:
+    from weasel.domain.services.interfaces.git import GitInterface
+    from weasel.domain.services.interfaces.index import IndexInterface
+
+
+METRICS = MetricsEntity.model_validate(dict.fromkeys(MetricsEntity.model_fields, 0))
+TASK = TaskEntity(
+    name="task", submissions=[SubmissionEntity(name=name, path=Path(name)) for name in ("S", "T")]
+)
+COMPARISONS = [
+    ComparisonEntity(source=f"S{index}", target="T", metrics=METRICS, matches=[])
+    for index in range(3)
+]
+
+
+class FakeScan:
+    """The scan that passes the comparisons to the sink."""
+
+    def __init__(self, *, hangs: bool = False, fails: bool = False) -> None:
+        """Initialize the object."""
+        self.hangs = hangs
+        self.fails = fails
+        self.cancelled = False
+
+    async def __call__(
+        self,
+        _contest: ContestEntity,
+        _baseline: ReportEntity | None = None,
+        sink: Callable[[str, ComparisonEntity], Awaitable[None]] | None = None,
+        *,
+        min_probability: float = 0.0,  # noqa: ARG002
+        top_k_matches: int | None = None,  # noqa: ARG002
+        with_digests: bool = False,  # noqa: ARG002
+    ) -> ReportEntity:
+        """Scan the contest."""
+        assert sink is not None
+
+        for comparison in COMPARISONS:
+            await sink("task", comparison)
+
+        if self.fails:
+            raise RuntimeError
+
+        try:
+            if self.hangs:
+                await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+        return ReportEntity(reviews=[])
+
+
+@pytest.fixture
+def scanner() -> ScannerService:
+    """Fixture the scanner."""
+    return WEASEL_CONTAINER.scanner_service()
+
+
+@pytest.fixture
+def local_scanner(matcher: MatcherService, tmp_path: Path) -> ScannerService:
+    """Fixture the scanner of local submissions."""
+    return ScannerService(
+        _bitbucket=cast("GitInterface", None),
+        _github=cast("GitInterface", None),
+        _index=cast("IndexInterface", None),
+        _index_enabled=False,
+        _languages=[PythonLanguage()],
+        _matcher=matcher,
+        _metrics=MetricsAdapter(_precision=3),
+        _scheduler=SchedulerAdapter(_global_limit=4, _task_limit=2),
+        _sealer=SealerAdapter(
+            _data_dir=tmp_path / "data", _id_factory=uuid4, _languages=[PythonLanguage()]
+        ),
+    )
+
+
+class TestScannerService:
+    """Test the scanner service."""
+
+    async def test__scan_iter(
+        self, scanner: ScannerService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the `scan_iter` method."""
+        monkeypatch.setattr(scanner, "scan", FakeScan())
+
+        contest = ContestEntity(tasks=[TASK])
+        results = [item async for item in scanner.scan_iter(contest)]
+
+        assert results == [("task", comparison) for comparison in COMPARISONS]
+
+    async def test__scan_iter__aclosing(
+        self, scanner: ScannerService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the `scan_iter` method. Case: the scan is cancelled once closed."""
+        scan = FakeScan(hangs=True)
+        monkeypatch.setattr(scanner, "scan", scan)
+
+        contest = ContestEntity(tasks=[TASK])
+
+        async with aclosing(scanner.scan_iter(contest)) as comparisons:
+            async for _, comparison in comparisons:
+                if comparison == COMPARISONS[-1]:
+                    break
+
+        assert scan.cancelled
+
+    async def test__scan_iter__cancel(
+        self, scanner: ScannerService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the `scan_iter` method. Case: no tasks are left once the consumer is cancelled."""
+        scan = FakeScan(hangs=True)
+        monkeypatch.setattr(scanner, "scan", scan)
+
+        contest = ContestEntity(tasks=[TASK])
+        received = asyncio.Event()
+
+        async def consume() -> None:
+            async for _, comparison in scanner.scan_iter(contest):
+                if comparison == COMPARISONS[-1]:
+                    received.set()
+
+        consumer = asyncio.create_task(consume())
+        await received.wait()
+        await asyncio.sleep(0)
+
+        consumer.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await consumer
+
+        assert scan.cancelled
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    async def test__scan_iter__error(
+        self, scanner: ScannerService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the `scan_iter` method. Case: the error is raised after the comparisons."""
+        monkeypatch.setattr(scanner, "scan", FakeScan(fails=True))
+
+        contest = ContestEntity(tasks=[TASK])
+        results: list[tuple[str, ComparisonEntity]] = []
+
+        async def consume() -> None:
+            async for item in scanner.scan_iter(contest):
+                results.append(item)  # noqa: PERF401
+
+        with pytest.raises(RuntimeError):
+            await consume()
+
+        assert len(results) == len(COMPARISONS)
+
+    async def test__scan__baseline(
+        self,
+        local_scanner: ScannerService,
+        matcher: MatcherService,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        """Test the `scan` method. Case: only the changed submissions are compared again."""
+        for name in ("A", "B", "C"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "main.py").write_text(f"print({name!r})\n")
+
+        pairs: list[tuple[str, str]] = []
+        maybe_match_both = matcher.maybe_match_both
+
+        async def counting_match_both(
+            file1: Path, file2: Path
+        ) -> tuple[MatchEntity, MatchEntity] | None:
+            texts = await asyncio.gather(
+                *(asyncio.to_thread(file.read_text) for file in (file1, file2))
+            )
+            pairs.append((texts[0], texts[1]))
+            return await maybe_match_both(file1, file2)
+
+        monkeypatch.setattr(matcher, "maybe_match_both", counting_match_both)
+
+        task = TaskEntity(
+            name="task",
+            submissions=[
+                SubmissionEntity(name=name, path=tmp_path / name) for name in ("A", "B", "C")
+            ],
+        )
+        contest = ContestEntity(tasks=[task])
+
+        baseline = await local_scanner.scan(contest, with_digests=True)
+        assert len(pairs) == 3
+        assert len(baseline.reviews[0].digests) == 3
+
+        (tmp_path / "C" / "main.py").write_text("print('changed')\n")
+        pairs.clear()
+
+        report = await local_scanner.scan(contest, baseline)
+        assert sorted(pairs) == [
+            ("print('A')\n", "print('changed')\n"),
+            ("print('B')\n", "print('changed')\n"),
+        ]
+
+        comparisons = {
+            (comparison.source, comparison.target) for comparison in report.reviews[0].comparisons
+        }
+        assert comparisons == {(s, t) for s in "ABC" for t in "ABC" if s != t}
+
+        reused = {
+            (comparison.source, comparison.target): comparison
+            for comparison in baseline.reviews[0].comparisons
+        }
+        for comparison in report.reviews[0].comparisons:
+            if "C" not in (comparison.source, comparison.target):
+                assert comparison == reused[comparison.source, comparison.target]
+
+    @pytest.mark.parametrize(
+        ("baseline_options", "options", "expected"),
+        [
+            ({"top_k_matches": 2}, {}, 3),
+            ({"top_k_matches": 2}, {"top_k_matches": 3}, 3),
+            ({"top_k_matches": 2}, {"top_k_matches": 1}, 0),
+            ({"min_probability": 0.5}, {}, 3),
+            ({"min_probability": 0.5}, {"min_probability": 0.6}, 0),
+            ({}, {"min_probability": 0.5, "top_k_matches": 1}, 0),
+        ],
+    )
+    async def test__scan__baseline__pruned(  # noqa: PLR0913
+        self,
+        local_scanner: ScannerService,
+        matcher: MatcherService,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        baseline_options: dict[str, Any],
+        options: dict[str, Any],
+        expected: int,
+    ) -> None:
+        """Test the `scan` method. Case: the baseline pruned more strictly is not reused."""
+        for name in ("A", "B", "C"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "main.py").write_text(f"print({name!r})\n")
+
+        calls = 0
+        maybe_match_both = matcher.maybe_match_both
+
+        async def counting_match_both(
+            file1: Path, file2: Path
+        ) -> tuple[MatchEntity, MatchEntity] | None:
+            nonlocal calls
+            calls += 1
+            return await maybe_match_both(file1, file2)
+
+        monkeypatch.setattr(matcher, "maybe_match_both", counting_match_both)
+
+        task = TaskEntity(
+            name="task",
+            submissions=[
+                SubmissionEntity(name=name, path=tmp_path / name) for name in ("A", "B", "C")
+            ],
+        )
+        contest = ContestEntity(tasks=[task])
+
+        baseline = await local_scanner.scan(contest, with_digests=True, **baseline_options)
+        calls = 0
+
+        await local_scanner.scan(contest, baseline, **options)
+        assert calls == expected
+
+    async def test__scan__digests(
+        self,
+        local_scanner: ScannerService,
+        matcher: MatcherService,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        """Test the `scan` method. Case: the submissions are not digested unless required."""
+
+        async def digest(_root: Path, _files: list[Path]) -> str:
+            raise AssertionError
+
+        monkeypatch.setattr(matcher, "digest", digest)
+
+        for name in ("A", "B"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "main.py").write_text(f"print({name!r})\n")
+
+        task = TaskEntity(
+            name="task",
+            submissions=[SubmissionEntity(name=name, path=tmp_path / name) for name in ("A", "B")],
+        )
+        report = await local_scanner.scan(ContestEntity(tasks=[task]))
+
+        assert report.reviews[0].digests == {}
+
+    async def test__list_files(self, local_scanner: ScannerService, tmp_path: Path) -> None:
+        """Test the `_list_files` method. Case: the files are grouped by language."""
+        scanner = replace(local_scanner, _languages=[PythonLanguage(), JavaLanguage()])
+
+        for name in ("main.py", "pkg/Main.java", "pkg/util.py", "README.md", "pkg/data.json"):
+            (tmp_path / name).parent.mkdir(exist_ok=True)
+            (tmp_path / name).touch()
+
+        assert await scanner._list_files(tmp_path) == {
+            LanguageType.JAVA: [tmp_path / "pkg" / "Main.java"],
+            LanguageType.PYTHON: [tmp_path / "main.py", tmp_path / "pkg" / "util.py"],
+        }
+
+    def test__walk(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test the `_walk` method. Case: each directory is scanned once, the links are skipped."""
+        for name in ("b.py", "a/c.py", "a/b/a.py", "z.py"):
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).touch()
+
+        (tmp_path / "link.py").symlink_to(tmp_path / "b.py")
+        (tmp_path / "link").symlink_to(tmp_path / "a", target_is_directory=True)
+
+        scanned: list[str] = []
+        scandir = os.scandir
+
+        def counting_scandir(path: str) -> "os._ScandirIterator[str]":
+            scanned.append(os.fspath(path))
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+
+        assert ScannerService._walk(tmp_path) == [
+            tmp_path / "a" / "b" / "a.py",
+            tmp_path / "a" / "c.py",
+            tmp_path / "b.py",
+            tmp_path / "z.py",
+        ]
+        assert sorted(scanned) == sorted(map(str, (tmp_path, tmp_path / "a", tmp_path / "a" / "b")))
+
+    async def test__compare(
+        self,
+        local_scanner: ScannerService,
+        matcher: MatcherService,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        """Test the `_compare` method. Case: only the files of the same language are paired."""
+        pairs: list[tuple[Path, Path]] = []
+
+        async def maybe_match_both(file1: Path, file2: Path) -> None:
+            pairs.append((file1, file2))
+
+        monkeypatch.setattr(matcher, "maybe_match_both", maybe_match_both)
+
+        s1 = SubmissionEntity(
+            name="S",
+            path=tmp_path / "S",
+            files={
+                LanguageType.JAVA: [tmp_path / "S" / "Main.java"],
+                LanguageType.PYTHON: [tmp_path / "S" / "main.py"],
+            },
+        )
+        s2 = SubmissionEntity(
+            name="T",
+            path=tmp_path / "T",
+            files={
+                LanguageType.JAVA: [tmp_path / "T" / "Main.java"],
+                LanguageType.PYTHON: [tmp_path / "T" / "a.py", tmp_path / "T" / "b.py"],
+            },
+        )
+        s3 = SubmissionEntity(
+            name="U", path=tmp_path / "U", files={LanguageType.PYTHON: [tmp_path / "U" / "a.py"]}
+        )
+
+        comparisons = await local_scanner._compare(s1, s2)
+
+        assert [comparison.source for comparison in comparisons] == ["S", "T"]
+        assert pairs == [
+            (tmp_path / "S" / "Main.java", tmp_path / "T" / "Main.java"),
+            (tmp_path / "S" / "main.py", tmp_path / "T" / "a.py"),
+            (tmp_path / "S" / "main.py", tmp_path / "T" / "b.py"),
+        ]
+
+        pairs.clear()
+        await local_scanner._compare(s2, s3)
+
+        assert pairs == [
+            (tmp_path / "T" / "a.py", tmp_path / "U" / "a.py"),
+            (tmp_path / "T" / "b.py", tmp_path / "U" / "a.py"),
+        ]
+
+
+class TestMatchSelector:
+    """Test the match selector."""
+
+    @pytest.mark.parametrize(
+        ("min_probability", "top_k", "expected"),
+        [
+            (0.0, None, [0.9, 0.5, 0.5, 0.3, 0.1]),
+            (0.4, None, [0.9, 0.5, 0.5]),
+            (0.0, 2, [0.9, 0.5]),
+            (0.6, 2, [0.9]),
+            (1.0, None, []),
+        ],
+    )
+    def test__select(
+        self, min_probability: float, top_k: int | None, expected: list[float]
+    ) -> None:
+        """Test the `select` method."""
+        probabilities = [0.5, 0.1, 0.9, 0.3, 0.5]
+        matches = [
+            MatchEntity(
+                source=Path(f"{index}.py"),
+                target=Path(f"{index}.py"),
+                language=LanguageType.PYTHON,
+                probability=probability,
+                labels=[],
+            )
+            for index, probability in enumerate(probabilities)
+        ]
+
+        selector = MatchSelector(min_probability, top_k)
+
+        for match in matches:
+            selector.push(match)
+
+        selected = selector.select()
+
+        assert [match.probability for match in selected] == expected
+        assert selected == sorted(selected, key=lambda match: -match.probability)
+        assert selector.probabilities == probabilities
+
+    @pytest.mark.parametrize("order", [[0, 1, 2, 3, 4], [4, 3, 2, 1, 0], [3, 0, 4, 1, 2]])
+    def test__select__ties(self, order: list[int]) -> None:
+        """Test the `select` method. Case: the lesser files win the ties (in any order)."""
+        matches = [
+            MatchEntity(
+                source=Path(f"{index}.py"),
+                target=Path(f"{index}.py"),
+                language=LanguageType.PYTHON,
+                probability=0.5,
+                labels=[],
+            )
+            for index in range(5)
+        ]
+
+        selector = MatchSelector(top_k=3)
+
+        for index in order:
+            selector.push(matches[index])
+
+        assert selector.select() == matches[:3]
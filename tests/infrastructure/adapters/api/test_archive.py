@@ -0,0 +1,55 @@
+import io
+import zipfile
+
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from weasel.infrastructure.adapters.api.archive import extract_archive
+from weasel.infrastructure.adapters.sealer import SealerAdapter
+from weasel.infrastructure.languages.python import PythonLanguage
+
+
+@pytest.fixture
+def sealer(tmp_path: Path) -> SealerAdapter:
+    """Fixture the sealer."""
+    return SealerAdapter(_data_dir=tmp_path, _id_factory=uuid4, _languages=[PythonLanguage()])
+
+
+def test__extract_archive(sealer: SealerAdapter, tmp_path: Path) -> None:
+    """Test the `extract_archive` function. Case: ignorable entries are skipped."""
+    buffer = io.BytesIO()
+
+    with zipfile.ZipFile(buffer, mode="w") as file:
+        file.writestr("user-repo.github.io-ref/", "")
+        file.writestr("user-repo.github.io-ref/main.py", "")
+        file.writestr("user-repo.github.io-ref/pkg/module.py", "")
+        file.writestr("user-repo.github.io-ref/README.md", "")
+        file.writestr("user-repo.github.io-ref/.venv/module.py", "")
+        file.writestr("user-repo.github.io-ref/pkg/__pycache__/module.py", "")
+
+    buffer.seek(0)
+    extract_archive(buffer, tmp_path / "extract", sealer.is_ignorable)
+
+    root = tmp_path / "extract" / "user-repo.github.io-ref"
+    files = {path.relative_to(root).as_posix() for path in root.rglob("*") if path.is_file()}
+
+    assert files == {"main.py", "pkg/module.py"}
+
+
+async def test__extract_archive__unsupported(sealer: SealerAdapter, tmp_path: Path) -> None:
+    """Test the `extract_archive` function. Case: no supported files (but still sealable)."""
+    buffer = io.BytesIO()
+
+    with zipfile.ZipFile(buffer, mode="w") as file:
+        file.writestr("user-repo-ref/", "")
+        file.writestr("user-repo-ref/README.md", "")
+        file.writestr("user-repo-ref/.gitignore", "")
+
+    buffer.seek(0)
+    extract_archive(buffer, tmp_path / "extract", sealer.is_ignorable)
+
+    seal = await sealer.seal(tmp_path / "extract" / "user-repo-ref")
+
+    assert not [path for path in seal.rglob("*") if path.is_file()]
@@ -0,0 +1,118 @@
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from weasel.domain.services.exceptions import WeaselError
+from weasel.infrastructure.adapters.api.bitbucket import BitbucketAPIAdapter
+from weasel.infrastructure.adapters.api.limiter import LimiterAdapter
+from weasel.infrastructure.adapters.api.session import SessionAdapter
+
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+
+
+async def handle_repository(_request: web.Request) -> web.Response:
+    """Serve the repository."""
+    return web.json_response({"mainbranch": {"name": "main"}})
+
+
+async def handle_commit(request: web.Request) -> web.Response:
+    """Serve the commit."""
+    if request.match_info["ref"] != "main":
+        raise web.HTTPNotFound
+
+    return web.json_response({"hash": SHA})
+
+
+@pytest.fixture
+def app() -> web.Application:
+    """Fixture the application."""
+    app = web.Application()
+    app.router.add_get("/2.0/repositories/{user}/{repo}", handle_repository)
+    app.router.add_get("/2.0/repositories/{user}/{repo}/commit/{ref}", handle_commit)
+    return app
+
+
+class TestBitbucketAPIAdapter:
+    """Test the *Bitbucket* API adapter."""
+
+    @pytest.mark.parametrize("ref", ["HEAD", "main"])
+    async def test__resolve(self, app: web.Application, tmp_path: Path, ref: str) -> None:
+        """Test the `resolve` method."""
+        session = SessionAdapter(
+            _dns_cache_ttl=300, _keepalive_timeout=30.0, _limit=10, _limit_per_host=2
+        )
+
+        async with TestServer(app) as server:
+            url = str(server.make_url("/"))
+            adapter = BitbucketAPIAdapter(
+                _api_url=url,
+                _connect_timeout=5.0,
+                _data_dir=tmp_path,
+                _id_factory=uuid4,
+                _is_ignorable=lambda _: False,
+                _limiter=LimiterAdapter(_burst=10, _max_in_flight=2, _rate=100.0),
+                _rest_url=url,
+                _session=session,
+            )
+
+            assert await adapter.resolve("user", "repo", ref) == SHA
+
+            with pytest.raises(FileNotFoundError):
+                await adapter.resolve("user", "repo", "missing")
+
+            await session.close()
+
+    @pytest.mark.parametrize(
+        ("repository", "commit"),
+        [
+            ({"mainbranch": None}, {"hash": SHA}),
+            ({}, {"hash": SHA}),
+            ([], {"hash": SHA}),
+            ({"mainbranch": {"name": "main"}}, {"hash": None}),
+            ({"mainbranch": {"name": "main"}}, None),
+        ],
+    )
+    async def test__resolve__invalid(
+        self, tmp_path: Path, repository: Any, commit: Any  # noqa: ANN401
+    ) -> None:
+        """Test the `resolve` method. Case: the payload is unexpected (e.g. no main branch)."""
+
+        async def handle_repository(_request: web.Request) -> web.Response:
+            """Serve the repository."""
+            return web.json_response(repository)
+
+        async def handle_commit(_request: web.Request) -> web.Response:
+            """Serve the commit."""
+            return web.json_response(commit)
+
+        app = web.Application()
+        app.router.add_get("/2.0/repositories/{user}/{repo}", handle_repository)
+        app.router.add_get("/2.0/repositories/{user}/{repo}/commit/{ref}", handle_commit)
+
+        session = SessionAdapter(
+            _dns_cache_ttl=300, _keepalive_timeout=30.0, _limit=10, _limit_per_host=2
+        )
+
+        async with TestServer(app) as server:
+            url = str(server.make_url("/"))
+            adapter = BitbucketAPIAdapter(
+                _api_url=url,
+                _connect_timeout=5.0,
+                _data_dir=tmp_path,
+                _id_factory=uuid4,
+                _is_ignorable=lambda _: False,
+                _limiter=LimiterAdapter(_burst=10, _max_in_flight=2, _rate=100.0),
+                _rest_url=url,
+                _session=session,
+            )
+
+            with pytest.raises(WeaselError):
+                await adapter.resolve("user", "repo", "HEAD")
+
+            await session.close()
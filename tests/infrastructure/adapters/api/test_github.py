@@ -0,0 +1,116 @@
+import io
+import time
+import zipfile
+
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from weasel.infrastructure.adapters.api.github import GitHubAPIAdapter
+from weasel.infrastructure.adapters.api.limiter import LimiterAdapter
+from weasel.infrastructure.adapters.api.session import SessionAdapter
+
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+DELAY = 0.1
+
+
+async def handle_commit(request: web.Request) -> web.Response:
+    """Serve the commit *SHA*."""
+    if request.headers.get("Accept") != "application/vnd.github.sha":
+        raise web.HTTPNotAcceptable
+
+    if request.match_info["ref"] not in {"HEAD", "main"}:
+        raise web.HTTPNotFound
+
+    return web.Response(text=SHA)
+
+
+async def handle_zipball(_request: web.Request) -> web.Response:
+    """Redirect to the archive (with the rate limit headers)."""
+    location = "/codeload/archive.zip"
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": f"{time.time() + DELAY}"}
+    raise web.HTTPFound(location, headers=headers)
+
+
+async def handle_codeload(_request: web.Request) -> web.Response:
+    """Serve the archive."""
+    buffer = io.BytesIO()
+
+    with zipfile.ZipFile(buffer, mode="w") as file:
+        file.writestr("user-repo-ref/main.py", "")
+
+    return web.Response(body=buffer.getvalue(), content_type="application/zip")
+
+
+@pytest.fixture
+def app() -> web.Application:
+    """Fixture the application."""
+    app = web.Application()
+    app.router.add_get("/repos/{user}/{repo}/commits/{ref}", handle_commit)
+    app.router.add_get("/repos/{user}/{repo}/zipball/{ref}", handle_zipball)
+    app.router.add_get("/codeload/archive.zip", handle_codeload)
+    return app
+
+
+class TestGitHubAPIAdapter:
+    """Test the *GitHub* API adapter."""
+
+    @pytest.mark.parametrize("ref", ["HEAD", "main"])
+    async def test__resolve(self, app: web.Application, tmp_path: Path, ref: str) -> None:
+        """Test the `resolve` method."""
+        session = SessionAdapter(
+            _dns_cache_ttl=300, _keepalive_timeout=30.0, _limit=10, _limit_per_host=2
+        )
+
+        async with TestServer(app) as server:
+            adapter = GitHubAPIAdapter(
+                _api_url=str(server.make_url("/")),
+                _connect_timeout=5.0,
+                _data_dir=tmp_path,
+                _id_factory=uuid4,
+                _is_ignorable=lambda _: False,
+                _limiter=LimiterAdapter(_burst=10, _max_in_flight=2, _rate=100.0),
+                _session=session,
+            )
+
+            assert await adapter.resolve("user", "repo", ref) == SHA
+
+            with pytest.raises(FileNotFoundError):
+                await adapter.resolve("user", "repo", "missing")
+
+            await session.close()
+
+    async def test__download(self, app: web.Application, tmp_path: Path) -> None:
+        """Test the `download` method. Case: the redirect reports the rate limit."""
+        session = SessionAdapter(
+            _dns_cache_ttl=300, _keepalive_timeout=30.0, _limit=10, _limit_per_host=2
+        )
+        limiter = LimiterAdapter(_burst=10, _max_in_flight=2, _rate=100.0)
+
+        async with TestServer(app) as server:
+            adapter = GitHubAPIAdapter(
+                _api_url=str(server.make_url("/")),
+                _connect_timeout=5.0,
+                _data_dir=tmp_path,
+                _id_factory=uuid4,
+                _is_ignorable=lambda _: False,
+                _limiter=limiter,
+                _session=session,
+            )
+
+            path = await adapter.download("user", "repo", "ref")
+            await session.close()
+
+        assert (path / "main.py").exists()
+
+        start = time.monotonic()
+
+        async with limiter.limit():
+            pass
+
+        assert time.monotonic() - start >= DELAY / 2
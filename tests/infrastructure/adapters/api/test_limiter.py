@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+import pytest
+
+from weasel.infrastructure.adapters.api.limiter import LimiterAdapter
+
+
+DELAY = 0.1
+
+
+class Probe:
+    """The concurrency probe."""
+
+    def __init__(self, limiter: LimiterAdapter) -> None:
+        """Initialize the object."""
+        self.limiter = limiter
+        self.running = 0
+        self.peak = 0
+
+    async def run(self) -> None:
+        """Run the probe."""
+        async with self.limiter.limit():
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            await asyncio.sleep(0.001)
+            self.running -= 1
+
+
+class TestLimiterAdapter:
+    """Test the limiter adapter."""
+
+    async def test__limit__in_flight(self) -> None:
+        """Test the `limit` method. Case: requests in flight are bounded."""
+        probe = Probe(LimiterAdapter(_burst=100, _max_in_flight=2, _rate=1000.0))
+        await asyncio.gather(*(probe.run() for _ in range(10)))
+
+        assert probe.peak == 2
+
+    async def test__limit__rate(self) -> None:
+        """Test the `limit` method. Case: requests are paced after the burst."""
+        probe = Probe(LimiterAdapter(_burst=2, _max_in_flight=10, _rate=50.0))
+
+        start = time.monotonic()
+        await asyncio.gather(*(probe.run() for _ in range(6)))
+
+        assert time.monotonic() - start >= (6 - 2) / 50.0 * 0.9
+
+    @pytest.mark.parametrize("kind", ["retry-after", "reset"])
+    async def test__observe(self, kind: str) -> None:
+        """Test the `observe` method. Case: requests are paused."""
+        headers = (
+            {"Retry-After": f"{DELAY}"}
+            if kind == "retry-after"
+            else {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": f"{time.time() + DELAY}"}
+        )
+
+        limiter = LimiterAdapter(_burst=10, _max_in_flight=10, _rate=1000.0)
+        limiter.observe(headers)
+
+        start = time.monotonic()
+
+        async with limiter.limit():
+            pass
+
+        assert time.monotonic() - start >= DELAY / 2
+
+    @pytest.mark.parametrize(
+        ("status", "headers"),
+        [
+            (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"}),
+            (403, {"Retry-After": "0"}),
+            (429, {"Retry-After": "0"}),
+        ],
+    )
+    def test__is_rate_limited(self, status: int, headers: dict[str, str]) -> None:
+        """Test the `is_rate_limited` method."""
+        limiter = LimiterAdapter(_burst=10, _max_in_flight=10, _rate=1000.0)
+        assert limiter.is_rate_limited(status, headers)
+
+    @pytest.mark.parametrize(
+        ("status", "headers"),
+        [(403, {}), (403, {"X-RateLimit-Remaining": "10"}), (404, {"Retry-After": "0"})],
+    )
+    def test__is_rate_limited__not(self, status: int, headers: dict[str, str]) -> None:
+        """Test the `is_rate_limited` method. Case: not limited (e.g. private repositories)."""
+        limiter = LimiterAdapter(_burst=10, _max_in_flight=10, _rate=1000.0)
+        assert not limiter.is_rate_limited(status, headers)
+
+    def test__limit__loops(self) -> None:
+        """Test the `limit` method. Case: the event loops run in sequence."""
+        probe = Probe(LimiterAdapter(_burst=3, _max_in_flight=2, _rate=1000.0))
+
+        async def burst() -> None:
+            """Run the burst of requests."""
+            await asyncio.gather(*(probe.run() for _ in range(3)))
+
+        for _ in range(2):
+            asyncio.run(burst())
+
+        assert probe.peak == 2
@@ -0,0 +1,117 @@
+import io
+import zipfile
+
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from weasel.infrastructure.adapters.api.bitbucket import BitbucketAPIAdapter
+from weasel.infrastructure.adapters.api.github import GitHubAPIAdapter
+from weasel.infrastructure.adapters.api.limiter import LimiterAdapter
+from weasel.infrastructure.adapters.api.session import SessionAdapter
+
+
+TEXT = "print('Hello, World!')\n"
+
+
+class FakeServer:
+    """The fake *Bitbucket* and *GitHub* server."""
+
+    def __init__(self) -> None:
+        """Initialize the object."""
+        self.peers: set[tuple[str, int]] = set()
+        self.requests = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Serve the archive."""
+        if request.transport is not None:
+            self.peers.add(request.transport.get_extra_info("peername"))
+
+        self.requests += 1
+        return web.Response(body=self.archive, content_type="application/zip")
+
+    @property
+    def archive(self) -> bytes:
+        """Get the archive."""
+        buffer = io.BytesIO()
+
+        with zipfile.ZipFile(buffer, mode="w") as file:
+            file.writestr("repo-ref/main.py", TEXT)
+
+        return buffer.getvalue()
+
+    @property
+    def app(self) -> web.Application:
+        """Get the application."""
+        app = web.Application()
+        app.router.add_get("/repos/{user}/{repo}/zipball/{ref}", self.handle)
+        app.router.add_get("/{user}/{repo}/get/{ref}.zip", self.handle)
+        return app
+
+
+@pytest.fixture
+def fake() -> FakeServer:
+    """Fixture the fake server."""
+    return FakeServer()
+
+
+@pytest.fixture
+def session() -> SessionAdapter:
+    """Fixture the session."""
+    return SessionAdapter(_dns_cache_ttl=300, _keepalive_timeout=30.0, _limit=10, _limit_per_host=2)
+
+
+class TestSessionAdapter:
+    """Test the session adapter."""
+
+    async def test__download(
+        self, fake: FakeServer, session: SessionAdapter, tmp_path: Path
+    ) -> None:
+        """Test the `download` method. Case: the connection is reused by both adapters."""
+        async with TestServer(fake.app) as server:
+            url = str(server.make_url("/"))
+
+            bitbucket = BitbucketAPIAdapter(
+                _api_url=url,
+                _connect_timeout=5.0,
+                _data_dir=tmp_path,
+                _id_factory=uuid4,
+                _is_ignorable=lambda _: False,
+                _limiter=LimiterAdapter(_burst=10, _max_in_flight=2, _rate=100.0),
+                _rest_url=url,
+                _session=session,
+            )
+            github = GitHubAPIAdapter(
+                _api_url=url,
+                _connect_timeout=5.0,
+                _data_dir=tmp_path,
+                _id_factory=uuid4,
+                _is_ignorable=lambda _: False,
+                _limiter=LimiterAdapter(_burst=10, _max_in_flight=2, _rate=100.0),
+                _session=session,
+            )
+
+            for adapter in (github, bitbucket, github, bitbucket):
+                path = await adapter.download("user", "repo", "ref")
+                assert (path / "main.py").read_text() == TEXT
+
+            await session.close()
+
+        assert fake.requests == 4
+        assert len(fake.peers) == 1
+
+    async def test__close(self, session: SessionAdapter) -> None:
+        """Test the `close` method."""
+        first = session.get_session()
+        assert session.get_session() is first
+
+        await session.close()
+
+        assert first.closed
+        assert session.get_session() is not first
+
+        await session.close()
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from weasel.domain.services.interfaces.assignment import AssignmentInterface
+from weasel.infrastructure.adapters import assignment
+from weasel.infrastructure.adapters.assignment import AssignmentAdapter
+
+
+WEIGHTS = np.array([0.0, 0.25, 0.5, 1.0])
+
+
+@pytest.fixture(params=["scipy", "numpy"])
+def adapter(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> AssignmentInterface:
+    """Fixture the assignment adapter (per backend)."""
+    if request.param == "numpy":
+        monkeypatch.setattr(assignment, "linear_sum_assignment", None)
+    return AssignmentAdapter()
+
+
+class TestAssignmentAdapter:
+    """Test the assignment adapter."""
+
+    async def test__assign(self, adapter: AssignmentInterface) -> None:
+        """Test the `assign` method."""
+        weights = np.array([[0.1, 0.9, 0.2], [0.8, 0.7, 0.1], [0.3, 0.2, 0.6]])
+
+        assert await adapter.assign(weights) == {0: 1, 1: 0, 2: 2}
+
+    async def test__assign__rectangular(self, adapter: AssignmentInterface) -> None:
+        """Test the `assign` method. Case: more sources than targets."""
+        weights = np.array([[0.1, 0.9], [0.8, 0.7], [0.3, 0.2]])
+
+        assert await adapter.assign(weights) == {0: 1, 1: 0}
+
+    async def test__assign__zero_weights(self, adapter: AssignmentInterface) -> None:
+        """Test the `assign` method. Case: the pairs with zero weights are not matched."""
+        weights = np.array([[0.0, 0.5], [0.0, 0.0]])
+
+        assert await adapter.assign(weights) == {0: 1}
+
+    async def test__assign__ties(self, adapter: AssignmentInterface) -> None:
+        """Test the `assign` method. Case: equal weights."""
+        weights = np.full((3, 3), 0.5)
+
+        assert await adapter.assign(weights) == {0: 0, 1: 1, 2: 2}
+
+    @pytest.mark.parametrize("shape", [(6, 5), (5, 6), (8, 8)])
+    async def test__assign__backends(
+        self, shape: tuple[int, int], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the `assign` method. Case: both backends break the ties the same way."""
+        generator = np.random.default_rng(0)
+        adapter = AssignmentAdapter()
+
+        for _ in range(100):
+            weights = generator.choice(WEIGHTS, size=shape)
+            expected = await adapter.assign(weights)
+
+            with monkeypatch.context() as context:
+                context.setattr(assignment, "linear_sum_assignment", None)
+                assert await adapter.assign(weights) == expected
+
+    async def test__assign__empty(self, adapter: AssignmentInterface) -> None:
+        """Test the `assign` method. Case: no sources."""
+        assert await adapter.assign(np.zeros((0, 3))) == {}
@@ -9,7 +9,7 @@ from weasel.infrastructure.adapters.estimator import EstimatorAdapter
 @pytest.fixture
 def estimator() -> EstimatorInterface:
     """Fixture the estimator."""
-    return EstimatorAdapter(_precision=3)
+    return EstimatorAdapter(_precision=3, _workers=1)
 
 
 class TestEstimatorAdapter:
@@ -50,3 +50,30 @@ class TestEstimatorAdapter:
         actual_probability = await estimator.estimate(source, target)
 
         assert isclose(actual_probability, expected_probability)
+
+    async def test__estimate_many(self, estimator: EstimatorInterface) -> None:
+        """Test the `estimate_many` method."""
+        probabilities = await estimator.estimate_many(["a", "ab", "abc"], "abcd")
+
+        assert probabilities == [0.25, 0.5, 0.75]
+
+    @pytest.mark.parametrize("workers", [1, -1])
+    async def test__estimate_matrix(self, workers: int) -> None:
+        """Test the `estimate_matrix` method."""
+        estimator = EstimatorAdapter(_precision=3, _workers=workers)
+        sources = ["", "a", "ab", "abc"]
+        targets = ["a", "abc", "def"]
+
+        matrix = await estimator.estimate_matrix(sources, targets)
+
+        assert matrix.shape == (len(sources), len(targets))
+
+        for index1, source in enumerate(sources):
+            for index2, target in enumerate(targets):
+                assert matrix[index1, index2] == await estimator.estimate(source, target)
+
+    async def test__estimate_matrix__empty(self, estimator: EstimatorInterface) -> None:
+        """Test the `estimate_matrix` method. Case: no sources."""
+        matrix = await estimator.estimate_matrix([], ["a"])
+
+        assert matrix.shape == (0, 1)
@@ -0,0 +1,141 @@
+import sys
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from weasel.domain.services.interfaces.executor import ExecutorInterface
+from weasel.domain.types.language import LanguageType
+from weasel.infrastructure.adapters.estimator import EstimatorAdapter
+from weasel.infrastructure.adapters.executor import ExecutorAdapter, ExecutorWorker
+from weasel.infrastructure.adapters.mutation_tree import MutationTreeAdapter
+from weasel.infrastructure.languages.python import PythonLanguage
+from weasel.infrastructure.mutations.python.py001 import PythonMutation
+
+
+SOURCE = """
+def hello_world():  # Print the greeting.
+    print('Hello, ' 'World!')
+"""
+
+TARGET = """def hello_world():
+    print('Hello, World!')"""
+
+TEXT = """
+Hello, World!
+"""
+
+DIGEST = "digest"
+
+
+def build_executor(max_workers: int) -> ExecutorInterface:
+    """Build the executor."""
+    estimator = EstimatorAdapter(_precision=3, _workers=1)
+    return ExecutorAdapter(
+        _estimator=estimator,
+        _forms_size_limit=1024 * 1024,
+        _languages=[PythonLanguage()],
+        _max_workers=max_workers,
+        _mutation_trees={LanguageType.PYTHON: build_mutation_tree(estimator)},
+    )
+
+
+def build_mutation_tree(estimator: EstimatorAdapter) -> MutationTreeAdapter:
+    """Build the mutation tree."""
+    return MutationTreeAdapter(
+        _degree_of_freedom=3,
+        _depth=3,
+        _estimator=estimator,
+        _mutations=[PythonMutation()],
+        _table_size=16,
+        _tolerance=0.075,
+    )
+
+
+@pytest.fixture(params=[0, 1], ids=["inline", "process"])
+async def executor(request: pytest.FixtureRequest) -> AsyncIterator[ExecutorInterface]:
+    """Fixture the executor (the worker processes are shut down afterwards)."""
+    executor = build_executor(request.param)
+    yield executor
+    await executor.close()
+
+
+class TestExecutorAdapter:
+    """Test the executor."""
+
+    async def test__recognizes(self, executor: ExecutorInterface) -> None:
+        """Test the `recognizes` method."""
+        assert await executor.recognizes(LanguageType.PYTHON, SOURCE)
+
+    async def test__recognizes__false(self, executor: ExecutorInterface) -> None:
+        """Test the `recognizes` method. Case: not *Python*."""
+        assert not await executor.recognizes(LanguageType.PYTHON, TEXT)
+
+    async def test__match(self, executor: ExecutorInterface) -> None:
+        """Test the `match` method."""
+        for _ in range(2):
+            probability, labels = await executor.match(LanguageType.PYTHON, SOURCE, TARGET, DIGEST)
+
+            assert probability == 1.0
+            assert labels == ["PY001"]
+
+    async def test__close(self) -> None:
+        """Test the `close` method. Case: the pool is spawned again on demand."""
+        executor = ExecutorAdapter(
+            _estimator=EstimatorAdapter(_precision=3, _workers=1),
+            _forms_size_limit=1024 * 1024,
+            _languages=[PythonLanguage()],
+            _max_workers=1,
+            _mutation_trees={},
+        )
+
+        assert await executor.recognizes(LanguageType.PYTHON, SOURCE)
+        pool = executor._get_pool()
+
+        await executor.close()
+        await executor.close()
+
+        with pytest.raises(RuntimeError):
+            pool.submit(print)
+
+        assert await executor.recognizes(LanguageType.PYTHON, SOURCE)
+        await executor.close()
+
+
+class TestExecutorWorker:
+    """Test the executor worker."""
+
+    @pytest.mark.parametrize(("size_limit", "expected"), [(1024 * 1024, 2), (1, 0)])
+    async def test__canonicalize(self, size_limit: int, expected: int) -> None:
+        """Test the `canonicalize` method. Case: the forms are cached within the size limit."""
+        estimator = EstimatorAdapter(_precision=3, _workers=1)
+        worker = ExecutorWorker(
+            _estimator=estimator,
+            _forms_size_limit=size_limit,
+            _languages=[PythonLanguage()],
+            _mutation_trees={LanguageType.PYTHON: build_mutation_tree(estimator)},
+        )
+
+        for digest in ("first", "second", "first"):
+            forms = await worker.canonicalize(LanguageType.PYTHON, SOURCE, digest)
+            assert forms == {"PY001": TARGET}
+
+        assert len(worker._forms) == expected
+
+    async def test__canonicalize__evicted(self) -> None:
+        """Test the `canonicalize` method. Case: the least recently used forms are evicted."""
+        estimator = EstimatorAdapter(_precision=3, _workers=1)
+        worker = ExecutorWorker(
+            _estimator=estimator,
+            _forms_size_limit=2 * sys.getsizeof(TARGET),
+            _languages=[PythonLanguage()],
+            _mutation_trees={LanguageType.PYTHON: build_mutation_tree(estimator)},
+        )
+
+        for digest in ("first", "second", "first", "third"):
+            await worker.canonicalize(LanguageType.PYTHON, SOURCE, digest)
+
+        assert list(worker._forms) == [
+            (LanguageType.PYTHON, "first"),
+            (LanguageType.PYTHON, "third"),
+        ]
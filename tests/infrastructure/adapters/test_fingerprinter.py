@@ -0,0 +1,46 @@
+import pytest
+
+from weasel.domain.services.interfaces.fingerprinter import FingerprinterInterface
+from weasel.infrastructure.adapters.fingerprinter import FingerprinterAdapter
+
+
+SOURCE = """
+def total(items):
+    result = 0
+    for item in items:
+        result += item * 2
+    return result
+"""
+
+
+@pytest.fixture
+def fingerprinter() -> FingerprinterInterface:
+    """Fixture the fingerprinter."""
+    return FingerprinterAdapter(_kgram_size=3, _window_size=2)
+
+
+class TestFingerprinterAdapter:
+    """Test the fingerprinter."""
+
+    async def test__fingerprint(self, fingerprinter: FingerprinterInterface) -> None:
+        """Test the `fingerprint` method. Case: formatting and numbers are ignored."""
+        reformatted = SOURCE.replace("    ", "\t").replace("2", "3").upper()
+
+        assert await fingerprinter.fingerprint(SOURCE)
+        assert await fingerprinter.fingerprint(SOURCE) == await fingerprinter.fingerprint(
+            reformatted
+        )
+
+    async def test__fingerprint__unrelated(self, fingerprinter: FingerprinterInterface) -> None:
+        """Test the `fingerprint` method. Case: unrelated texts."""
+        fingerprints = await fingerprinter.fingerprint(SOURCE)
+        unrelated = await fingerprinter.fingerprint("SELECT name FROM users WHERE id = 1;")
+
+        assert not fingerprints & unrelated
+
+    @pytest.mark.parametrize("text", ["", "x", "x = 1"])
+    async def test__fingerprint__short(
+        self, fingerprinter: FingerprinterInterface, text: str
+    ) -> None:
+        """Test the `fingerprint` method. Case: fewer tokens than a window."""
+        assert len(await fingerprinter.fingerprint(text)) <= 1
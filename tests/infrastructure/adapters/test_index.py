@@ -0,0 +1,37 @@
+import pytest
+
+from weasel.domain.services.interfaces.index import IndexInterface
+from weasel.infrastructure.adapters.index import MinHashIndexAdapter
+
+
+@pytest.fixture
+def index() -> IndexInterface:
+    """Fixture the index."""
+    return MinHashIndexAdapter(_bands=32, _rows=2, _threshold=0.1)
+
+
+class TestMinHashIndexAdapter:
+    """Test the index."""
+
+    async def test__find_candidates(self, index: IndexInterface) -> None:
+        """Test the `find_candidates` method."""
+        fingerprints = {
+            "a": frozenset(range(100)),
+            "b": frozenset(range(10, 110)),
+            "c": frozenset(range(1000, 1100)),
+        }
+
+        assert await index.find_candidates(fingerprints) == {("a", "b")}
+
+    async def test__find_candidates__threshold(self) -> None:
+        """Test the `find_candidates` method. Case: the candidates are verified."""
+        index = MinHashIndexAdapter(_bands=32, _rows=2, _threshold=0.95)
+        fingerprints = {"a": frozenset(range(100)), "b": frozenset(range(50, 150))}
+
+        assert not await index.find_candidates(fingerprints)
+
+    async def test__find_candidates__empty(self, index: IndexInterface) -> None:
+        """Test the `find_candidates` method. Case: keys without fingerprints."""
+        fingerprints = {"a": frozenset[int](), "b": frozenset[int](), "c": frozenset({1})}
+
+        assert not await index.find_candidates(fingerprints)
@@ -0,0 +1,71 @@
+import statistics
+
+import pytest
+
+from weasel.domain.services.interfaces.metrics import MetricsInterface
+from weasel.infrastructure.adapters.metrics import MetricsAdapter
+
+
+PRECISION = 3
+
+
+@pytest.fixture
+def metrics() -> MetricsInterface:
+    """Fixture the metrics."""
+    return MetricsAdapter(_precision=PRECISION)
+
+
+class TestMetricsAdapter:
+    """Test the metrics adapter."""
+
+    def test__calculate__empty(self, metrics: MetricsInterface) -> None:
+        """Test the `calculate` method. Case: no probabilities."""
+        entity = metrics.calculate([])
+
+        assert entity.count == 0
+        assert not any(value for key, value in entity.model_dump().items() if key != "count")
+
+    @pytest.mark.parametrize(
+        "probabilities",
+        [
+            [0.3],
+            [0.12, 0.5],
+            [0.771, 0.469, 0.12],
+            [0.5, 0.9, 0.1, 0.9, 0.0, 1.0, 0.25],
+            [index / 97 for index in range(97)],
+        ],
+    )
+    def test__calculate(self, metrics: MetricsInterface, probabilities: list[float]) -> None:
+        """Test the `calculate` method. Case: consistent with `statistics`."""
+        entity = metrics.calculate(probabilities)
+
+        for key, n in [("p75", 4), ("p90", 10), ("p95", 20), ("p99", 100)]:
+            expected = statistics.quantiles(probabilities, n=n)[n - 2]
+            assert getattr(entity, key) == round(expected, PRECISION)
+
+        assert entity.median == round(statistics.median(probabilities), PRECISION)
+        assert entity.mean == pytest.approx(statistics.mean(probabilities), abs=10**-PRECISION)
+        assert entity.min == round(min(probabilities), PRECISION)
+        assert entity.max == round(max(probabilities), PRECISION)
+        assert entity.count == len(probabilities)
+
+        if len(probabilities) > 1:
+            var = statistics.variance(probabilities)
+            assert entity.var == pytest.approx(var, abs=10**-PRECISION)
+
+    @pytest.mark.parametrize(
+        ("probabilities", "expected"),
+        [
+            ([0.1, 0.3], 0.3),
+            ([0.9, 0.1], 0.9),
+            ([0.9, 0.8], 0.973),
+            ([1.0, 0.6], 1.0),
+            ([0.5] * 10_000, 0.5),
+            ([0.6] * 10_000 + [0.4] * 10_000, 1.0),
+        ],
+    )
+    def test__calculate__nolie(
+        self, metrics: MetricsInterface, probabilities: list[float], expected: float
+    ) -> None:
+        """Test the `calculate` method. Case: *NO-LIE* does not underflow."""
+        assert metrics.calculate(probabilities).nolie == expected
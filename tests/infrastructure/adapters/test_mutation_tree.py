@@ -0,0 +1,133 @@
+import ast
+
+from collections import Counter
+
+import pytest
+
+from weasel.infrastructure.adapters.estimator import EstimatorAdapter
+from weasel.infrastructure.adapters.mutation_tree import MutationTreeAdapter
+
+
+SOURCE = "x-a-y-b-z"
+TARGET = "x-y-z"
+
+PY_SOURCE = "x\na\ny\nb\nz"
+PY_TARGET = "x\ny\nz"
+
+
+class RemovingMutation:
+    """The mutation that removes a substring."""
+
+    def __init__(self, label: str, substring: str, calls: Counter[tuple[str, str]]) -> None:
+        """Initialize the object."""
+        self._label = label
+        self._substring = substring
+        self._calls = calls
+
+    async def mutate(self, source: str, _target: str) -> str:
+        """Mutate `source` using `target` as the reference."""
+        self._calls[self._label, source] += 1
+        return source.replace(self._substring, "")
+
+    def as_label(self) -> str:
+        """Return the mutation label."""
+        return self._label
+
+    def is_target_independent(self) -> bool:
+        """Check whether the mutation ignores `target`."""
+        return True
+
+
+class RemovingASTMutation(RemovingMutation):
+    """The mutation that removes a top-level name."""
+
+    async def mutate_ast(self, source: ast.Module, _target: ast.Module) -> ast.Module | None:
+        """Mutate `source` using `target` as the reference."""
+        self._calls[self._label, ast.unparse(source)] += 1
+        body = [node for node in source.body if ast.unparse(node) != self._substring]
+
+        if len(body) == len(source.body):
+            return None
+
+        source.body = body
+        return source
+
+
+@pytest.fixture
+def calls() -> Counter[tuple[str, str]]:
+    """Fixture the mutation calls."""
+    return Counter()
+
+
+@pytest.fixture
+def mutation_tree(calls: Counter[tuple[str, str]]) -> MutationTreeAdapter:
+    """Fixture the mutation tree."""
+    return MutationTreeAdapter(
+        _degree_of_freedom=3,
+        _depth=3,
+        _estimator=EstimatorAdapter(_precision=3, _workers=1),
+        _mutations=[RemovingMutation("A", "a-", calls), RemovingMutation("B", "b-", calls)],
+        _table_size=64,
+        _tolerance=0.0,
+    )
+
+
+class TestMutationTreeAdapter:
+    """Test the mutation tree."""
+
+    async def test__get_mutations(self, mutation_tree: MutationTreeAdapter) -> None:
+        """Test the `get_mutations` method."""
+        mutations = await mutation_tree.get_mutations(SOURCE, TARGET)
+
+        assert {mutation.as_label() for mutation in mutations} == {"A", "B"}
+
+    async def test__get_mutations__once(
+        self, mutation_tree: MutationTreeAdapter, calls: Counter[tuple[str, str]]
+    ) -> None:
+        """Test the `get_mutations` method. Case: no mutation runs twice on the same input."""
+        mutations = await mutation_tree.get_mutations(SOURCE, TARGET)
+        mutated = await mutation_tree.apply(SOURCE, TARGET, mutations)
+
+        assert mutated == TARGET
+        assert max(calls.values()) == 1
+
+    async def test__get_mutations__forms(
+        self, mutation_tree: MutationTreeAdapter, calls: Counter[tuple[str, str]]
+    ) -> None:
+        """Test the `get_mutations` method. Case: the forms are precomputed."""
+        forms = await mutation_tree.canonicalize(SOURCE)
+        calls.clear()
+
+        await mutation_tree.get_mutations(SOURCE, TARGET, forms)
+
+        assert ("A", SOURCE) not in calls
+        assert ("B", SOURCE) not in calls
+
+    async def test__get_mutations__ast(
+        self, calls: Counter[tuple[str, str]], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the `get_mutations` method. Case: the parsed trees are shared."""
+        parse = ast.parse
+        parses: list[str] = []
+
+        def counting_parse(source: str) -> ast.Module:
+            parses.append(source)
+            return parse(source)
+
+        mutation_tree = MutationTreeAdapter(
+            _degree_of_freedom=3,
+            _depth=3,
+            _estimator=EstimatorAdapter(_precision=3, _workers=1),
+            _mutations=[RemovingASTMutation("A", "a", calls), RemovingASTMutation("B", "b", calls)],
+            _table_size=64,
+            _tolerance=0.0,
+        )
+
+        monkeypatch.setattr(ast, "parse", counting_parse)
+        mutations = await mutation_tree.get_mutations(PY_SOURCE, PY_TARGET)
+        monkeypatch.undo()
+
+        mutated = await mutation_tree.apply(PY_SOURCE, PY_TARGET, mutations)
+
+        assert mutated == PY_TARGET
+        assert len(parses) < calls.total()
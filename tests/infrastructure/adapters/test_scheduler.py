@@ -0,0 +1,108 @@
+import asyncio
+
+from collections.abc import Coroutine, Iterator
+from typing import Any
+
+import pytest
+
+from weasel.domain.services.interfaces.scheduler import SchedulerInterface
+from weasel.infrastructure.adapters.scheduler import SchedulerAdapter
+
+
+GLOBAL_LIMIT = 4
+TASK_LIMIT = 2
+
+MESSAGE = "The match failed"
+
+
+@pytest.fixture
+def scheduler() -> SchedulerInterface:
+    """Fixture the scheduler."""
+    return SchedulerAdapter(_global_limit=GLOBAL_LIMIT, _task_limit=TASK_LIMIT)
+
+
+class Probe:
+    """The concurrency probe."""
+
+    def __init__(self) -> None:
+        """Initialize the object."""
+        self.running = 0
+        self.peak = 0
+
+    async def run(self, value: int) -> int:
+        """Run the probe."""
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.001)
+        self.running -= 1
+        return value
+
+    def spawn(self, values: range) -> Iterator[Coroutine[Any, Any, int]]:
+        """Spawn the coroutines lazily."""
+        for value in values:
+            yield self.run(value)
+
+
+class TestSchedulerAdapter:
+    """Test the scheduler."""
+
+    async def test__gather_comparisons(self, scheduler: SchedulerInterface) -> None:
+        """Test the `gather_comparisons` method."""
+        probe = Probe()
+
+        values = await scheduler.gather_comparisons(probe.spawn(range(32)))
+
+        assert values == list(range(32))
+        assert probe.peak == TASK_LIMIT
+
+    async def test__gather_matches(self, scheduler: SchedulerInterface) -> None:
+        """Test the `gather_matches` method."""
+        probe = Probe()
+
+        values = await scheduler.gather_matches(probe.spawn(range(32)))
+
+        assert values == list(range(32))
+        assert probe.peak == GLOBAL_LIMIT
+
+    async def test__gather_matches__global(self, scheduler: SchedulerInterface) -> None:
+        """Test the `gather_matches` method. Case: the limit is shared."""
+        probe = Probe()
+
+        await asyncio.gather(
+            scheduler.gather_matches(probe.spawn(range(16))),
+            scheduler.gather_matches(probe.spawn(range(16))),
+        )
+
+        assert probe.peak == GLOBAL_LIMIT
+
+    async def test__gather_matches__empty(self, scheduler: SchedulerInterface) -> None:
+        """Test the `gather_matches` method. Case: nothing to run."""
+        probe = Probe()
+
+        values = await scheduler.gather_matches(probe.spawn(range(0)))
+
+        assert not values
+
+    async def test__gather_comparisons__error(self, scheduler: SchedulerInterface) -> None:
+        """Test the `gather_comparisons` method. Case: the error is not wrapped into a group."""
+
+        async def fail() -> int:
+            """Fail the match."""
+            raise ValueError(MESSAGE)
+
+        async def compare() -> list[int]:
+            """Run the failing matches."""
+            return await scheduler.gather_matches(fail() for _ in range(4))
+
+        with pytest.raises(ValueError, match=MESSAGE):
+            await scheduler.gather_comparisons(compare() for _ in range(4))
+
+    def test__gather_matches__loops(self, scheduler: SchedulerInterface) -> None:
+        """Test the `gather_matches` method. Case: the event loops run in sequence."""
+        for _ in range(2):
+            probe = Probe()
+
+            values = asyncio.run(scheduler.gather_matches(probe.spawn(range(32))))
+
+            assert values == list(range(32))
+            assert probe.peak == GLOBAL_LIMIT
@@ -0,0 +1,81 @@
+import asyncio
+
+from pathlib import Path
+
+import pytest
+
+from weasel.domain.services.interfaces.text_store import TextStoreInterface
+from weasel.infrastructure.adapters.text_store import TextStoreAdapter
+
+
+TEXT = "print('Hello, World!')\n"
+
+
+@pytest.fixture
+def text_store() -> TextStoreInterface:
+    """Fixture the text store."""
+    return TextStoreAdapter(_size_limit=1024 * 1024)
+
+
+class TestTextStoreAdapter:
+    """Test the text store."""
+
+    async def test__read(self, text_store: TextStoreInterface, tmp_path: Path) -> None:
+        """Test the `read` method."""
+        path = tmp_path / "main.py"
+        path.write_text(TEXT)
+
+        entity = await text_store.read(path)
+
+        assert entity.text == TEXT
+
+    async def test__read__cached(self, text_store: TextStoreInterface, tmp_path: Path) -> None:
+        """Test the `read` method. Case: the file is read once."""
+        path = tmp_path / "main.py"
+        path.write_text(TEXT)
+
+        before = await text_store.read(path)
+        path.unlink()
+        after = await text_store.read(path)
+
+        assert before == after
+
+    async def test__read__concurrent(self, text_store: TextStoreInterface, tmp_path: Path) -> None:
+        """Test the `read` method. Case: concurrent reads."""
+        path = tmp_path / "main.py"
+        path.write_text(TEXT)
+
+        entities = await asyncio.gather(*(text_store.read(path) for _ in range(8)))
+
+        assert all(entity == entities[0] for entity in entities)
+
+    async def test__read__digest(self, text_store: TextStoreInterface, tmp_path: Path) -> None:
+        """Test the `read` method. Case: equal files share the digest."""
+        path1 = tmp_path / "main1.py"
+        path1.write_text(TEXT)
+
+        path2 = tmp_path / "main2.py"
+        path2.write_text(TEXT)
+
+        entity1 = await text_store.read(path1)
+        entity2 = await text_store.read(path2)
+
+        assert entity1.digest == entity2.digest
+
+    async def test__read__eviction(self, tmp_path: Path) -> None:
+        """Test the `read` method. Case: the size limit is exceeded."""
+        text_store = TextStoreAdapter(_size_limit=128)
+
+        path1 = tmp_path / "main1.py"
+        path1.write_text("a" * 64)
+
+        path2 = tmp_path / "main2.py"
+        path2.write_text("b" * 64)
+
+        await text_store.read(path1)
+        await text_store.read(path2)
+        path1.write_text("c" * 64)
+
+        entity = await text_store.read(path1)
+
+        assert entity.text == "c" * 64
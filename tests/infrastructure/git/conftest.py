@@ -0,0 +1,62 @@
+import asyncio
+
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from weasel.infrastructure.git.bitbucket import BitbucketAdapter
+from weasel.infrastructure.git.github import GitHubAdapter
+
+
+if TYPE_CHECKING:
+    from tests.conftest import MemoryCache
+    from weasel.domain.services.interfaces.git import GitInterface
+    from weasel.infrastructure.adapters.api.bitbucket import BitbucketAPIAdapter
+    from weasel.infrastructure.adapters.api.github import GitHubAPIAdapter
+
+
+class CountingAPI:
+    """The API that counts downloads and resolutions."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the object."""
+        self.path = path
+        self.shas: dict[str, str] = {}
+        self.downloads = 0
+        self.resolves = 0
+
+    async def download(self, user: str, repo: str, ref: str) -> Path:
+        """Clone the repository."""
+        self.downloads += 1
+        await asyncio.sleep(0.01)
+
+        path = self.path / user / repo / ref
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    async def resolve(self, user: str, repo: str, ref: str) -> str:
+        """Resolve the reference to a commit *SHA*."""
+        self.resolves += 1
+        await asyncio.sleep(0.01)
+
+        if ref not in self.shas:
+            detail = f"'{user}/{repo}@{ref}' does not exist"
+            raise FileNotFoundError(detail)
+        return self.shas[ref]
+
+
+@pytest.fixture
+def api(tmp_path: Path) -> CountingAPI:
+    """Fixture the API."""
+    return CountingAPI(tmp_path)
+
+
+@pytest.fixture(params=["bitbucket", "github"])
+def adapter(
+    request: pytest.FixtureRequest, api: CountingAPI, memory_cache: "MemoryCache"
+) -> "GitInterface":
+    """Fixture the adapter (per hosting)."""
+    if request.param == "bitbucket":
+        return BitbucketAdapter(_bitbucket=cast("BitbucketAPIAdapter", api), _cache=memory_cache)
+    return GitHubAdapter(_cache=memory_cache, _github=cast("GitHubAPIAdapter", api))
@@ -0,0 +1,59 @@
+import asyncio
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+
+if TYPE_CHECKING:
+    from tests.infrastructure.git.conftest import CountingAPI
+    from weasel.domain.services.interfaces.git import GitInterface
+
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+
+
+class TestGitAdapter:
+    """Test the *Bitbucket* and *GitHub* adapters."""
+
+    async def test__clone(self, adapter: "GitInterface", api: "CountingAPI") -> None:
+        """Test the `clone` method. Case: concurrent clones share a download."""
+        coroutines = [adapter.clone("user", "repo", branch="main") for _ in range(5)]
+        paths = await asyncio.gather(*coroutines, adapter.clone("user", "repo", branch="dev"))
+
+        assert len(set(paths)) == 2
+        assert api.downloads == 2
+
+    async def test__clone__resolves(
+        self, adapter: "GitInterface", api: "CountingAPI", tmp_path: Path
+    ) -> None:
+        """Test the `clone` method. Case: concurrent clones share a resolution."""
+        api.shas.update(main=SHA)
+
+        coroutines = [adapter.clone("user", "repo", branch="main") for _ in range(5)]
+        paths = await asyncio.gather(*coroutines)
+
+        assert set(paths) == {tmp_path / "user" / "repo" / SHA}
+        assert api.resolves == 1
+        assert api.downloads == 1
+
+    @pytest.mark.parametrize("branch", [None, "main"])
+    async def test__clone__resolved(
+        self, adapter: "GitInterface", api: "CountingAPI", tmp_path: Path, branch: str | None
+    ) -> None:
+        """Test the `clone` method. Case: references are resolved to be cached."""
+        api.shas.update(HEAD=SHA, main=SHA)
+
+        first = await adapter.clone("user", "repo", branch=branch)
+        second = await adapter.clone("user", "repo", branch=branch)
+
+        assert first == second == tmp_path / "user" / "repo" / SHA
+        assert api.downloads == 1
+
+    async def test__clone__unresolved(self, adapter: "GitInterface", api: "CountingAPI") -> None:
+        """Test the `clone` method. Case: `HEAD` is not cached if unresolved."""
+        await adapter.clone("user", "repo", branch=None)
+        await adapter.clone("user", "repo", branch=None)
+
+        assert api.downloads == 2
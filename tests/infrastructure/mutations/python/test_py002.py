@@ -1,3 +1,5 @@
+import ast
+
 import pytest
 
 from weasel.domain.services.interfaces.mutation import MutationInterface
@@ -51,3 +53,16 @@ class TestPythonMutation:
         after = await mutation.mutate(BEFORE, NO_TARGET)
 
         assert after.strip() == AFTER.strip()
+
+    async def test__mutate_ast(self) -> None:
+        """Test the `mutate_ast` method."""
+        tree = await PythonMutation.mutate_ast(ast.parse(BEFORE), ast.parse(NO_TARGET))
+
+        assert tree is not None
+        assert ast.unparse(tree) == AFTER.strip()
+
+    async def test__mutate_ast__intact(self) -> None:
+        """Test the `mutate_ast` method. Case: nothing to mutate."""
+        tree = await PythonMutation.mutate_ast(ast.parse("x = 1"), ast.parse(NO_TARGET))
+
+        assert tree is None
@@ -1,6 +1,9 @@
+import ast
+
 import pytest
 
 from weasel.domain.services.interfaces.mutation import MutationInterface
+from weasel.infrastructure.adapters.assignment import AssignmentAdapter
 from weasel.infrastructure.adapters.estimator import EstimatorAdapter
 from weasel.infrastructure.mutations.python.py006 import PythonMutation
 
@@ -89,8 +92,8 @@ class A:
 @pytest.fixture
 def mutation() -> MutationInterface:
     """Fixture the mutation."""
-    estimator = EstimatorAdapter(_precision=3)
-    return PythonMutation(_estimator=estimator)
+    estimator = EstimatorAdapter(_precision=3, _workers=1)
+    return PythonMutation(_assignment=AssignmentAdapter(), _estimator=estimator)
 
 
 class TestPythonMutation:
@@ -105,3 +108,13 @@ class TestPythonMutation:
         after = await mutation.mutate(BEFORE, TARGET)
 
         assert after.strip() == AFTER.strip()
+
+    async def test__mutate_ast(self) -> None:
+        """Test the `mutate_ast` method."""
+        mutation = PythonMutation(
+            _assignment=AssignmentAdapter(), _estimator=EstimatorAdapter(_precision=3, _workers=1)
+        )
+        tree = await mutation.mutate_ast(ast.parse(BEFORE), ast.parse(TARGET))
+
+        assert tree is not None
+        assert ast.unparse(tree) == AFTER.strip()
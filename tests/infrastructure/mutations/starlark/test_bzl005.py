@@ -1,6 +1,7 @@
 import pytest
 
 from weasel.domain.services.interfaces.mutation import MutationInterface
+from weasel.infrastructure.adapters.assignment import AssignmentAdapter
 from weasel.infrastructure.adapters.estimator import EstimatorAdapter
 from weasel.infrastructure.mutations.starlark.bzl005 import StarlarkMutation
 
@@ -47,8 +48,8 @@ def a():
 @pytest.fixture
 def mutation() -> MutationInterface:
     """Fixture the mutation."""
-    estimator = EstimatorAdapter(_precision=3)
-    return StarlarkMutation(_estimator=estimator)
+    estimator = EstimatorAdapter(_precision=3, _workers=1)
+    return StarlarkMutation(_assignment=AssignmentAdapter(), _estimator=estimator)
 
 
 class TestStarlarkMutation:
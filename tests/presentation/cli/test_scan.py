@@ -0,0 +1,54 @@
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from weasel.domain.entities.comparison import ComparisonEntity
+from weasel.domain.entities.metrics import MetricsEntity
+from weasel.domain.entities.report import ReportEntity
+from weasel.domain.entities.review import ReviewEntity
+from weasel.presentation.cli.scan import load_baseline, stream_jsonl
+
+
+METRICS = MetricsEntity.model_validate(dict.fromkeys(MetricsEntity.model_fields, 0))
+REPORT = ReportEntity(
+    reviews=[
+        ReviewEntity(
+            name=name,
+            comparisons=[
+                ComparisonEntity(source=s, target=t, metrics=METRICS, matches=[])
+                for s, t in (("A", "B"), ("B", "A"))
+            ],
+            digests={"A": f"{name}-a", "B": f"{name}-b"},
+            top_k_matches=5,
+        )
+        for name in ("task1", "task2")
+    ]
+)
+
+
+async def scan(sink: Callable[[str, ComparisonEntity], Awaitable[None]]) -> ReportEntity:
+    """Scan the contest (the comparisons of the tasks are interleaved)."""
+    for comparisons in zip(*(review.comparisons for review in REPORT.reviews), strict=True):
+        for review, comparison in zip(REPORT.reviews, comparisons, strict=True):
+            await sink(review.name, comparison)
+
+    reviews = [review.model_copy(update={"comparisons": []}) for review in REPORT.reviews]
+    return ReportEntity(reviews=reviews)
+
+
+async def test__stream_jsonl(tmp_path: Path) -> None:
+    """Test the `stream_jsonl` function. Case: the stream is a baseline."""
+    path = tmp_path / "report.jsonl"
+    await stream_jsonl(scan, path)
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 6
+
+    assert load_baseline(path) == REPORT
+
+
+def test__load_baseline(tmp_path: Path) -> None:
+    """Test the `load_baseline` function. Case: *JSON*."""
+    path = tmp_path / "report.json"
+    REPORT.to_json(path)
+
+    assert load_baseline(path) == REPORT
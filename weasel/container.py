@@ -2,19 +2,27 @@ from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Dict, Factory, List, Provider, Singleton
+from dependency_injector.providers import Callable, Dict, Factory, List, Provider, Singleton
 
 from weasel.domain.services.matcher import MatcherService
 from weasel.domain.services.scanner import ScannerService
 from weasel.domain.types.language import LanguageType
 from weasel.infrastructure.adapters.api.bitbucket import BitbucketAPIAdapter
 from weasel.infrastructure.adapters.api.github import GitHubAPIAdapter
+from weasel.infrastructure.adapters.api.limiter import LimiterAdapter
+from weasel.infrastructure.adapters.api.session import SessionAdapter
+from weasel.infrastructure.adapters.assignment import AssignmentAdapter
 from weasel.infrastructure.adapters.cache import CacheAdapter
 from weasel.infrastructure.adapters.cashews.cache import CacheCashewsAdapter
 from weasel.infrastructure.adapters.estimator import EstimatorAdapter
+from weasel.infrastructure.adapters.executor import ExecutorAdapter
+from weasel.infrastructure.adapters.fingerprinter import FingerprinterAdapter
+from weasel.infrastructure.adapters.index import MinHashIndexAdapter
 from weasel.infrastructure.adapters.metrics import MetricsAdapter
 from weasel.infrastructure.adapters.mutation_tree import MutationTreeAdapter
+from weasel.infrastructure.adapters.scheduler import SchedulerAdapter
 from weasel.infrastructure.adapters.sealer import SealerAdapter
+from weasel.infrastructure.adapters.text_store import TextStoreAdapter
 from weasel.infrastructure.git.bitbucket import BitbucketAdapter
 from weasel.infrastructure.git.github import GitHubAdapter
 from weasel.infrastructure.languages.java import JavaLanguage
@@ -41,20 +49,32 @@ from weasel.infrastructure.mutations.sql import (
 )
 from weasel.infrastructure.mutations.starlark import bzl001, bzl002, bzl003, bzl004, bzl005
 from weasel.settings.cache import CacheSettings
+from weasel.settings.estimator import EstimatorSettings
+from weasel.settings.executor import ExecutorSettings
 from weasel.settings.external_api import ExternalAPISettings
+from weasel.settings.fingerprint import FingerprintSettings
+from weasel.settings.index import IndexSettings
 from weasel.settings.mutation_tree import MutationTreeSettings
 from weasel.settings.retries import RetriesSettings
+from weasel.settings.scheduler import SchedulerSettings
 from weasel.settings.service import ServiceSettings
+from weasel.settings.text_store import TextStoreSettings
 
 
 if TYPE_CHECKING:
+    from weasel.domain.services.interfaces.assignment import AssignmentInterface
     from weasel.domain.services.interfaces.estimator import EstimatorInterface
+    from weasel.domain.services.interfaces.executor import ExecutorInterface
+    from weasel.domain.services.interfaces.fingerprinter import FingerprinterInterface
     from weasel.domain.services.interfaces.git import GitInterface
+    from weasel.domain.services.interfaces.index import IndexInterface
     from weasel.domain.services.interfaces.language import LanguageInterface
     from weasel.domain.services.interfaces.metrics import MetricsInterface
     from weasel.domain.services.interfaces.mutation import MutationInterface
     from weasel.domain.services.interfaces.mutation_tree import MutationTreeInterface
+    from weasel.domain.services.interfaces.scheduler import SchedulerInterface
     from weasel.domain.services.interfaces.sealer import SealerInterface
+    from weasel.domain.services.interfaces.text_store import TextStoreInterface
 
 
 class WeaselContainer(DeclarativeContainer):
@@ -65,9 +85,15 @@ class WeaselContainer(DeclarativeContainer):
     cache_settings: Provider["CacheSettings"] = Singleton(
         CacheSettings, directory=service_settings.provided.cache_directory
     )
+    estimator_settings: Provider["EstimatorSettings"] = Singleton(EstimatorSettings)
+    executor_settings: Provider["ExecutorSettings"] = Singleton(ExecutorSettings)
     external_api_settings: Provider["ExternalAPISettings"] = Singleton(ExternalAPISettings)
+    fingerprint_settings: Provider["FingerprintSettings"] = Singleton(FingerprintSettings)
+    index_settings: Provider["IndexSettings"] = Singleton(IndexSettings)
     mutation_tree_settings: Provider["MutationTreeSettings"] = Singleton(MutationTreeSettings)
     retries_settings: Provider["RetriesSettings"] = Singleton(RetriesSettings)
+    scheduler_settings: Provider["SchedulerSettings"] = Singleton(SchedulerSettings)
+    text_store_settings: Provider["TextStoreSettings"] = Singleton(TextStoreSettings)
 
     id_factory: Provider[UUID] = Factory(uuid4)
 
@@ -90,15 +116,55 @@ class WeaselContainer(DeclarativeContainer):
     cache_adapter: Provider["CacheAdapter"] = Singleton(
         CacheAdapter, _cashews=cache_cashews_adapter.provided
     )
+    fingerprinter_adapter: Provider["FingerprinterInterface"] = Singleton(
+        FingerprinterAdapter,
+        _kgram_size=fingerprint_settings.provided.kgram_size,
+        _window_size=fingerprint_settings.provided.window_size,
+    )
+    index_adapter: Provider["IndexInterface"] = Singleton(
+        MinHashIndexAdapter,
+        _bands=index_settings.provided.bands,
+        _rows=index_settings.provided.rows,
+        _threshold=index_settings.provided.threshold,
+    )
     metrics_adapter: Provider["MetricsInterface"] = Singleton(
         MetricsAdapter, _precision=service_settings.provided.precision
     )
+    scheduler_adapter: Provider["SchedulerInterface"] = Singleton(
+        SchedulerAdapter,
+        _global_limit=scheduler_settings.provided.global_limit,
+        _task_limit=scheduler_settings.provided.task_limit,
+    )
     sealer_adapter: Provider["SealerInterface"] = Singleton(
         SealerAdapter,
         _data_dir=service_settings.provided.data_directory,
         _id_factory=id_factory.provider,
         _languages=languages.provided,
     )
+    text_store_adapter: Provider["TextStoreInterface"] = Singleton(
+        TextStoreAdapter, _size_limit=text_store_settings.provided.size_limit
+    )
+
+    session_adapter: Provider["SessionAdapter"] = Singleton(
+        SessionAdapter,
+        _dns_cache_ttl=external_api_settings.provided.dns_cache_ttl,
+        _keepalive_timeout=external_api_settings.provided.keepalive_timeout,
+        _limit=external_api_settings.provided.connection_limit,
+        _limit_per_host=external_api_settings.provided.connection_limit_per_host,
+    )
+
+    bitbucket_limiter_adapter: Provider["LimiterAdapter"] = Singleton(
+        LimiterAdapter,
+        _burst=external_api_settings.provided.bitbucket_burst,
+        _max_in_flight=external_api_settings.provided.bitbucket_max_in_flight,
+        _rate=external_api_settings.provided.bitbucket_rate,
+    )
+    github_limiter_adapter: Provider["LimiterAdapter"] = Singleton(
+        LimiterAdapter,
+        _burst=external_api_settings.provided.github_burst,
+        _max_in_flight=external_api_settings.provided.github_max_in_flight,
+        _rate=external_api_settings.provided.github_rate,
+    )
 
     bitbucket_api_adapter: Provider["BitbucketAPIAdapter"] = Singleton(
         BitbucketAPIAdapter,
@@ -106,6 +172,10 @@ class WeaselContainer(DeclarativeContainer):
         _connect_timeout=external_api_settings.provided.bitbucket_connect_timeout,
         _data_dir=service_settings.provided.data_directory,
         _id_factory=id_factory.provider,
+        _is_ignorable=sealer_adapter.provided.is_ignorable,
+        _limiter=bitbucket_limiter_adapter.provided,
+        _rest_url=external_api_settings.provided.bitbucket_rest_url,
+        _session=session_adapter.provided,
     )
     github_api_adapter: Provider["GitHubAPIAdapter"] = Singleton(
         GitHubAPIAdapter,
@@ -113,6 +183,9 @@ class WeaselContainer(DeclarativeContainer):
         _connect_timeout=external_api_settings.provided.github_connect_timeout,
         _data_dir=service_settings.provided.data_directory,
         _id_factory=id_factory.provider,
+        _is_ignorable=sealer_adapter.provided.is_ignorable,
+        _limiter=github_limiter_adapter.provided,
+        _session=session_adapter.provided,
     )
 
     bitbucket_adapter: Provider["GitInterface"] = Singleton(
@@ -122,8 +195,11 @@ class WeaselContainer(DeclarativeContainer):
         GitHubAdapter, _cache=cache_adapter.provided, _github=github_api_adapter.provided
     )
 
+    assignment_adapter: Provider["AssignmentInterface"] = Singleton(AssignmentAdapter)
     estimator_adapter: Provider["EstimatorInterface"] = Singleton(
-        EstimatorAdapter, _precision=service_settings.provided.precision
+        EstimatorAdapter,
+        _precision=service_settings.provided.precision,
+        _workers=estimator_settings.provided.workers,
     )
 
     bzl001: Provider["MutationInterface"] = Singleton(bzl001.StarlarkMutation)
@@ -131,7 +207,9 @@ class WeaselContainer(DeclarativeContainer):
     bzl003: Provider["MutationInterface"] = Singleton(bzl003.StarlarkMutation)
     bzl004: Provider["MutationInterface"] = Singleton(bzl004.StarlarkMutation)
     bzl005: Provider["MutationInterface"] = Singleton(
-        bzl005.StarlarkMutation, _estimator=estimator_adapter.provided
+        bzl005.StarlarkMutation,
+        _assignment=assignment_adapter.provided,
+        _estimator=estimator_adapter.provided,
     )
 
     java001: Provider["MutationInterface"] = Singleton(java001.JavaMutation)
@@ -142,7 +220,9 @@ class WeaselContainer(DeclarativeContainer):
     py004: Provider["MutationInterface"] = Singleton(py004.PythonMutation)
     py005: Provider["MutationInterface"] = Singleton(py005.PythonMutation)
     py006: Provider["MutationInterface"] = Singleton(
-        py006.PythonMutation, _estimator=estimator_adapter.provided
+        py006.PythonMutation,
+        _assignment=assignment_adapter.provided,
+        _estimator=estimator_adapter.provided,
     )
 
     sql001: Provider["MutationInterface"] = Singleton(sql001.SQLMutation)
@@ -159,7 +239,9 @@ class WeaselContainer(DeclarativeContainer):
     sql012: Provider["MutationInterface"] = Singleton(sql012.SQLMutation)
     sql013: Provider["MutationInterface"] = Singleton(sql013.SQLMutation)
     sql014: Provider["MutationInterface"] = Singleton(
-        sql014.SQLMutation, _estimator=estimator_adapter.provided
+        sql014.SQLMutation,
+        _assignment=assignment_adapter.provided,
+        _estimator=estimator_adapter.provided,
     )
 
     java_mutations: Provider[list["MutationInterface"]] = List(java001.provided)
@@ -197,6 +279,7 @@ class WeaselContainer(DeclarativeContainer):
         _depth=mutation_tree_settings.provided.depth,
         _estimator=estimator_adapter.provided,
         _mutations=java_mutations.provided,
+        _table_size=mutation_tree_settings.provided.table_size,
         _tolerance=mutation_tree_settings.provided.tolerance,
     )
     python_mutation_tree: Provider["MutationTreeInterface"] = Singleton(
@@ -205,6 +288,7 @@ class WeaselContainer(DeclarativeContainer):
         _depth=mutation_tree_settings.provided.depth,
         _estimator=estimator_adapter.provided,
         _mutations=python_mutations.provided,
+        _table_size=mutation_tree_settings.provided.table_size,
         _tolerance=mutation_tree_settings.provided.tolerance,
     )
     sql_mutation_tree: Provider["MutationTreeInterface"] = Singleton(
@@ -213,6 +297,7 @@ class WeaselContainer(DeclarativeContainer):
         _depth=mutation_tree_settings.provided.depth,
         _estimator=estimator_adapter.provided,
         _mutations=sql_mutations.provided,
+        _table_size=mutation_tree_settings.provided.table_size,
         _tolerance=mutation_tree_settings.provided.tolerance,
     )
     starlark_mutation_tree: Provider["MutationTreeInterface"] = Singleton(
@@ -221,6 +306,7 @@ class WeaselContainer(DeclarativeContainer):
         _depth=mutation_tree_settings.provided.depth,
         _estimator=estimator_adapter.provided,
         _mutations=starlark_mutations.provided,
+        _table_size=mutation_tree_settings.provided.table_size,
         _tolerance=mutation_tree_settings.provided.tolerance,
     )
 
@@ -231,18 +317,46 @@ class WeaselContainer(DeclarativeContainer):
         sql=sql_mutation_tree.provided,
     )
 
+    executor_adapter: Provider["ExecutorInterface"] = Singleton(
+        ExecutorAdapter,
+        _estimator=estimator_adapter.provided,
+        _forms_size_limit=executor_settings.provided.forms_size_limit,
+        _languages=languages.provided,
+        _max_workers=executor_settings.provided.max_workers,
+        _mutation_trees=mutation_trees.provided,
+    )
+
+    match_salt: Provider[str] = Callable(
+        "{}:{}:{}:{}".format,
+        service_settings.provided.version,
+        service_settings.provided.precision,
+        mutation_tree_settings.provided.model_dump_json.call(),
+        fingerprint_settings.provided.model_dump_json.call(),
+    )
+
     matcher_service: Provider["MatcherService"] = Singleton(
         MatcherService,
+        _cache=cache_adapter.provided,
         _estimator=estimator_adapter.provided,
+        _executor=executor_adapter.provided,
+        _fingerprint_threshold=fingerprint_settings.provided.threshold,
+        _fingerprinter=fingerprinter_adapter.provided,
         _languages=languages.provided,
-        _mutation_trees=mutation_trees.provided,
+        _match_salt=match_salt.provided,
+        _persist_matches=cache_settings.provided.persist_matches,
+        _persist_recognitions=cache_settings.provided.persist_recognitions,
+        _text_store=text_store_adapter.provided,
     )
     scanner_service: Provider["ScannerService"] = Singleton(
         ScannerService,
         _bitbucket=bitbucket_adapter.provided,
         _github=github_adapter.provided,
+        _index=index_adapter.provided,
+        _index_enabled=index_settings.provided.enabled,
+        _languages=languages.provided,
         _matcher=matcher_service.provided,
         _metrics=metrics_adapter.provided,
+        _scheduler=scheduler_adapter.provided,
         _sealer=sealer_adapter.provided,
     )
 
@@ -1,6 +1,7 @@
 import json
 
 from pathlib import Path
+from typing import Any, Self
 
 import toml
 import yaml
@@ -17,6 +18,37 @@ class ReportEntity(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_json(cls, path: Path, encoding: str = "utf-8") -> Self:
+        """Load the entity from *JSON*."""
+        text = path.read_text(encoding)
+        return cls.model_validate_json(text)
+
+    @classmethod
+    def from_jsonl(cls, path: Path, encoding: str = "utf-8") -> Self:
+        """Load the entity from *JSON Lines*.
+
+        Notes
+        -----
+        * Each line holds either a comparison or the rest of the review (e.g. the digests);
+        * The reviews are ordered as the tasks first appear.
+        """
+        reviews: dict[str, dict[str, Any]] = {}
+
+        with path.open(encoding=encoding) as file:
+            for line in filter(str.strip, file):
+                data = json.loads(line)
+                review = reviews.setdefault(
+                    data["task"], {"name": data["task"], "comparisons": [], "digests": {}}
+                )
+
+                if "comparison" in data:
+                    review["comparisons"].append(data["comparison"])
+                else:
+                    review.update({key: value for key, value in data.items() if key != "task"})
+
+        return cls.model_validate({"reviews": list(reviews.values())})
+
     def to_json(self, path: Path, *, indent: int | None = None, encoding: str = "utf-8") -> None:
         """Dump the entity as *JSON*."""
         data = self.model_dump(mode="json")
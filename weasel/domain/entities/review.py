@@ -1,12 +1,20 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from weasel.domain.entities.comparison import ComparisonEntity
 
 
 class ReviewEntity(BaseModel):
-    """The review entity."""
+    """The review entity.
+
+    Notes
+    -----
+    * `min_probability` and `top_k_matches` are the options the matches were pruned with.
+    """
 
     name: str
     comparisons: list[ComparisonEntity]
+    digests: dict[str, str] = Field(default_factory=dict)
+    min_probability: float = 0.0
+    top_k_matches: int | None = None
 
     model_config = ConfigDict(from_attributes=True)
@@ -5,6 +5,7 @@ from pydantic import BaseModel, ConfigDict, model_validator
 
 from weasel.domain.entities.bitbucket import BitbucketEntity
 from weasel.domain.entities.github import GitHubEntity
+from weasel.domain.types.language import LanguageType
 
 
 class SubmissionEntity(BaseModel):
@@ -14,12 +15,18 @@ class SubmissionEntity(BaseModel):
     bitbucket: BitbucketEntity | None = None
     github: GitHubEntity | None = None
     path: Path | None = None
+    files: dict[LanguageType, list[Path]] | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
     @model_validator(mode="after")
     def ensure_source(self) -> Self:
-        """Ensure exactly one source is specified."""
+        """Ensure exactly one source is specified.
+
+        Notes
+        -----
+        * `files` are not a source - they are listed (by language) while sealing.
+        """
         sources = [self.bitbucket, self.github, self.path]
         count = sum(map(bool, sources))
 
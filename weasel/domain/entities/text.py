@@ -0,0 +1,10 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class TextEntity(BaseModel):
+    """The text entity."""
+
+    digest: str
+    text: str
+
+    model_config = ConfigDict(from_attributes=True)
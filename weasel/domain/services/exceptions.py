@@ -6,5 +6,9 @@ class WeaselConnectionError(WeaselError, ConnectionError):
     """Raised when there is a connection error."""
 
 
+class WeaselRateLimitError(WeaselConnectionError):
+    """Raised when the API rate limit is exceeded."""
+
+
 class WeaselCacheError(WeaselError):
     """Raised when there is a cache error."""
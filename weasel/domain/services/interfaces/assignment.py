@@ -0,0 +1,22 @@
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Protocol
+
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from numpy.typing import NDArray
+
+
+class AssignmentInterface(Protocol):
+    """The assignment interface."""
+
+    @abstractmethod
+    async def assign(self, weights: "NDArray[np.float64]") -> dict[int, int]:
+        """Find the maximum weight matching of rows and columns.
+
+        Notes
+        -----
+        * `weights` has a row per source and a column per target;
+        * The pairs with non-positive weights are never matched.
+        """
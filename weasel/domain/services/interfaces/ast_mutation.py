@@ -0,0 +1,25 @@
+import ast
+
+from abc import abstractmethod
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class ASTMutationInterface(Protocol):
+    """The *AST* mutation interface.
+
+    Notes
+    -----
+    * Optional, implemented next to `MutationInterface` by *AST*-based mutations.
+    """
+
+    @abstractmethod
+    async def mutate_ast(self, source: ast.Module, target: ast.Module) -> ast.Module | None:
+        """Mutate `source` using `target` as the reference.
+
+        Notes
+        -----
+        * `None` is returned if nothing has changed, `source` is left intact then;
+        * Otherwise, `source` is consumed and must not be reused;
+        * `target` is never modified.
+        """
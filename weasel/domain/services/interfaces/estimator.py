@@ -1,8 +1,13 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Protocol
 
 
 if TYPE_CHECKING:
+    import numpy as np
+
+    from numpy.typing import NDArray
+
     from weasel.domain.dtypes.probability import Probability
 
 
@@ -12,3 +17,18 @@ class EstimatorInterface(Protocol):
     @abstractmethod
     async def estimate(self, source: str, target: str) -> "Probability":
         """Estimate whether `source` is derived from `target`."""
+
+    @abstractmethod
+    async def estimate_many(self, sources: Sequence[str], target: str) -> list["Probability"]:
+        """Estimate whether each of `sources` is derived from `target`."""
+
+    @abstractmethod
+    async def estimate_matrix(
+        self, sources: Sequence[str], targets: Sequence[str]
+    ) -> "NDArray[np.float64]":
+        """Estimate whether each of `sources` is derived from each of `targets`.
+
+        Notes
+        -----
+        * The matrix has a row per source and a column per target.
+        """
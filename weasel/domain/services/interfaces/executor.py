@@ -0,0 +1,36 @@
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Protocol
+
+
+if TYPE_CHECKING:
+    from weasel.domain.dtypes.probability import Probability
+    from weasel.domain.types.language import LanguageType
+
+
+class ExecutorInterface(Protocol):
+    """The executor interface."""
+
+    @abstractmethod
+    async def recognizes(self, language: "LanguageType", code: str) -> bool:
+        """Check if the code matches the language."""
+
+    @abstractmethod
+    async def match(
+        self,
+        language: "LanguageType",
+        source: str,
+        target: str,
+        digest: str,
+        score: "Probability | None" = None,
+    ) -> tuple["Probability", list[str]]:
+        """Match `source` and `target` and return the probability and the labels.
+
+        Notes
+        -----
+        * `digest` is the content digest of `source` (its target-independent forms are cached by);
+        * `score` is the estimate of the unmutated texts (if known).
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Shut the worker processes down (if any)."""
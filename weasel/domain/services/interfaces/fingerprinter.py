@@ -0,0 +1,10 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class FingerprinterInterface(Protocol):
+    """The fingerprinter interface."""
+
+    @abstractmethod
+    async def fingerprint(self, text: str) -> frozenset[int]:
+        """Get the fingerprints of the text."""
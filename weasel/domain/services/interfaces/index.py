@@ -0,0 +1,19 @@
+from abc import abstractmethod
+from collections.abc import Hashable
+from typing import Protocol
+
+
+class IndexInterface(Protocol):
+    """The candidate index interface."""
+
+    @abstractmethod
+    async def find_candidates[T: Hashable](
+        self, fingerprints: dict[T, frozenset[int]]
+    ) -> set[tuple[T, T]]:
+        """Find the pairs of keys with similar fingerprints.
+
+        Notes
+        -----
+        * Pairs are ordered as the keys of `fingerprints`;
+        * Keys without fingerprints are never candidates.
+        """
@@ -12,3 +12,12 @@ class MutationInterface(Protocol):
     @abstractmethod
     def as_label(self) -> str:
         """Return the mutation label."""
+
+    def is_target_independent(self) -> bool:
+        """Check whether the mutation ignores `target`.
+
+        Notes
+        -----
+        * Mutations are considered target-dependent unless overridden.
+        """
+        return False
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Protocol
 
 
 if TYPE_CHECKING:
+    from weasel.domain.dtypes.probability import Probability
     from weasel.domain.services.interfaces.mutation import MutationInterface
 
 
@@ -10,5 +11,30 @@ class MutationTreeInterface(Protocol):
     """The mutation tree interface."""
 
     @abstractmethod
-    async def get_mutations(self, source: str, target: str) -> list["MutationInterface"]:
-        """Get the set of mutations required to convert `source` to `target`."""
+    async def canonicalize(self, source: str) -> dict[str, str]:
+        """Get the target-independent forms of `source` (by mutation label)."""
+
+    @abstractmethod
+    async def get_mutations(
+        self,
+        source: str,
+        target: str,
+        forms: dict[str, str] | None = None,
+        score: "Probability | None" = None,
+    ) -> list["MutationInterface"]:
+        """Get the set of mutations required to convert `source` to `target`.
+
+        Notes
+        -----
+        * `score` is the estimate of the unmutated texts (if known).
+        """
+
+    @abstractmethod
+    async def apply(
+        self,
+        source: str,
+        target: str,
+        mutations: list["MutationInterface"],
+        forms: dict[str, str] | None = None,
+    ) -> str:
+        """Apply `mutations` to `source` using `target` as the reference."""
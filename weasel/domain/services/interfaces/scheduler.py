@@ -0,0 +1,15 @@
+from abc import abstractmethod
+from collections.abc import Coroutine, Iterable
+from typing import Any, Protocol
+
+
+class SchedulerInterface(Protocol):
+    """The scheduler interface."""
+
+    @abstractmethod
+    async def gather_comparisons[T](self, coroutines: Iterable[Coroutine[Any, Any, T]]) -> list[T]:
+        """Run the comparisons of a single task."""
+
+    @abstractmethod
+    async def gather_matches[T](self, coroutines: Iterable[Coroutine[Any, Any, T]]) -> list[T]:
+        """Run the matches of a single comparison."""
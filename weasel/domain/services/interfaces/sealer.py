@@ -13,3 +13,7 @@ class SealerInterface(Protocol):
     @abstractmethod
     async def clean(self) -> None:
         """Clean the sealing layer."""
+
+    @abstractmethod
+    def is_ignorable(self, pathlike: str) -> bool:
+        """Check if the file or directory is ignored while sealing."""
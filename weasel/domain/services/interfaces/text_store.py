@@ -0,0 +1,19 @@
+from abc import abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
+
+
+if TYPE_CHECKING:
+    from weasel.domain.entities.text import TextEntity
+
+
+class TextStoreInterface(Protocol):
+    """The text store interface."""
+
+    @abstractmethod
+    async def read(self, path: Path) -> "TextEntity":
+        """Read the file."""
+
+    @abstractmethod
+    async def clean(self) -> None:
+        """Clean the store."""
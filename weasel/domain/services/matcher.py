@@ -1,16 +1,25 @@
 import asyncio
+import hashlib
+import json
 
+from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
 from weasel.domain.entities.match import MatchEntity
+from weasel.domain.services.exceptions import WeaselCacheError
 
 
 if TYPE_CHECKING:
+    from weasel.domain.dtypes.probability import Probability
+    from weasel.domain.entities.text import TextEntity
+    from weasel.domain.services.interfaces.cache import CacheInterface
     from weasel.domain.services.interfaces.estimator import EstimatorInterface
+    from weasel.domain.services.interfaces.executor import ExecutorInterface
+    from weasel.domain.services.interfaces.fingerprinter import FingerprinterInterface
     from weasel.domain.services.interfaces.language import LanguageInterface
-    from weasel.domain.services.interfaces.mutation_tree import MutationTreeInterface
+    from weasel.domain.services.interfaces.text_store import TextStoreInterface
     from weasel.domain.types.language import LanguageType
 
 
@@ -18,49 +27,330 @@ if TYPE_CHECKING:
 class MatcherService:
     """The matcher service."""
 
+    _cache: "CacheInterface"
     _estimator: "EstimatorInterface"
+    _executor: "ExecutorInterface"
+    _fingerprint_threshold: float
+    _fingerprinter: "FingerprinterInterface"
     _languages: list["LanguageInterface"]
-    _mutation_trees: dict["LanguageType", "MutationTreeInterface"]
+    _match_salt: str
+    _persist_matches: bool
+    _persist_recognitions: bool
+    _text_store: "TextStoreInterface"
 
-    _encoding: ClassVar[str] = "utf-8"
-    _errors: ClassVar[str] = "replace"
+    _matches_bucket: ClassVar[str] = "matches"
+    _recognitions_bucket: ClassVar[str] = "recognitions"
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._fingerprints: dict[str, asyncio.Task[frozenset[int]]] = {}
+        self._recognitions: dict[tuple[LanguageType, str], asyncio.Task[bool]] = {}
+        self._salt_digest = hashlib.blake2b(self._match_salt.encode(), digest_size=8).hexdigest()
 
     async def maybe_match(self, source: Path, target: Path) -> MatchEntity | None:
-        """Match `source` and `target` if possible."""
+        """Match `source` and `target` if possible.
+
+        Notes
+        -----
+        * *CPU*-bound work is delegated to the executor;
+        * Files are read through the text store;
+        * Each file is recognized and fingerprinted once per scan;
+        * The target-independent forms are cached by the executor (by digest);
+        * Pairs with too few common fingerprints are estimated without mutations.
+        """
+        if (texts := await self._read(source, target)) is None:
+            return None
+
+        language, source_text, target_text = texts
+        probability, labels = await self._match(language, source_text, target_text)
+
+        return MatchEntity(
+            source=source, target=target, language=language, probability=probability, labels=labels
+        )
+
+    async def maybe_match_both(
+        self, file1: Path, file2: Path
+    ) -> tuple[MatchEntity, MatchEntity] | None:
+        """Match `file1` and `file2` in both directions if possible.
+
+        Notes
+        -----
+        * See `maybe_match`;
+        * Both directions share the texts, the recognitions and the initial estimate;
+        * Only the mutation searches are run per direction.
+        """
+        if (texts := await self._read(file1, file2)) is None:
+            return None
+
+        language, text1, text2 = texts
+        (probability12, labels12), (probability21, labels21) = await self._match_both(
+            language, text1, text2
+        )
+
+        return (
+            MatchEntity(
+                source=file1,
+                target=file2,
+                language=language,
+                probability=probability12,
+                labels=labels12,
+            ),
+            MatchEntity(
+                source=file2,
+                target=file1,
+                language=language,
+                probability=probability21,
+                labels=labels21,
+            ),
+        )
+
+    async def fingerprint(self, path: Path) -> frozenset[int]:
+        """Get the fingerprints of the file.
+
+        Notes
+        -----
+        * Files of unsupported languages have no fingerprints;
+        * Each file is fingerprinted once per scan.
+        """
+        if not any(path.suffix in language.get_extensions() for language in self._languages):
+            return frozenset()
+
+        text = await self._text_store.read(path)
+        return await self._fingerprint(text)
+
+    async def digest(self, root: Path, files: list[Path]) -> str:
+        """Get the digest of the files (by content and relative path).
+
+        Notes
+        -----
+        * The digest is salted, so it changes along with the match settings;
+        * The files are hashed one by one within a thread, so the texts are not kept.
+        """
+        return await asyncio.to_thread(self._digest, root, files)
+
+    async def clean(self) -> None:
+        """Clean the per-scan state."""
+        self._fingerprints.clear()
+        self._recognitions.clear()
+        await self._text_store.clean()
+
+    def _digest(self, root: Path, files: list[Path]) -> str:
+        """Get the digest of the files (synchronously)."""
+        digest = hashlib.blake2b(self._salt_digest.encode(), digest_size=16)
+
+        for file in files:
+            with file.open(mode="rb") as stream:
+                content = hashlib.file_digest(stream, "blake2b")
+
+            digest.update(file.relative_to(root).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(content.digest())
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    async def _read(
+        self, source: Path, target: Path
+    ) -> tuple["LanguageType", "TextEntity", "TextEntity"] | None:
+        """Read the files if both are recognized as the same language."""
         for language in self._languages:
             extensions = language.get_extensions()
 
             if not extensions.issuperset({source.suffix, target.suffix}):
                 continue
 
-            source_text = await self._read_file(source)
-            if not await language.recognizes(source_text):
+            source_text = await self._text_store.read(source)
+            if not await self._recognizes(language.as_type(), source_text):
                 return None
 
-            target_text = await self._read_file(target)
-            if not await language.recognizes(target_text):
+            target_text = await self._text_store.read(target)
+            if not await self._recognizes(language.as_type(), target_text):
                 return None
 
-            mutation_tree = self._mutation_trees[language.as_type()]
-            mutations = await mutation_tree.get_mutations(source_text, target_text)
+            return language.as_type(), source_text, target_text
+
+        return None
 
-            for mutation in mutations:
-                source_text = await mutation.mutate(source_text, target_text)
+    async def _match(
+        self, language: "LanguageType", source: "TextEntity", target: "TextEntity"
+    ) -> tuple["Probability", list[str]]:
+        """Match the texts (persisted across runs)."""
+        if (cached := await self._get_match(language, source, target)) is not None:
+            return cached
 
-            probability = await self._estimator.estimate(source_text, target_text)
-            labels = [mutation.as_label() for mutation in mutations]
+        match = await self._compute_match(language, source, target)
+        await self._put_match(language, source, target, match)
 
-            return MatchEntity(
-                source=source,
-                target=target,
-                language=language.as_type(),
-                probability=probability,
-                labels=labels,
-            )
+        return match
 
-        return None
+    async def _match_both(
+        self, language: "LanguageType", text1: "TextEntity", text2: "TextEntity"
+    ) -> tuple[tuple["Probability", list[str]], tuple["Probability", list[str]]]:
+        """Match the texts in both directions (persisted across runs).
+
+        Notes
+        -----
+        * Both directions are recomputed unless both are cached.
+        """
+        cached12, cached21 = await asyncio.gather(
+            self._get_match(language, text1, text2), self._get_match(language, text2, text1)
+        )
+
+        if cached12 is not None and cached21 is not None:
+            return cached12, cached21
+
+        match12, match21 = await self._compute_match_both(language, text1, text2)
+
+        await asyncio.gather(
+            self._put_match(language, text1, text2, match12),
+            self._put_match(language, text2, text1, match21),
+        )
+
+        return match12, match21
+
+    async def _compute_match(
+        self, language: "LanguageType", source: "TextEntity", target: "TextEntity"
+    ) -> tuple["Probability", list[str]]:
+        """Match the texts."""
+        if not await self._is_plausible(source, target):
+            probability = await self._estimator.estimate(source.text, target.text)
+            return probability, []
+
+        return await self._executor.match(language, source.text, target.text, source.digest)
+
+    async def _compute_match_both(
+        self, language: "LanguageType", text1: "TextEntity", text2: "TextEntity"
+    ) -> tuple[tuple["Probability", list[str]], tuple["Probability", list[str]]]:
+        """Match the texts in both directions.
+
+        Notes
+        -----
+        * The estimate of the unmutated texts is symmetric, so it is computed once.
+        """
+        score = await self._estimator.estimate(text1.text, text2.text)
+
+        if not await self._is_plausible(text1, text2):
+            return (score, []), (score, [])
+
+        match12, match21 = await asyncio.gather(
+            self._executor.match(language, text1.text, text2.text, text1.digest, score),
+            self._executor.match(language, text2.text, text1.text, text2.digest, score),
+        )
+
+        return match12, match21
+
+    async def _get_match(
+        self, language: "LanguageType", source: "TextEntity", target: "TextEntity"
+    ) -> tuple["Probability", list[str]] | None:
+        """Get the persisted match of the texts if exists."""
+        if not self._persist_matches:
+            return None
+
+        key = self._build_match_key(language, source, target)
+
+        if not (cached := await self._maybe_from_cache(self._matches_bucket, key)):
+            return None
+
+        probability, labels = json.loads(cached)
+        return probability, labels
+
+    async def _put_match(
+        self,
+        language: "LanguageType",
+        source: "TextEntity",
+        target: "TextEntity",
+        match: tuple["Probability", list[str]],
+    ) -> None:
+        """Persist the match of the texts."""
+        if not self._persist_matches:
+            return
+
+        key = self._build_match_key(language, source, target)
+
+        with suppress(WeaselCacheError):
+            await self._cache.put(self._matches_bucket, key, json.dumps(match))
+
+    def _build_match_key(
+        self, language: "LanguageType", source: "TextEntity", target: "TextEntity"
+    ) -> str:
+        """Build the match key.
+
+        Notes
+        -----
+        * The salt covers the version and the settings affecting the results.
+        """
+        return f"{language}:{source.digest}:{target.digest}:{self._salt_digest}"
+
+    async def _is_plausible(self, source: "TextEntity", target: "TextEntity") -> bool:
+        """Check if the texts have enough common fingerprints.
+
+        Notes
+        -----
+        * The overlap is relative to the smaller set of fingerprints;
+        * Texts without fingerprints are always plausible.
+        """
+        if not self._fingerprint_threshold:
+            return True
+
+        source_fingerprints, target_fingerprints = await asyncio.gather(
+            self._fingerprint(source), self._fingerprint(target)
+        )
+
+        if not source_fingerprints or not target_fingerprints:
+            return True
+
+        common = len(source_fingerprints & target_fingerprints)
+        overlap = common / min(len(source_fingerprints), len(target_fingerprints))
+
+        return overlap >= self._fingerprint_threshold
+
+    async def _fingerprint(self, text: "TextEntity") -> frozenset[int]:
+        """Get the fingerprints of the text (memoized)."""
+        if (task := self._fingerprints.get(text.digest)) is None:
+            task = asyncio.create_task(self._fingerprinter.fingerprint(text.text))
+            self._fingerprints[text.digest] = task
+
+        return await asyncio.shield(task)
+
+    async def _recognizes(self, language: "LanguageType", text: "TextEntity") -> bool:
+        """Check if the text matches the language (memoized)."""
+        key = (language, text.digest)
+
+        if (task := self._recognitions.get(key)) is None:
+            task = asyncio.create_task(self._recognize(language, text))
+            self._recognitions[key] = task
+
+        return await asyncio.shield(task)
+
+    async def _recognize(self, language: "LanguageType", text: "TextEntity") -> bool:
+        """Check if the text matches the language."""
+        key = self._build_recognition_key(language, text)
+
+        if self._persist_recognitions and (
+            cached := await self._maybe_from_cache(self._recognitions_bucket, key)
+        ):
+            return bool(json.loads(cached))
+
+        recognized = await self._executor.recognizes(language, text.text)
+
+        if self._persist_recognitions:
+            with suppress(WeaselCacheError):
+                await self._cache.put(self._recognitions_bucket, key, json.dumps(recognized))
+
+        return recognized
+
+    def _build_recognition_key(self, language: "LanguageType", text: "TextEntity") -> str:
+        """Build the recognition key.
+
+        Notes
+        -----
+        * The salt covers the version, so the parsers of older versions are not trusted.
+        """
+        return f"{language}:{text.digest}:{self._salt_digest}"
 
-    @classmethod
-    async def _read_file(cls, path: Path) -> str:
-        """Read the file."""
-        return await asyncio.to_thread(path.read_text, encoding=cls._encoding, errors=cls._errors)
+    async def _maybe_from_cache(self, bucket: str, key: str) -> str | None:
+        """Get the value from the cache if exists."""
+        try:
+            return await self._cache.get(bucket, key)
+        except WeaselCacheError:
+            return None
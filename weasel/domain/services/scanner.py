@@ -1,12 +1,14 @@
 import asyncio
+import heapq
 import os
 
-from collections.abc import AsyncGenerator
-from contextlib import aclosing
-from dataclasses import dataclass
-from itertools import combinations
+from collections import defaultdict
+from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine
+from contextlib import suppress
+from dataclasses import dataclass, field
+from itertools import chain, combinations
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from weasel.domain.entities.comparison import ComparisonEntity
 from weasel.domain.entities.contest import ContestEntity
@@ -19,9 +21,13 @@ from weasel.domain.entities.task import TaskEntity
 
 if TYPE_CHECKING:
     from weasel.domain.services.interfaces.git import GitInterface
+    from weasel.domain.services.interfaces.index import IndexInterface
+    from weasel.domain.services.interfaces.language import LanguageInterface
     from weasel.domain.services.interfaces.metrics import MetricsInterface
+    from weasel.domain.services.interfaces.scheduler import SchedulerInterface
     from weasel.domain.services.interfaces.sealer import SealerInterface
     from weasel.domain.services.matcher import MatcherService
+    from weasel.domain.types.language import LanguageType
 
 
 @dataclass
@@ -30,70 +36,397 @@ class ScannerService:
 
     _bitbucket: "GitInterface"
     _github: "GitInterface"
+    _index: "IndexInterface"
+    _index_enabled: bool
+    _languages: list["LanguageInterface"]
     _matcher: "MatcherService"
     _metrics: "MetricsInterface"
+    _scheduler: "SchedulerInterface"
     _sealer: "SealerInterface"
 
-    async def scan(self, contest: "ContestEntity") -> "ReportEntity":
-        """Scan the contest and return a report."""
+    _stream_size: ClassVar[int] = 64
+
+    async def scan(  # noqa: PLR0913
+        self,
+        contest: "ContestEntity",
+        baseline: "ReportEntity | None" = None,
+        sink: Callable[[str, "ComparisonEntity"], Awaitable[None]] | None = None,
+        *,
+        min_probability: float = 0.0,
+        top_k_matches: int | None = None,
+        with_digests: bool = False,
+    ) -> "ReportEntity":
+        """Scan the contest and return a report.
+
+        Notes
+        -----
+        * The comparisons of unchanged submissions are reused from `baseline` (if passed);
+        * The submissions are digested (to be reused later) if `with_digests` is set;
+        * The comparisons are passed to `sink` as soon as they are finished (if passed);
+        * The comparisons passed to `sink` are not retained in the report;
+        * Only the `top_k_matches` matches of at least `min_probability` are reported;
+        * The metrics are still calculated over all the matches.
+        """
         contest = await self._seal_contest(contest)
-        coroutines = [self._review(task) for task in contest.tasks]
-        reviews = await asyncio.gather(*coroutines)
+        baseline_reviews = {review.name: review for review in baseline.reviews} if baseline else {}
+        coroutines = [
+            self._review(
+                task,
+                baseline_reviews.get(task.name),
+                sink,
+                min_probability=min_probability,
+                top_k_matches=top_k_matches,
+                with_digests=with_digests,
+            )
+            for task in contest.tasks
+        ]
+
+        try:
+            reviews = await asyncio.gather(*coroutines)
+        finally:
+            await self._matcher.clean()
+
         return ReportEntity(reviews=reviews)
 
-    async def _review(self, task: "TaskEntity") -> "ReviewEntity":
+    async def scan_iter(
+        self,
+        contest: "ContestEntity",
+        baseline: "ReportEntity | None" = None,
+        *,
+        min_probability: float = 0.0,
+        top_k_matches: int | None = None,
+        with_digests: bool = False,
+    ) -> AsyncGenerator[tuple[str, "ComparisonEntity"]]:
+        """Scan the contest and yield the comparisons (with task names) as they are finished.
+
+        Notes
+        -----
+        * The comparisons are yielded in the completion order;
+        * The scan is paused while the consumer lags behind (backpressure);
+        * The scan is cancelled once the generator is closed (use `contextlib.aclosing`);
+        * The scan is cancelled along with the consumer as well.
+        """
+        queue: asyncio.Queue[tuple[str, ComparisonEntity]] = asyncio.Queue(self._stream_size)
+
+        async def sink(name: str, comparison: "ComparisonEntity") -> None:
+            await queue.put((name, comparison))
+
+        coroutine = self.scan(
+            contest,
+            baseline,
+            sink,
+            min_probability=min_probability,
+            top_k_matches=top_k_matches,
+            with_digests=with_digests,
+        )
+        producer = asyncio.create_task(coroutine)
+        getter: asyncio.Task[tuple[str, ComparisonEntity]] | None = None
+
+        try:
+            while True:
+                getter = asyncio.create_task(queue.get())
+                await asyncio.wait([getter, producer], return_when=asyncio.FIRST_COMPLETED)
+
+                if not getter.done():
+                    getter.cancel()
+                    break
+
+                yield getter.result()
+
+            while not queue.empty():
+                yield queue.get_nowait()
+
+            producer.result()
+
+        finally:
+            pending = [task for task in (getter, producer) if task is not None and not task.done()]
+
+            for task in pending:
+                task.cancel()
+
+            with suppress(asyncio.CancelledError):
+                await asyncio.gather(*pending)
+
+    async def _review(  # noqa: PLR0913
+        self,
+        task: "TaskEntity",
+        baseline: "ReviewEntity | None" = None,
+        sink: Callable[[str, "ComparisonEntity"], Awaitable[None]] | None = None,
+        *,
+        min_probability: float = 0.0,
+        top_k_matches: int | None = None,
+        with_digests: bool = False,
+    ) -> "ReviewEntity":
         """Review the task.
 
         Notes
         -----
-        * Comparisons are asymmetric.
+        * Comparisons are asymmetric, but both directions are computed as one unit;
+        * Comparisons are created lazily by the scheduler;
+        * Only the candidate submissions are compared if the index is enabled;
+        * Only the new or changed submissions are compared if `baseline` is passed;
+        * The submissions are digested only if `baseline` is passed or `with_digests` is set;
+        * The comparisons are passed to `sink` instead of the review (if passed).
         """
-        coroutines = [
-            coroutine
-            for s1, s2 in combinations(task.submissions, r=2)
-            for coroutine in (self._compare(s1, s2), self._compare(s2, s1))
+        digests = (
+            await self._digest_submissions(task) if with_digests or baseline is not None else {}
+        )
+        candidates = await self._find_candidates(task) if self._index_enabled else None
+
+        pairs = [
+            (i1, i2)
+            for i1, i2 in combinations(range(len(task.submissions)), r=2)
+            if candidates is None or (i1, i2) in candidates
+        ]
+
+        reused = (
+            self._reuse_comparisons(task, digests, baseline, min_probability, top_k_matches)
+            if baseline
+            else {}
+        )
+        missing = [pair for pair in pairs if pair not in reused]
+
+        coroutines = (
+            self._compare(
+                task.submissions[i1],
+                task.submissions[i2],
+                candidates[i1, i2] if candidates is not None else None,
+                min_probability=min_probability,
+                top_k_matches=top_k_matches,
+            )
+            for i1, i2 in missing
+        )
+
+        if sink is not None:
+            for comparison in chain.from_iterable(reused.values()):
+                await sink(task.name, comparison)
+
+            sinking = (
+                self._sink_comparisons(task.name, coroutine, sink) for coroutine in coroutines
+            )
+            await self._scheduler.gather_comparisons(sinking)
+
+            return ReviewEntity(
+                name=task.name,
+                comparisons=[],
+                digests=digests,
+                min_probability=min_probability,
+                top_k_matches=top_k_matches,
+            )
+
+        computed = dict(
+            zip(missing, await self._scheduler.gather_comparisons(coroutines), strict=True)
+        )
+
+        comparisons = [
+            comparison for pair in pairs for comparison in reused.get(pair) or computed[pair]
         ]
-        comparisons = await asyncio.gather(*coroutines)
-        return ReviewEntity(name=task.name, comparisons=comparisons)
+        return ReviewEntity(
+            name=task.name,
+            comparisons=comparisons,
+            digests=digests,
+            min_probability=min_probability,
+            top_k_matches=top_k_matches,
+        )
+
+    @classmethod
+    async def _sink_comparisons(
+        cls,
+        name: str,
+        coroutine: Coroutine[Any, Any, tuple["ComparisonEntity", "ComparisonEntity"]],
+        sink: Callable[[str, "ComparisonEntity"], Awaitable[None]],
+    ) -> None:
+        """Pass the comparisons to `sink` once finished."""
+        for comparison in await coroutine:
+            await sink(name, comparison)
 
-    async def _compare(self, s1: "SubmissionEntity", s2: "SubmissionEntity") -> "ComparisonEntity":
-        """Compare submissions.
+    async def _compare(
+        self,
+        s1: "SubmissionEntity",
+        s2: "SubmissionEntity",
+        candidates: set[tuple[Path, Path]] | None = None,
+        *,
+        min_probability: float = 0.0,
+        top_k_matches: int | None = None,
+    ) -> tuple["ComparisonEntity", "ComparisonEntity"]:
+        """Compare submissions in both directions.
 
         Notes
         -----
-        * Limit the number of concurrent tasks to avoid memory issues.
+        * Matches are created lazily by the scheduler;
+        * Each pair of files is matched in both directions at once;
+        * Only the files of the same language are paired;
+        * Only the `candidates` pairs of files are matched (if passed);
+        * Only the `top_k_matches` matches of at least `min_probability` are kept.
         """
-        if not s1.path or not s2.path:
+        if not s1.path or not s2.path or s1.files is None or s2.files is None:
             detail = "The submissions seem to be broken..."
             raise ValueError(detail)
 
-        source_files, target_files = await asyncio.gather(
-            self._list_files(s1.path), self._list_files(s2.path)
+        pairs = (
+            [
+                (file1, file2)
+                for file1, language in self._sort_files(s1.files)
+                for file2 in s2.files.get(language, [])
+            ]
+            if candidates is None
+            else sorted(candidates)
         )
+        coroutines = (self._matcher.maybe_match_both(file1, file2) for file1, file2 in pairs)
 
-        coroutines = [
-            self._matcher.maybe_match(source_file, target_file)
-            for source_file in source_files
-            for target_file in target_files
-        ]
+        forward = MatchSelector(min_probability, top_k_matches)
+        backward = MatchSelector(min_probability, top_k_matches)
+
+        for maybe_matches in await self._scheduler.gather_matches(coroutines):
+            if maybe_matches:
+                forward.push(maybe_matches[0])
+                backward.push(maybe_matches[1])
+
+        return (self._summarize(s1, s2, forward), self._summarize(s2, s1, backward))
+
+    def _summarize(
+        self, source: "SubmissionEntity", target: "SubmissionEntity", selector: "MatchSelector"
+    ) -> "ComparisonEntity":
+        """Summarize the matches of `source` against `target`."""
+        if not source.path or not target.path:
+            detail = "The submissions seem to be broken..."
+            raise ValueError(detail)
 
-        matches = [
+        metrics = self._metrics.calculate(selector.probabilities)
+
+        relative_matches = [
             MatchEntity(
-                source=maybe_match.source.relative_to(s1.path),
-                target=maybe_match.target.relative_to(s2.path),
-                language=maybe_match.language,
-                probability=maybe_match.probability,
-                labels=maybe_match.labels,
+                source=match.source.relative_to(source.path),
+                target=match.target.relative_to(target.path),
+                language=match.language,
+                probability=match.probability,
+                labels=match.labels,
             )
-            for maybe_match in await asyncio.gather(*coroutines)
-            if maybe_match
+            for match in selector.select()
         ]
 
-        probabilities = [match.probability for match in matches]
-        metrics = self._metrics.calculate(probabilities)
+        return ComparisonEntity(
+            source=source.name, target=target.name, metrics=metrics, matches=relative_matches
+        )
+
+    async def _digest_submissions(self, task: "TaskEntity") -> dict[str, str]:
+        """Get the content digests of the submissions (by name).
+
+        Notes
+        -----
+        * The submissions are digested lazily by the scheduler (as comparisons).
+        """
+        coroutines = (self._digest_submission(submission) for submission in task.submissions)
+        digests = await self._scheduler.gather_comparisons(coroutines)
+        return {
+            submission.name: digest
+            for submission, digest in zip(task.submissions, digests, strict=True)
+        }
+
+    async def _digest_submission(self, submission: "SubmissionEntity") -> str:
+        """Get the content digest of the submission."""
+        if not submission.path or submission.files is None:
+            detail = "The submission seems to be broken..."
+            raise ValueError(detail)
+
+        files = [file for file, _ in self._sort_files(submission.files)]
+        return await self._matcher.digest(submission.path, files)
+
+    @classmethod
+    def _reuse_comparisons(
+        cls,
+        task: "TaskEntity",
+        digests: dict[str, str],
+        baseline: "ReviewEntity",
+        min_probability: float = 0.0,
+        top_k_matches: int | None = None,
+    ) -> dict[tuple[int, int], tuple["ComparisonEntity", "ComparisonEntity"]]:
+        """Find the baseline comparisons of the unchanged submissions.
+
+        Notes
+        -----
+        * The comparisons are reused only if both directions are present;
+        * The matches are pruned again, but the pruned ones cannot be restored;
+        * Nothing is reused if the baseline was pruned more strictly.
+        """
+        if baseline.min_probability > min_probability or (
+            baseline.top_k_matches is not None
+            and (top_k_matches is None or baseline.top_k_matches < top_k_matches)
+        ):
+            return {}
+
+        comparisons = {
+            (comparison.source, comparison.target): comparison
+            for comparison in baseline.comparisons
+        }
+
+        unchanged = {
+            index
+            for index, submission in enumerate(task.submissions)
+            if baseline.digests.get(submission.name) == digests[submission.name]
+        }
+
+        reused: dict[tuple[int, int], tuple[ComparisonEntity, ComparisonEntity]] = {}
+
+        for i1, i2 in combinations(sorted(unchanged), r=2):
+            name1, name2 = task.submissions[i1].name, task.submissions[i2].name
+
+            comparison12 = comparisons.get((name1, name2))
+            comparison21 = comparisons.get((name2, name1))
+
+            if comparison12 is not None and comparison21 is not None:
+                reused[i1, i2] = (
+                    cls._prune(comparison12, min_probability, top_k_matches),
+                    cls._prune(comparison21, min_probability, top_k_matches),
+                )
+
+        return reused
+
+    @classmethod
+    def _prune(
+        cls,
+        comparison: "ComparisonEntity",
+        min_probability: float = 0.0,
+        top_k_matches: int | None = None,
+    ) -> "ComparisonEntity":
+        """Keep only the `top_k_matches` matches of at least `min_probability`.
+
+        Notes
+        -----
+        * The matches are expected to be sorted by probability (descending).
+        """
+        matches = [match for match in comparison.matches if match.probability >= min_probability]
+        return comparison.model_copy(update={"matches": matches[:top_k_matches]})
+
+    async def _find_candidates(
+        self, task: "TaskEntity"
+    ) -> dict[tuple[int, int], set[tuple[Path, Path]]]:
+        """Find the candidate pairs of files (by the pair of submission indices).
+
+        Notes
+        -----
+        * The pairs are ordered as the submissions;
+        * The files of the same submission or of different languages are never candidates.
+        """
+        owners = {
+            file: (index, language)
+            for index, submission in enumerate(task.submissions)
+            for language, files in (submission.files or {}).items()
+            for file in files
+        }
+
+        fingerprints = await asyncio.gather(*(self._matcher.fingerprint(file) for file in owners))
+        pairs = await self._index.find_candidates(dict(zip(owners, fingerprints, strict=True)))
+
+        candidates: defaultdict[tuple[int, int], set[tuple[Path, Path]]] = defaultdict(set)
 
-        matches.sort(key=lambda match: match.probability, reverse=True)
-        return ComparisonEntity(source=s1.name, target=s2.name, metrics=metrics, matches=matches)
+        for file1, file2 in pairs:
+            (owner1, language1), (owner2, language2) = owners[file1], owners[file2]
+
+            if owner1 != owner2 and language1 == language2:
+                candidates[owner1, owner2].add((file1, file2))
+
+        return candidates
 
     async def _seal_contest(self, contest: "ContestEntity") -> "ContestEntity":
         """Seal the contest."""
@@ -108,10 +441,17 @@ class ScannerService:
         return TaskEntity(name=task.name, submissions=submissions)
 
     async def _seal_submission(self, submission: "SubmissionEntity") -> "SubmissionEntity":
-        """Seal the submission."""
+        """Seal the submission.
+
+        Notes
+        -----
+        * The files are listed once, so comparisons do not walk the directory;
+        * The files are grouped by language, so only the same-language files are paired.
+        """
         path = await self._maybe_download(submission)
         path = await self._sealer.seal(path)
-        return SubmissionEntity(name=submission.name, path=path)
+        files = await self._list_files(path)
+        return SubmissionEntity(name=submission.name, path=path, files=files)
 
     async def _maybe_download(self, submission: "SubmissionEntity") -> Path:
         """Download the submission if required."""
@@ -139,25 +479,97 @@ class ScannerService:
 
         return submission.path
 
+    async def _list_files(self, dirpath: Path) -> dict["LanguageType", list[Path]]:
+        """List the directory files (by language).
+
+        Notes
+        -----
+        * The whole directory is walked within a single thread;
+        * The files of unsupported languages are skipped.
+        """
+        files = await asyncio.to_thread(self._walk, dirpath)
+        languages = {
+            extension: language.as_type()
+            for language in self._languages
+            for extension in language.get_extensions()
+        }
+
+        grouped_files: defaultdict[LanguageType, list[Path]] = defaultdict(list)
+
+        for file in files:
+            if (language := languages.get(file.suffix)) is not None:
+                grouped_files[language].append(file)
+
+        return dict(grouped_files)
+
     @classmethod
-    async def _list_files(cls, dirpath: Path) -> list[Path]:
-        """List the directory files."""
-        async with aclosing(cls._iterate_over_files(dirpath)) as files:
-            return [file async for file in files]
+    def _sort_files(
+        cls, files: dict["LanguageType", list[Path]]
+    ) -> list[tuple[Path, "LanguageType"]]:
+        """Sort the files of all languages."""
+        return sorted((file, language) for language, paths in files.items() for file in paths)
 
     @classmethod
-    async def _iterate_over_files(cls, dirpath: Path) -> AsyncGenerator[Path]:
-        """Scan the directory."""
-        iterator = os.scandir(dirpath)
-        entries = await asyncio.to_thread(list, iterator)
+    def _walk(cls, dirpath: Path) -> list[Path]:
+        """Walk the directory."""
+        files: list[Path] = []
+        dirpaths = [dirpath]
+
+        while dirpaths:
+            with os.scandir(dirpaths.pop()) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        files.append(Path(entry.path))
+
+                    elif entry.is_dir(follow_symlinks=False):
+                        dirpaths.append(Path(entry.path))
+
+        return sorted(files)
+
+
+@dataclass(frozen=True)
+class _MatchRank:
+    """The rank of the match among the equally probable ones (the lesser files rank higher)."""
+
+    source: Path
+    target: Path
+
+    def __lt__(self, other: "_MatchRank") -> bool:
+        """Check if the match ranks lower than `other`."""
+        return (self.source, self.target) > (other.source, other.target)
+
+
+@dataclass
+class MatchSelector:
+    """The selector of the most probable matches.
+
+    Notes
+    -----
+    * All the probabilities are kept (for metrics), the matches are kept only if selected;
+    * The matches of the lesser files (by source, then target) win the ties, whatever the order.
+    """
+
+    min_probability: float = 0.0
+    top_k: int | None = None
+
+    probabilities: list[float] = field(default_factory=list)
+
+    _heap: list[tuple[float, _MatchRank, MatchEntity]] = field(default_factory=list)
+
+    def push(self, match: MatchEntity) -> None:
+        """Push the match."""
+        self.probabilities.append(match.probability)
+
+        if match.probability < self.min_probability:
+            return
 
-        for entry in entries:
-            path = Path(entry.path)
+        item = (match.probability, _MatchRank(match.source, match.target), match)
 
-            if entry.is_file(follow_symlinks=False):
-                yield path
+        if self.top_k is None or len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, item)
+        else:
+            heapq.heappushpop(self._heap, item)
 
-            elif entry.is_dir(follow_symlinks=False):
-                async with aclosing(cls._iterate_over_files(path)) as files:
-                    async for file in files:
-                        yield file
+    def select(self) -> list[MatchEntity]:
+        """Get the selected matches (sorted by probability, descending)."""
+        return [match for _, _, match in sorted(self._heap, reverse=True)]
@@ -0,0 +1,32 @@
+import zipfile
+
+from collections.abc import Callable
+from pathlib import Path, PurePosixPath
+from typing import IO
+
+
+def extract_archive(file: IO[bytes], path: Path, is_ignorable: Callable[[str], bool]) -> None:
+    """Extract the *ZIP* archive, skipping the ignorable entries.
+
+    Notes
+    -----
+    * The top-level directory of the archive is never ignored;
+    * An entry is skipped if any of its nested path components is ignorable;
+    * The archive is extracted in full if nothing but the top-level directory is left.
+    """
+    with zipfile.ZipFile(file) as archive:
+        members = archive.infolist()
+        extracted = [member for member in members if not _is_skipped(member, is_ignorable)]
+
+        # The sealer refuses empty directories (e.g. no supported files), so keep it non-empty
+        if not any(PurePosixPath(member.filename).parts[1:] for member in extracted):
+            extracted = members
+
+        for member in extracted:
+            archive.extract(member, path)
+
+
+def _is_skipped(member: zipfile.ZipInfo, is_ignorable: Callable[[str], bool]) -> bool:
+    """Check if the entry is skipped while extracting."""
+    _, *parts = PurePosixPath(member.filename).parts
+    return any(is_ignorable(part) for part in parts)
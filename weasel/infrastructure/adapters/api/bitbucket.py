@@ -1,21 +1,26 @@
 import asyncio
+import re
 
 from collections.abc import Callable
-from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from typing import Any, ClassVar
 from urllib.parse import urljoin
 from uuid import UUID
 
-import aiofiles
-import aioshutil
-
-from aiohttp import ClientResponseError, ServerConnectionError
-from aiohttp.client import ClientSession
+from aiohttp import ClientResponseError, ClientTimeout, ServerConnectionError
 from aiostdlib import os
 
-from weasel.domain.services.exceptions import WeaselConnectionError, WeaselError
+from weasel.domain.services.exceptions import (
+    WeaselConnectionError,
+    WeaselError,
+    WeaselRateLimitError,
+)
+from weasel.infrastructure.adapters.api.archive import extract_archive
+from weasel.infrastructure.adapters.api.limiter import LimiterAdapter
 from weasel.infrastructure.adapters.api.retries import retry_api
+from weasel.infrastructure.adapters.api.session import SessionAdapter
 
 
 @dataclass
@@ -26,44 +31,139 @@ class BitbucketAPIAdapter:
     _connect_timeout: float
     _data_dir: Path
     _id_factory: Callable[[], UUID]
+    _is_ignorable: Callable[[str], bool]
+    _limiter: LimiterAdapter
+    _rest_url: str
+    _session: SessionAdapter
 
     _chunk_size: int = 1024 * 1024  # 1 MB
+    _spool_size: int = 16 * 1024 * 1024  # 16 MB
+
+    _headref: ClassVar[str] = "HEAD"
+    _sha_pattern: ClassVar[re.Pattern[str]] = re.compile(r"[a-f0-9]{40}")
 
     def __post_init__(self) -> None:
         """Initialize the object."""
         self._bitbucket_dir = self._data_dir / "bitbucket"
-        self._archive_dir = self._bitbucket_dir / "archive"
         self._extract_dir = self._bitbucket_dir / "extract"
 
     @retry_api
     async def download(self, user: str, repo: str, ref: str) -> Path:
-        """Clone the repository."""
+        """Clone the repository.
+
+        Notes
+        -----
+        * The archive is spooled in memory (up to `_spool_size`), then on disk;
+        * Only the files of the supported languages are extracted.
+        """
         path = f"/{user}/{repo}/get/{ref}.zip"
         url = urljoin(self._api_url, path)
 
         identifier = self._id_factory()
-        archive_path = self._archive_dir / identifier.hex
         extract_path = self._extract_dir / identifier.hex
 
-        await asyncio.gather(
-            os.makedirs(self._archive_dir, exist_ok=True),
-            os.makedirs(self._extract_dir, exist_ok=True),
+        await os.makedirs(extract_path, exist_ok=True)
+
+        with SpooledTemporaryFile(max_size=self._spool_size) as file:
+            await self._fetch(url, file, user, repo, ref)
+            await asyncio.to_thread(extract_archive, file, extract_path, self._is_ignorable)
+
+        paths = await os.listdir(extract_path)
+        return extract_path / paths[0]
+
+    @retry_api
+    async def resolve(self, user: str, repo: str, ref: str) -> str:
+        """Resolve the reference (e.g. `HEAD`, a branch or a tag) to a commit *SHA*.
+
+        Notes
+        -----
+        * `HEAD` is resolved through the main branch of the repository;
+        * Unexpected payloads (e.g. no main branch) raise `WeaselError`.
+        """
+        if ref == self._headref:
+            repository = await self._get_json(f"/2.0/repositories/{user}/{repo}", user, repo, ref)
+            mainbranch = repository.get("mainbranch") if isinstance(repository, dict) else None
+            name = mainbranch.get("name") if isinstance(mainbranch, dict) else None
+
+            if not isinstance(name, str) or not name:
+                detail = f"Bitbucket: '{user}/{repo}' has no main branch"
+                raise WeaselError(detail)
+
+            ref = name
+
+        commit = await self._get_json(
+            f"/2.0/repositories/{user}/{repo}/commit/{ref}", user, repo, ref
         )
+        sha = commit.get("hash") if isinstance(commit, dict) else None
+
+        if not isinstance(sha, str) or not self._sha_pattern.fullmatch(sha):
+            detail = f"Bitbucket: '{user}/{repo}@{ref}' was resolved to an invalid SHA"
+            raise WeaselError(detail)
+
+        return sha
+
+    async def _get_json(self, path: str, user: str, repo: str, ref: str) -> Any:  # noqa: ANN401
+        """Get the *JSON* response of the REST API."""
+        url = urljoin(self._rest_url, path)
 
         try:
             async with (
-                ClientSession(conn_timeout=self._connect_timeout) as session,
-                session.get(url, allow_redirects=True, raise_for_status=True) as response,
-                aiofiles.open(archive_path, mode="wb") as file,
+                self._limiter.limit(),
+                self._session.get_session().get(
+                    url,
+                    timeout=ClientTimeout(sock_connect=self._connect_timeout),
+                    raise_for_status=True,
+                ) as response,
             ):
+                self._limiter.observe(response.headers)
+                return await response.json()
+
+        except ServerConnectionError as exception:
+            detail = f"Bitbucket: connection failed while resolving '{user}/{repo}@{ref}'"
+            raise WeaselConnectionError(detail) from exception
+
+        except ClientResponseError as exception:
+            if self._limiter.is_rate_limited(exception.status, exception.headers):
+                detail = f"Bitbucket: the rate limit is exceeded for '{user}/{repo}@{ref}'"
+                raise WeaselRateLimitError(detail) from exception
+
+            detail = f"Bitbucket: '{user}/{repo}@{ref}' is private or does not exist"
+            raise FileNotFoundError(detail) from exception
+
+        except Exception as exception:
+            detail = f"Bitbucket: an error occurred while resolving '{user}/{repo}@{ref}'"
+            raise WeaselError(detail) from exception
+
+    async def _fetch(
+        self, url: str, file: SpooledTemporaryFile[bytes], user: str, repo: str, ref: str
+    ) -> None:
+        """Fetch the archive into the file."""
+        try:
+            async with (
+                self._limiter.limit(),
+                self._session.get_session().get(
+                    url,
+                    timeout=ClientTimeout(sock_connect=self._connect_timeout),
+                    allow_redirects=True,
+                    raise_for_status=True,
+                ) as response,
+            ):
+                # The rate limit headers are sent with the redirect to the archive
+                for hop in (*response.history, response):
+                    self._limiter.observe(hop.headers)
+
                 async for chunk in response.content.iter_chunked(self._chunk_size):
-                    await file.write(chunk)
+                    await asyncio.to_thread(file.write, chunk)
 
         except ServerConnectionError as exception:
             detail = f"Bitbucket: connection failed while downloading '{user}/{repo}@{ref}'"
             raise WeaselConnectionError(detail) from exception
 
         except ClientResponseError as exception:
+            if self._limiter.is_rate_limited(exception.status, exception.headers):
+                detail = f"Bitbucket: the rate limit is exceeded for '{user}/{repo}@{ref}'"
+                raise WeaselRateLimitError(detail) from exception
+
             detail = f"Bitbucket: '{user}/{repo}@{ref}' is private or does not exist"
             raise FileNotFoundError(detail) from exception
 
@@ -71,13 +171,4 @@ class BitbucketAPIAdapter:
             detail = f"Bitbucket: an error occurred while downloading '{user}/{repo}@{ref}'"
             raise WeaselError(detail) from exception
 
-        await aioshutil.unpack_archive(archive_path, extract_path, format="zip")
-
-        paths, _ = await asyncio.gather(os.listdir(extract_path), self._safe_unlink(archive_path))
-        return extract_path / paths[0]
-
-    @classmethod
-    async def _safe_unlink(cls, path: Path) -> None:
-        """Safely unlink a file."""
-        with suppress(OSError):
-            await os.unlink(path)
+        file.seek(0)
@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import ClassVar
+
+
+@dataclass
+class LimiterAdapter:
+    """The request limiter (per API).
+
+    Notes
+    -----
+    * No more than `_max_in_flight` requests are in flight at once;
+    * Requests are paced by a token bucket (`_rate` per second, up to `_burst` at once);
+    * All requests are paused once the API reports its rate limit (`Retry-After`, `X-RateLimit-*`);
+    * The primitives are recreated if the event loop has changed (the bucket is kept).
+    """
+
+    _burst: int
+    _max_in_flight: int
+    _rate: float
+
+    _limited_statuses: ClassVar[set[int]] = {HTTPStatus.FORBIDDEN, HTTPStatus.TOO_MANY_REQUESTS}
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._semaphore: asyncio.Semaphore | None = None
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        self._tokens = float(self._burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+
+    @asynccontextmanager
+    async def limit(self) -> AsyncIterator[None]:
+        """Wait for the turn of the request."""
+        semaphore, lock = self._get_primitives()
+
+        async with semaphore:
+            await self._take_token(lock)
+            yield
+
+    def observe(self, headers: Mapping[str, str] | None) -> None:
+        """Pause the requests if the API reports its rate limit."""
+        if headers and (delay := self._get_delay(headers)) is not None:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def is_rate_limited(self, status: int, headers: Mapping[str, str] | None) -> bool:
+        """Check if the response is rejected because of the rate limit.
+
+        Notes
+        -----
+        * The requests are paused if so.
+        """
+        if status not in self._limited_statuses or not headers:
+            return False
+
+        # Forbidden is also returned for private repositories
+        if (
+            status == HTTPStatus.FORBIDDEN
+            and "Retry-After" not in headers
+            and headers.get("X-RateLimit-Remaining") != "0"
+        ):
+            return False
+
+        self.observe(headers)
+        return True
+
+    def _get_primitives(self) -> tuple[asyncio.Semaphore, asyncio.Lock]:
+        """Get the semaphore and the lock (of the running event loop)."""
+        loop = asyncio.get_running_loop()
+
+        if self._semaphore is None or self._lock is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_in_flight)
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+        return self._semaphore, self._lock
+
+    async def _take_token(self, lock: asyncio.Lock) -> None:
+        """Take a token from the bucket (once available)."""
+        async with lock:
+            while True:
+                now = time.monotonic()
+
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                elapsed = now - self._updated_at
+                self._tokens = min(float(self._burst), self._tokens + elapsed * self._rate)
+                self._updated_at = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+    @classmethod
+    def _get_delay(cls, headers: Mapping[str, str]) -> float | None:
+        """Get the delay requested by the API (in seconds)."""
+        if (retry_after := headers.get("Retry-After")) is not None:
+            with suppress(ValueError):
+                return max(0.0, float(retry_after))
+
+            with suppress(TypeError, ValueError):
+                moment = parsedate_to_datetime(retry_after)
+                return max(0.0, (moment - datetime.now(UTC)).total_seconds())
+
+        if headers.get("X-RateLimit-Remaining") == "0":
+            with suppress(TypeError, ValueError):
+                return max(0.0, float(headers["X-RateLimit-Reset"]) - time.time())
+
+        return None
@@ -1,4 +1,4 @@
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from weasel.settings.retries import RetriesSettings
 
@@ -9,5 +9,5 @@ retry_api = retry(
     reraise=True,
     retry=retry_if_exception_type(ConnectionError),
     stop=stop_after_attempt(settings.attemps),
-    wait=wait_fixed(settings.delay),
+    wait=wait_random_exponential(multiplier=settings.delay, max=settings.max_delay),
 )
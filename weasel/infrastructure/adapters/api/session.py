@@ -0,0 +1,52 @@
+import asyncio
+
+from dataclasses import dataclass
+
+from aiohttp import TCPConnector
+from aiohttp.client import ClientSession
+
+
+@dataclass
+class SessionAdapter:
+    """The shared *HTTP* session adapter.
+
+    Notes
+    -----
+    * The session is created lazily, within the running event loop;
+    * The session is recreated if the event loop has changed or the session is closed;
+    * Connections are pooled and kept alive, DNS lookups are cached.
+    """
+
+    _dns_cache_ttl: int
+    _keepalive_timeout: float
+    _limit: int
+    _limit_per_host: int
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._session: ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get_session(self) -> ClientSession:
+        """Get the session."""
+        loop = asyncio.get_running_loop()
+
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                ttl_dns_cache=self._dns_cache_ttl,
+            )
+            self._session = ClientSession(connector=connector)
+            self._loop = loop
+
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session."""
+        if self._session is not None and self._loop is asyncio.get_running_loop():
+            await self._session.close()
+
+        self._session = None
+        self._loop = None
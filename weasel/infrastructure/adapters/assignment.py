@@ -0,0 +1,132 @@
+import asyncio
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from weasel.domain.services.interfaces.assignment import AssignmentInterface
+
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:  # pragma: no cover
+    linear_sum_assignment = None
+
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+@dataclass
+class AssignmentAdapter(AssignmentInterface):
+    """The assignment adapter.
+
+    Notes
+    -----
+    * `scipy` (Jonker-Volgenant, dense matrix) is used if installed;
+    * `numpy` (the same algorithm, vectorized per row) is used otherwise;
+    * Both backends break the ties identically, so the reports do not depend on `scipy`.
+    """
+
+    async def assign(self, weights: "NDArray[np.float64]") -> dict[int, int]:
+        """Find the maximum weight matching of rows and columns.
+
+        Notes
+        -----
+        * `weights` has a row per source and a column per target;
+        * The pairs with non-positive weights are never matched.
+        """
+        if not weights.size:
+            return {}
+
+        return await asyncio.to_thread(self._assign, weights)
+
+    @classmethod
+    def _assign(cls, weights: "NDArray[np.float64]") -> dict[int, int]:
+        """Find the maximum weight matching (synchronously)."""
+        if linear_sum_assignment is None:
+            assignment = cls._assign_with_numpy(weights)
+        else:
+            rows, columns = linear_sum_assignment(weights, maximize=True)
+            assignment = dict(zip(rows.tolist(), columns.tolist(), strict=True))
+
+        return {row: column for row, column in assignment.items() if weights[row, column] > 0}
+
+    @classmethod
+    def _assign_with_numpy(cls, weights: "NDArray[np.float64]") -> dict[int, int]:
+        """Find the maximum weight assignment using `numpy`.
+
+        Notes
+        -----
+        * Mirrors `scipy.optimize.linear_sum_assignment` (shortest augmenting paths);
+        * The columns are scanned in the same order, so the ties are broken the same way.
+        """
+        costs = -np.asarray(weights, dtype=np.float64)
+
+        if transposed := costs.shape[0] > costs.shape[1]:
+            costs = costs.T
+
+        row_count, column_count = costs.shape
+
+        row_duals = np.zeros(row_count)
+        column_duals = np.zeros(column_count)
+        column_for_row = np.full(row_count, -1)
+        row_for_column = np.full(column_count, -1)
+
+        for current_row in range(row_count):
+            path_costs = np.full(column_count, np.inf)
+            path = np.full(column_count, -1)
+            visited_rows = np.zeros(row_count, dtype=bool)
+            visited_columns = np.zeros(column_count, dtype=bool)
+            remaining = list(reversed(range(column_count)))
+
+            min_cost = 0.0
+            row = current_row
+            sink = -1
+
+            while sink == -1:
+                visited_rows[row] = True
+                columns = np.array(remaining)
+
+                reduced = min_cost + costs[row, columns] - row_duals[row] - column_duals[columns]
+                shorter = reduced < path_costs[columns]
+                path[columns[shorter]] = row
+                path_costs[columns[shorter]] = reduced[shorter]
+
+                candidates = path_costs[columns]
+                min_cost = candidates.min()
+
+                ties = np.flatnonzero(candidates == min_cost)
+                free = ties[row_for_column[columns[ties]] == -1]
+                index = int(free[-1]) if free.size else int(ties[0])
+
+                column = remaining[index]
+                if row_for_column[column] == -1:
+                    sink = column
+                else:
+                    row = row_for_column[column]
+
+                visited_columns[column] = True
+                remaining[index] = remaining[-1]
+                remaining.pop()
+
+            others = visited_rows.copy()
+            others[current_row] = False
+
+            row_duals[current_row] += min_cost
+            row_duals[others] += min_cost - path_costs[column_for_row[others]]
+            column_duals[visited_columns] -= min_cost - path_costs[visited_columns]
+
+            column = sink
+            while True:
+                row = path[column]
+                row_for_column[column] = row
+                column_for_row[row], column = column, column_for_row[row]
+                if row == current_row:
+                    break
+
+        if transposed:
+            return {int(row): column for column, row in enumerate(column_for_row.tolist())}
+
+        return dict(enumerate(column_for_row.tolist()))
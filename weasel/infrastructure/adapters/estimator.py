@@ -1,14 +1,20 @@
 import asyncio
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from rapidfuzz.distance.Levenshtein import normalized_similarity
+from rapidfuzz.process import cdist
 
 from weasel.domain.services.interfaces.estimator import EstimatorInterface
 
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from weasel.domain.dtypes.probability import Probability
 
 
@@ -17,6 +23,7 @@ class EstimatorAdapter(EstimatorInterface):
     """The estimator adapter."""
 
     _precision: int
+    _workers: int
 
     async def estimate(self, source: str, target: str) -> "Probability":
         """Estimate whether `source` is derived from `target`.
@@ -27,3 +34,33 @@ class EstimatorAdapter(EstimatorInterface):
         """
         probability = await asyncio.to_thread(normalized_similarity, source, target)
         return round(probability, self._precision)
+
+    async def estimate_many(self, sources: Sequence[str], target: str) -> list["Probability"]:
+        """Estimate whether each of `sources` is derived from `target`."""
+        matrix = await self.estimate_matrix(sources, [target])
+        return [probability for (probability,) in matrix.tolist()]
+
+    async def estimate_matrix(
+        self, sources: Sequence[str], targets: Sequence[str]
+    ) -> "NDArray[np.float64]":
+        """Estimate whether each of `sources` is derived from each of `targets`.
+
+        Notes
+        -----
+        * The matrix is computed by a single (multithreaded) `rapidfuzz` call;
+        * The probabilities are rounded the same way as by `estimate`.
+        """
+        if not sources or not targets:
+            return np.zeros((len(sources), len(targets)), dtype=np.float64)
+
+        matrix = await asyncio.to_thread(
+            cdist,
+            sources,
+            targets,
+            scorer=normalized_similarity,
+            dtype=np.float64,
+            workers=self._workers,
+        )
+
+        rounded = [[round(value, self._precision) for value in row] for row in matrix.tolist()]
+        return np.array(rounded, dtype=np.float64)
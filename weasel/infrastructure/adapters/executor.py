@@ -0,0 +1,224 @@
+import asyncio
+import multiprocessing
+import sys
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar
+
+from weasel.domain.services.interfaces.executor import ExecutorInterface
+
+
+if TYPE_CHECKING:
+    from weasel.domain.dtypes.probability import Probability
+    from weasel.domain.services.interfaces.estimator import EstimatorInterface
+    from weasel.domain.services.interfaces.language import LanguageInterface
+    from weasel.domain.services.interfaces.mutation_tree import MutationTreeInterface
+    from weasel.domain.types.language import LanguageType
+
+
+@dataclass
+class ExecutorAdapter(ExecutorInterface):
+    """The process pool executor.
+
+    Notes
+    -----
+    * Parsing and mutations are *CPU*-bound, so they are sent to worker processes;
+    * Worker processes are spawned on demand;
+    * The target-independent forms are cached within the worker processes (by digest).
+    """
+
+    _estimator: "EstimatorInterface"
+    _forms_size_limit: int
+    _languages: list["LanguageInterface"]
+    _max_workers: int
+    _mutation_trees: dict["LanguageType", "MutationTreeInterface"]
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._worker = ExecutorWorker(
+            _estimator=self._estimator,
+            _forms_size_limit=self._forms_size_limit,
+            _languages=self._languages,
+            _mutation_trees=self._mutation_trees,
+        )
+        self._pool: ProcessPoolExecutor | None = None
+
+    async def recognizes(self, language: "LanguageType", code: str) -> bool:
+        """Check if the code matches the language."""
+        if not self._max_workers:
+            return await self._worker.recognizes(language, code)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_pool(), ExecutorWorker.run_recognizes, language, code
+        )
+
+    async def match(
+        self,
+        language: "LanguageType",
+        source: str,
+        target: str,
+        digest: str,
+        score: "Probability | None" = None,
+    ) -> tuple["Probability", list[str]]:
+        """Match `source` and `target` and return the probability and the labels.
+
+        Notes
+        -----
+        * `digest` is the content digest of `source` (its target-independent forms are cached by);
+        * `score` is the estimate of the unmutated texts (if known).
+        """
+        if not self._max_workers:
+            return await self._worker.match(language, source, target, digest, score)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_pool(), ExecutorWorker.run_match, language, source, target, digest, score
+        )
+
+    async def close(self) -> None:
+        """Shut the worker processes down (if any).
+
+        Notes
+        -----
+        * The pool is spawned again on demand.
+        """
+        if self._pool is None:
+            return
+
+        pool, self._pool = self._pool, None
+        await asyncio.to_thread(pool.shutdown, cancel_futures=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool.
+
+        Notes
+        -----
+        * `spawn` is used, since forking a multi-threaded process may lead to deadlocks.
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self._worker.install,
+            )
+        return self._pool
+
+
+@dataclass
+class ExecutorWorker:
+    """The executor worker.
+
+    Notes
+    -----
+    * Consider this class as a private one;
+    * The worker is installed once per process;
+    * The least recently used forms are evicted when the size limit is exceeded.
+    """
+
+    _estimator: "EstimatorInterface"
+    _forms_size_limit: int
+    _languages: list["LanguageInterface"]
+    _mutation_trees: dict["LanguageType", "MutationTreeInterface"]
+
+    _installed: ClassVar["ExecutorWorker | None"] = None
+    _runner: ClassVar[asyncio.Runner | None] = None
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._forms: OrderedDict[tuple[LanguageType, str], dict[str, str]] = OrderedDict()
+        self._forms_size: int = 0
+
+    def install(self) -> None:
+        """Install the worker into the current process."""
+        ExecutorWorker._installed = self
+        ExecutorWorker._runner = asyncio.Runner()
+
+    @classmethod
+    def run_recognizes(cls, language: "LanguageType", code: str) -> bool:
+        """Run `recognizes` in the current process."""
+        worker, runner = cls._get_installed()
+        return runner.run(worker.recognizes(language, code))
+
+    @classmethod
+    def run_match(
+        cls,
+        language: "LanguageType",
+        source: str,
+        target: str,
+        digest: str,
+        score: "Probability | None",
+    ) -> tuple["Probability", list[str]]:
+        """Run `match` in the current process."""
+        worker, runner = cls._get_installed()
+        return runner.run(worker.match(language, source, target, digest, score))
+
+    async def recognizes(self, language: "LanguageType", code: str) -> bool:
+        """Check if the code matches the language."""
+        for candidate in self._languages:
+            if candidate.as_type() == language:
+                return await candidate.recognizes(code)
+
+        detail = f"The language is not supported ({language!r})"
+        raise ValueError(detail)
+
+    async def canonicalize(
+        self, language: "LanguageType", source: str, digest: str
+    ) -> dict[str, str]:
+        """Get the target-independent forms of `source` (by mutation label, memoized)."""
+        key = (language, digest)
+
+        if (forms := self._forms.get(key)) is not None:
+            self._forms.move_to_end(key)
+            return forms
+
+        mutation_tree = self._mutation_trees[language]
+        forms = await mutation_tree.canonicalize(source)
+        self._put_forms(key, forms)
+
+        return forms
+
+    async def match(
+        self,
+        language: "LanguageType",
+        source: str,
+        target: str,
+        digest: str,
+        score: "Probability | None" = None,
+    ) -> tuple["Probability", list[str]]:
+        """Match `source` and `target` and return the probability and the labels."""
+        forms = await self.canonicalize(language, source, digest)
+
+        mutation_tree = self._mutation_trees[language]
+        mutations = await mutation_tree.get_mutations(source, target, forms, score)
+
+        mutated = await mutation_tree.apply(source, target, mutations, forms)
+
+        probability = await self._estimator.estimate(mutated, target)
+        labels = [mutation.as_label() for mutation in mutations]
+
+        return probability, labels
+
+    def _put_forms(self, key: tuple["LanguageType", str], forms: dict[str, str]) -> None:
+        """Put the forms into the cache."""
+        size = sum(map(sys.getsizeof, forms.values()))
+
+        if size > self._forms_size_limit:
+            return
+
+        while self._forms and self._forms_size + size > self._forms_size_limit:
+            _, evicted = self._forms.popitem(last=False)
+            self._forms_size -= sum(map(sys.getsizeof, evicted.values()))
+
+        self._forms[key] = forms
+        self._forms_size += size
+
+    @classmethod
+    def _get_installed(cls) -> tuple["ExecutorWorker", asyncio.Runner]:
+        """Get the worker installed into the current process."""
+        if cls._installed is None or cls._runner is None:
+            detail = "The worker is not installed in this process"
+            raise RuntimeError(detail)
+        return cls._installed, cls._runner
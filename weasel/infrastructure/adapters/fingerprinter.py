@@ -0,0 +1,51 @@
+import asyncio
+import re
+import zlib
+
+from dataclasses import dataclass
+from typing import ClassVar
+
+from weasel.domain.services.interfaces.fingerprinter import FingerprinterInterface
+
+
+@dataclass
+class FingerprinterAdapter(FingerprinterInterface):
+    """The winnowing fingerprinter.
+
+    Notes
+    -----
+    * Words are lowercased, numbers are replaced with `0`;
+    * The k-grams of tokens are hashed with *CRC-32* (stable across processes);
+    * The minimal hash of each window is selected (*MOSS*-style).
+    """
+
+    _kgram_size: int
+    _window_size: int
+
+    _token_pattern: ClassVar[re.Pattern[str]] = re.compile(r"\w+|[^\w\s]")
+
+    async def fingerprint(self, text: str) -> frozenset[int]:
+        """Get the fingerprints of the text."""
+        return await asyncio.to_thread(self._winnow, text)
+
+    def _winnow(self, text: str) -> frozenset[int]:
+        """Get the fingerprints of the text (synchronously)."""
+        tokens = [self._normalize(token) for token in self._token_pattern.findall(text)]
+
+        hashes = [
+            zlib.crc32(" ".join(tokens[index : index + self._kgram_size]).encode())
+            for index in range(len(tokens) - self._kgram_size + 1)
+        ]
+
+        if len(hashes) <= self._window_size:
+            return frozenset(hashes)
+
+        return frozenset(
+            min(hashes[index : index + self._window_size])
+            for index in range(len(hashes) - self._window_size + 1)
+        )
+
+    @classmethod
+    def _normalize(cls, token: str) -> str:
+        """Normalize the token."""
+        return "0" if token[0].isdigit() else token.lower()
@@ -0,0 +1,78 @@
+import asyncio
+
+from collections import defaultdict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from itertools import combinations
+from typing import ClassVar
+
+import numpy as np
+
+from weasel.domain.services.interfaces.index import IndexInterface
+
+
+@dataclass
+class MinHashIndexAdapter(IndexInterface):
+    """The *MinHash* index.
+
+    Notes
+    -----
+    * Each key gets a signature of `bands * rows` minimal hashes;
+    * Keys sharing any band of the signature become candidates (*LSH*);
+    * Candidates below the estimated *Jaccard* similarity `threshold` are dropped.
+    """
+
+    _bands: int
+    _rows: int
+    _threshold: float
+
+    _prime: ClassVar[int] = (1 << 31) - 1
+    _seed: ClassVar[int] = 0
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        generator = np.random.default_rng(self._seed)
+        size = (self._bands * self._rows, 1)
+
+        self._a = generator.integers(1, self._prime, size=size, dtype=np.uint64)
+        self._b = generator.integers(0, self._prime, size=size, dtype=np.uint64)
+
+    async def find_candidates[T: Hashable](
+        self, fingerprints: dict[T, frozenset[int]]
+    ) -> set[tuple[T, T]]:
+        """Find the pairs of keys with similar fingerprints.
+
+        Notes
+        -----
+        * Pairs are ordered as the keys of `fingerprints`;
+        * Keys without fingerprints are never candidates.
+        """
+        return await asyncio.to_thread(self._find_candidates, fingerprints)
+
+    def _find_candidates[T: Hashable](
+        self, fingerprints: dict[T, frozenset[int]]
+    ) -> set[tuple[T, T]]:
+        """Find the pairs of keys with similar fingerprints (synchronously)."""
+        keys = [key for key, values in fingerprints.items() if values]
+        signatures = [self._sign(fingerprints[key]) for key in keys]
+
+        buckets: defaultdict[tuple[int, bytes], list[int]] = defaultdict(list)
+
+        for index, signature in enumerate(signatures):
+            for band in range(self._bands):
+                rows = signature[band * self._rows : (band + 1) * self._rows]
+                buckets[band, rows.tobytes()].append(index)
+
+        pairs = {pair for bucket in buckets.values() for pair in combinations(bucket, r=2)}
+
+        return {
+            (keys[index1], keys[index2])
+            for index1, index2 in pairs
+            if np.mean(signatures[index1] == signatures[index2]) >= self._threshold
+        }
+
+    def _sign(self, fingerprints: frozenset[int]) -> np.ndarray:
+        """Get the *MinHash* signature."""
+        values = np.fromiter(fingerprints, dtype=np.uint64, count=len(fingerprints))
+        hashes = (self._a * (values % self._prime) + self._b) % self._prime
+        return hashes.min(axis=1)
@@ -1,8 +1,11 @@
-import statistics
+import math
 
 from dataclasses import dataclass
-from functools import reduce
-from operator import mul
+from typing import ClassVar
+
+import numpy as np
+
+from numpy.typing import NDArray
 
 from weasel.domain.entities.metrics import MetricsEntity
 from weasel.domain.services.interfaces.metrics import MetricsInterface
@@ -10,104 +13,116 @@ from weasel.domain.services.interfaces.metrics import MetricsInterface
 
 @dataclass
 class MetricsAdapter(MetricsInterface):
-    """The metrics adapter."""
+    """The metrics adapter.
+
+    Notes
+    -----
+    * Probabilities are sorted once, all the metrics are calculated over the sorted array;
+    * Percentiles follow `statistics.quantiles` (the *exclusive* method, extrapolated).
+    """
 
     _precision: int
 
+    # The (numerator, denominator) pairs of p75, p90, p95 and p99.
+    _quantiles: ClassVar[NDArray[np.int64]] = np.array([[3, 4], [9, 10], [19, 20], [99, 100]])
+
     def calculate(self, probabilities: list[float]) -> "MetricsEntity":
         """Calculate metrics based on probabilities."""
+        if not probabilities:
+            return MetricsEntity(
+                nolie=0.0,
+                mean=0.0,
+                median=0.0,
+                min=0.0,
+                max=0.0,
+                var=0.0,
+                std=0.0,
+                p75=0.0,
+                p90=0.0,
+                p95=0.0,
+                p99=0.0,
+                count=0,
+            )
+
+        data = np.sort(np.asarray(probabilities, dtype=np.float64))
+
+        mean = math.fsum(probabilities) / len(probabilities)
+        var = self._calculate_var(data, mean)
+        p75, p90, p95, p99 = self._calculate_quantiles(data)
+
         return MetricsEntity(
-            nolie=self._calculate_nolie(probabilities),
-            mean=self._calculate_mean(probabilities),
-            median=self._calculate_median(probabilities),
-            min=self._calculate_min(probabilities),
-            max=self._calculate_max(probabilities),
-            var=self._calculate_var(probabilities),
-            std=self._calculate_std(probabilities),
-            p75=self._calculate_p75(probabilities),
-            p90=self._calculate_p90(probabilities),
-            p95=self._calculate_p95(probabilities),
-            p99=self._calculate_p99(probabilities),
+            nolie=self._round(self._calculate_nolie(data)),
+            mean=self._round(mean),
+            median=self._round(self._calculate_median(data)),
+            min=self._round(data[0]),
+            max=self._round(data[-1]),
+            var=self._round(var),
+            std=self._round(math.sqrt(var)),
+            p75=self._round(p75),
+            p90=self._round(p90),
+            p95=self._round(p95),
+            p99=self._round(p99),
             count=len(probabilities),
         )
 
-    def _calculate_mean(self, probabilities: list[float]) -> float:
-        """Calculate the mean."""
-        value = statistics.mean(probabilities) if probabilities else 0.0
-        return round(value, self._precision)
+    def _round(self, value: float) -> float:
+        """Round the value."""
+        return round(float(value), self._precision)
 
-    def _calculate_median(self, probabilities: list[float]) -> float:
+    @classmethod
+    def _calculate_median(cls, data: NDArray[np.float64]) -> float:
         """Calculate the median."""
-        value = statistics.median(probabilities) if probabilities else 0.0
-        return round(value, self._precision)
-
-    def _calculate_min(self, probabilities: list[float]) -> float:
-        """Calculate the minimum."""
-        value = min(probabilities) if probabilities else 0.0
-        return round(value, self._precision)
-
-    def _calculate_max(self, probabilities: list[float]) -> float:
-        """Calculate the maximum."""
-        value = max(probabilities) if probabilities else 0.0
-        return round(value, self._precision)
-
-    def _calculate_var(self, probabilities: list[float]) -> float:
-        """Calculate the variance."""
-        if len(probabilities) < 2:
-            return 0.0
+        middle = len(data) // 2
 
-        value = statistics.variance(probabilities)
-        return round(value, self._precision)
+        if len(data) % 2:
+            return float(data[middle])
 
-    def _calculate_std(self, probabilities: list[float]) -> float:
-        """Calculate the standard deviation."""
-        if len(probabilities) < 2:
+        return float((data[middle - 1] + data[middle]) / 2)
+
+    @classmethod
+    def _calculate_var(cls, data: NDArray[np.float64], mean: float) -> float:
+        """Calculate the variance (*ddof=1*)."""
+        if len(data) < 2:
             return 0.0
 
-        value = statistics.stdev(probabilities)
-        return round(value, self._precision)
+        deviations = data - mean
+        return math.fsum(deviations * deviations) / (len(data) - 1)
 
-    def _calculate_p75(self, probabilities: list[float]) -> float:
-        """Calculate the 75th percentile."""
-        value = statistics.quantiles(probabilities, n=4)[2] if probabilities else 0.0
-        return round(value, self._precision)
+    @classmethod
+    def _calculate_quantiles(cls, data: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Calculate the percentiles.
 
-    def _calculate_p90(self, probabilities: list[float]) -> float:
-        """Calculate the 90th percentile."""
-        if not probabilities:
-            return 0.0
-
-        intervals = statistics.quantiles(probabilities, n=10)
-        return round(intervals[8], self._precision)
+        Notes
+        -----
+        * `np.quantile(method="weibull")` clamps to the extremes, so the rule is applied directly.
+        """
+        size = len(data)
 
-    def _calculate_p95(self, probabilities: list[float]) -> float:
-        """Calculate the 95th percentile."""
-        if not probabilities:
-            return 0.0
+        if size == 1:
+            return np.full(len(cls._quantiles), data[0])
 
-        intervals = statistics.quantiles(probabilities, n=20)
-        return round(intervals[18], self._precision)
+        numerators, denominators = cls._quantiles.T
 
-    def _calculate_p99(self, probabilities: list[float]) -> float:
-        """Calculate the 99th percentile."""
-        if not probabilities:
-            return 0.0
+        positions = np.clip(numerators * (size + 1) // denominators, 1, size - 1)
+        deltas = numerators * (size + 1) - positions * denominators
 
-        intervals = statistics.quantiles(probabilities, n=100)
-        return round(intervals[98], self._precision)
+        lower, upper = data[positions - 1], data[positions]
+        return (lower * (denominators - deltas) + upper * deltas) / denominators
 
-    def _calculate_nolie(self, probabilities: list[float]) -> float:
-        """Calculate the *NO-LIE* metric."""
-        if not probabilities:
-            return 0.0
+    @classmethod
+    def _calculate_nolie(cls, data: NDArray[np.float64]) -> float:
+        """Calculate the *NO-LIE* metric.
 
-        if (maximum := max(probabilities)) < 0.5:
-            return round(maximum, self._precision)
+        Notes
+        -----
+        * Calculated in log space, so that long lists do not underflow.
+        """
+        if (maximum := float(data[-1])) < 0.5:
+            return maximum
 
-        plus = [proba for proba in probabilities if proba >= 0.5]
-        minus = [1.0 - proba for proba in plus]
+        plus = data[np.searchsorted(data, 0.5) :]
 
-        numerator = reduce(mul, plus)
-        denominator = numerator + reduce(mul, minus)
+        with np.errstate(divide="ignore"):
+            log_ratio = np.sum(np.log1p(-plus)) - np.sum(np.log(plus))
 
-        return round(numerator / denominator, self._precision)
+        return float(1.0 / (1.0 + np.exp(log_ratio)))
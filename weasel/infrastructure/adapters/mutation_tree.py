@@ -1,68 +1,297 @@
+import ast
 import asyncio
+import hashlib
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from heapq import nlargest
 from typing import TYPE_CHECKING
 
+from weasel.domain.services.interfaces.ast_mutation import ASTMutationInterface
 from weasel.domain.services.interfaces.mutation_tree import MutationTreeInterface
 
 
 if TYPE_CHECKING:
+    from weasel.domain.dtypes.probability import Probability
     from weasel.domain.services.interfaces.estimator import EstimatorInterface
     from weasel.domain.services.interfaces.mutation import MutationInterface
 
 
 @dataclass
 class MutationTreeAdapter(MutationTreeInterface):
-    """The greedy mutation tree."""
+    """The greedy mutation tree.
+
+    Notes
+    -----
+    * Mutated texts and scores are kept in a transposition table (LRU);
+    * Equal states reached by different branches are explored once;
+    * *AST* mutations share the parsed trees instead of parsing texts.
+    """
 
     _degree_of_freedom: int
     _depth: int
     _estimator: "EstimatorInterface"
     _mutations: list["MutationInterface"]
+    _table_size: int
     _tolerance: float
 
-    async def get_mutations(self, source: str, target: str) -> list["MutationInterface"]:
-        """Get the set of mutations required to convert `source` to `target`."""
-        score = await self._estimator.estimate(source, target)
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._table: OrderedDict[tuple[str, bytes, bytes], tuple[str, float]] = OrderedDict()
+
+    async def canonicalize(self, source: str) -> dict[str, str]:
+        """Get the target-independent forms of `source` (by mutation label).
+
+        Notes
+        -----
+        * The forms are computed once per file and reused by every comparison.
+        """
+        mutations = [mutation for mutation in self._mutations if mutation.is_target_independent()]
+        forms = await asyncio.gather(*(mutation.mutate(source, "") for mutation in mutations))
+        return {mutation.as_label(): form for mutation, form in zip(mutations, forms, strict=True)}
+
+    async def get_mutations(
+        self,
+        source: str,
+        target: str,
+        forms: dict[str, str] | None = None,
+        score: "Probability | None" = None,
+    ) -> list["MutationInterface"]:
+        """Get the set of mutations required to convert `source` to `target`.
+
+        Notes
+        -----
+        * `forms` are the target-independent forms of `source` (see `canonicalize`);
+        * `score` is the estimate of the unmutated texts (if known).
+        """
+        if score is None:
+            score = await self._estimator.estimate(source, target)
+
         options = DFSOptions(mutations=[], score=score)
-        optimum = await self._dfs(source, target, options)
+        context = self._build_context(source, target, forms)
+        optimum = await self._dfs(source, options, context)
         return optimum.mutations
 
-    async def _dfs(self, source: str, target: str, options: "DFSOptions") -> "DFSOptions":
-        """Perform a depth-first search."""
+    async def apply(
+        self,
+        source: str,
+        target: str,
+        mutations: list["MutationInterface"],
+        forms: dict[str, str] | None = None,
+    ) -> str:
+        """Apply `mutations` to `source` using `target` as the reference."""
+        context = self._build_context(source, target, forms)
+
+        for mutation in mutations:
+            digest = self._digest(source)
+            (transposition,) = await self._transpose_all(source, digest, [mutation], context)
+            source = transposition.mutated
+
+        return source
+
+    async def _dfs(
+        self,
+        source: str,
+        options: "DFSOptions",
+        context: "DFSContext",
+        tree: ast.Module | None = None,
+    ) -> "DFSOptions":
+        """Perform a depth-first search.
+
+        Notes
+        -----
+        * `tree` is the parsed `source` (if known).
+        """
         if options.depth == self._depth:
             return options
 
         if not self._degree_of_freedom:
             return options
 
-        coroutines = [self._compare(source, target, mutation) for mutation in self._mutations]
-        scores = await asyncio.gather(*coroutines)
+        digest = self._digest(source)
+        state = (digest, options.depth)
+
+        if (explored := context.explored.get(state)) is not None:
+            suffix, score = explored
+            return DFSOptions([*options.mutations, *suffix], score)
+
+        transpositions = await self._transpose_all(source, digest, self._mutations, context, tree)
 
         candidates = [
-            (mutation, score)
-            for mutation, score in zip(self._mutations, scores, strict=True)
-            if score > options.score + self._tolerance
+            (mutation, transposition)
+            for mutation, transposition in zip(self._mutations, transpositions, strict=True)
+            if transposition.score > options.score + self._tolerance
         ]
 
         optimums: list[DFSOptions] = []
 
-        for mutation, score in nlargest(self._degree_of_freedom, candidates, key=lambda p: p[1]):
-            mutated = await mutation.mutate(source, target)
-
+        for mutation, transposition in nlargest(
+            self._degree_of_freedom, candidates, key=lambda c: c[1].score
+        ):
             next_mutations = [*options.mutations, mutation]
-            next_options = DFSOptions(next_mutations, score)
+            next_options = DFSOptions(next_mutations, transposition.score)
 
-            optimum = await self._dfs(mutated, target, next_options)
+            optimum = await self._dfs(
+                transposition.mutated, next_options, context, transposition.tree
+            )
             optimums.append(optimum)
 
-        return max(optimums, key=lambda o: o.score, default=options)
+        optimum = max(optimums, key=lambda o: o.score, default=options)
+        context.explored[state] = (optimum.mutations[options.depth :], optimum.score)
+
+        return optimum
+
+    async def _transpose_all(
+        self,
+        source: str,
+        digest: bytes,
+        mutations: list["MutationInterface"],
+        context: "DFSContext",
+        tree: ast.Module | None = None,
+    ) -> list["Transposition"]:
+        """Mutate `source` with every mutation and estimate the results (memoized).
+
+        Notes
+        -----
+        * Text mutations are run concurrently;
+        * *AST* mutations are run sequentially, sharing the parsed `source`;
+        * `source` is parsed again only after a mutation consumes the tree;
+        * The mutated texts are estimated in a single batch.
+        """
+        transpositions: dict[int, Transposition] = {}
+
+        for index, mutation in enumerate(mutations):
+            key = (mutation.as_label(), digest, context.target_digest)
+
+            if (entry := self._table.get(key)) is not None:
+                self._table.move_to_end(key)
+                transpositions[index] = Transposition(*entry)
+
+        misses = [index for index in range(len(mutations)) if index not in transpositions]
+        holder = ASTHolder(source=source, tree=tree)
+
+        text_misses = [
+            index for index in misses if not isinstance(mutations[index], ASTMutationInterface)
+        ]
+        coroutines = [
+            self._mutate(source, digest, mutations[index], context) for index in text_misses
+        ]
+        results = dict(zip(text_misses, await asyncio.gather(*coroutines), strict=True))
+
+        for index in misses:
+            if index not in results:
+                results[index] = await self._mutate(
+                    source, digest, mutations[index], context, holder
+                )
+
+        mutated_texts = [results[index][0] for index in misses]
+        scores = await self._estimator.estimate_many(mutated_texts, context.target)
+
+        for index, score in zip(misses, scores, strict=True):
+            mutated, mutated_tree = results[index]
+            key = (mutations[index].as_label(), digest, context.target_digest)
+
+            self._table[key] = (mutated, score)
+            transpositions[index] = Transposition(mutated, score, mutated_tree)
+
+        while len(self._table) > self._table_size:
+            self._table.popitem(last=False)
+
+        return [transpositions[index] for index in range(len(mutations))]
+
+    async def _mutate(
+        self,
+        source: str,
+        digest: bytes,
+        mutation: "MutationInterface",
+        context: "DFSContext",
+        holder: "ASTHolder | None" = None,
+    ) -> tuple[str, ast.Module | None]:
+        """Mutate `source` using the target of `context` as the reference.
+
+        Notes
+        -----
+        * *AST* mutations use the parsed `source` from `holder` (if passed);
+        * The mutated tree is returned (if known).
+        """
+        form = context.forms.get(mutation.as_label()) if digest == context.forms_digest else None
+
+        if form is not None:
+            return form, None
+
+        if holder is None or not isinstance(mutation, ASTMutationInterface):
+            return await mutation.mutate(source, context.target), None
 
-    async def _compare(self, source: str, target: str, mutation: "MutationInterface") -> float:
-        """Compare `source` and `target` using `mutation`."""
-        mutated = await mutation.mutate(source, target)
-        return await self._estimator.estimate(mutated, target)
+        source_tree = holder.take()
+        tree = await mutation.mutate_ast(source_tree, context.get_target_tree())
+
+        if tree is None:
+            holder.put(source_tree)
+            return source, None
+
+        return ast.unparse(tree), tree
+
+    @classmethod
+    def _build_context(cls, source: str, target: str, forms: dict[str, str] | None) -> "DFSContext":
+        """Build the DFS context."""
+        return DFSContext(
+            target=target,
+            target_digest=cls._digest(target),
+            forms=forms or {},
+            forms_digest=cls._digest(source),
+        )
+
+    @classmethod
+    def _digest(cls, text: str) -> bytes:
+        """Get the text digest."""
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+@dataclass
+class ASTHolder:
+    """The holder of the parsed source.
+
+    Notes
+    -----
+    * Consider this class as a private one.
+    """
+
+    source: str
+    tree: ast.Module | None = None
+
+    def take(self) -> ast.Module:
+        """Take the tree (parsing `source` if needed)."""
+        tree, self.tree = self.tree, None
+        return tree if tree is not None else ast.parse(self.source)
+
+    def put(self, tree: ast.Module) -> None:
+        """Put the intact tree back."""
+        self.tree = tree
+
+
+@dataclass
+class DFSContext:
+    """The DFS context.
+
+    Notes
+    -----
+    * Consider this class as a private one.
+    """
+
+    target: str
+    target_digest: bytes
+    forms: dict[str, str]
+    forms_digest: bytes
+    explored: dict[tuple[bytes, int], tuple[list["MutationInterface"], float]] = field(
+        default_factory=dict
+    )
+    target_tree: ast.Module | None = None
+
+    def get_target_tree(self) -> ast.Module:
+        """Get the parsed target (parsed once)."""
+        if self.target_tree is None:
+            self.target_tree = ast.parse(self.target)
+        return self.target_tree
 
 
 @dataclass
@@ -81,3 +310,17 @@ class DFSOptions:
     def depth(self) -> int:
         """Get the depth."""
         return len(self.mutations)
+
+
+@dataclass
+class Transposition:
+    """The mutated source and its score.
+
+    Notes
+    -----
+    * Consider this class as a private one.
+    """
+
+    mutated: str
+    score: float
+    tree: ast.Module | None = None
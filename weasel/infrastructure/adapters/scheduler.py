@@ -0,0 +1,92 @@
+import asyncio
+
+from collections.abc import Coroutine, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from weasel.domain.services.interfaces.scheduler import SchedulerInterface
+
+
+@dataclass
+class SchedulerAdapter(SchedulerInterface):
+    """The bounded scheduler.
+
+    Notes
+    -----
+    * Coroutines are created lazily - no more than the limit allows;
+    * Matches share the global limit across all tasks and comparisons;
+    * The global semaphore is recreated if the event loop has changed.
+    """
+
+    _global_limit: int
+    _task_limit: int
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._global_semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def gather_comparisons[T](self, coroutines: Iterable[Coroutine[Any, Any, T]]) -> list[T]:
+        """Run the comparisons of a single task."""
+        semaphore = asyncio.Semaphore(self._task_limit)
+        return await self._gather(coroutines, semaphore)
+
+    async def gather_matches[T](self, coroutines: Iterable[Coroutine[Any, Any, T]]) -> list[T]:
+        """Run the matches of a single comparison."""
+        return await self._gather(coroutines, self._get_global_semaphore())
+
+    def _get_global_semaphore(self) -> asyncio.Semaphore:
+        """Get the global semaphore (of the running event loop)."""
+        loop = asyncio.get_running_loop()
+
+        if self._global_semaphore is None or self._loop is not loop:
+            self._global_semaphore = asyncio.Semaphore(self._global_limit)
+            self._loop = loop
+
+        return self._global_semaphore
+
+    @classmethod
+    async def _gather[T](
+        cls, coroutines: Iterable[Coroutine[Any, Any, T]], semaphore: asyncio.Semaphore
+    ) -> list[T]:
+        """Run the coroutines while the semaphore allows it.
+
+        Notes
+        -----
+        * The next coroutine is not created until the semaphore is acquired (backpressure);
+        * The order of the results is preserved;
+        * The first error is re-raised as is (not as an `ExceptionGroup`), the rest are cancelled.
+        """
+        iterator = iter(coroutines)
+        tasks: list[asyncio.Task[T]] = []
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                while True:
+                    await semaphore.acquire()
+
+                    try:
+                        coroutine = next(iterator)
+
+                    except StopIteration:
+                        semaphore.release()
+                        break
+
+                    task = group.create_task(coroutine)
+                    task.add_done_callback(lambda _: semaphore.release())
+                    tasks.append(task)
+
+        except BaseExceptionGroup as exceptions:
+            raise cls._get_first(exceptions) from None
+
+        return [task.result() for task in tasks]
+
+    @classmethod
+    def _get_first(cls, exceptions: BaseExceptionGroup) -> BaseException:
+        """Get the first underlying exception of the group."""
+        exception = exceptions.exceptions[0]
+
+        while isinstance(exception, BaseExceptionGroup):
+            exception = exception.exceptions[0]
+
+        return exception
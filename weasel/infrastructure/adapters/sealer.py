@@ -73,12 +73,12 @@ class SealerAdapter(SealerInterface):
 
     def _ignore(self, root: str, names: list[str]) -> set[str]:
         """Ignore specific patterns when copying trees."""
-        if self._is_ignorable(root):
+        if self.is_ignorable(root):
             return set()
-        return {name for name in names if self._is_ignorable(name)}
+        return {name for name in names if self.is_ignorable(name)}
 
-    def _is_ignorable(self, pathlike: str) -> bool:
-        """Ignore specific patterns when copying trees."""
+    def is_ignorable(self, pathlike: str) -> bool:
+        """Check if the file or directory is ignored while sealing."""
         path = Path(pathlike)
 
         # Considered as something private
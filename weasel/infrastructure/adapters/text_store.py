@@ -0,0 +1,89 @@
+import asyncio
+import hashlib
+import sys
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ClassVar
+
+from weasel.domain.entities.text import TextEntity
+from weasel.domain.services.interfaces.text_store import TextStoreInterface
+
+
+@dataclass
+class TextStoreAdapter(TextStoreInterface):
+    """The in-memory text store.
+
+    Notes
+    -----
+    * Texts are addressed by the content digest, so equal files are stored once;
+    * The least recently used texts are evicted when the size limit is exceeded;
+    * Concurrent reads of the same file are served by a single read.
+    """
+
+    _size_limit: int
+
+    _encoding: ClassVar[str] = "utf-8"
+    _errors: ClassVar[str] = "replace"
+
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._digests: dict[Path, str] = {}
+        self._texts: OrderedDict[str, str] = OrderedDict()
+        self._size: int = 0
+        self._pending: dict[Path, asyncio.Task[TextEntity]] = {}
+
+    async def read(self, path: Path) -> "TextEntity":
+        """Read the file."""
+        if (digest := self._digests.get(path)) and (text := self._texts.get(digest)) is not None:
+            self._texts.move_to_end(digest)
+            return TextEntity(digest=digest, text=text)
+
+        if (task := self._pending.get(path)) is None:
+            task = asyncio.create_task(self._load(path))
+            task.add_done_callback(lambda _: self._pending.pop(path, None))
+            self._pending[path] = task
+
+        return await asyncio.shield(task)
+
+    async def clean(self) -> None:
+        """Clean the store."""
+        self._digests.clear()
+        self._texts.clear()
+        self._size = 0
+
+    async def _load(self, path: Path) -> "TextEntity":
+        """Load the file into the store."""
+        entity = await asyncio.to_thread(self._read_file, path)
+
+        self._digests[path] = entity.digest
+        self._put(entity.digest, entity.text)
+
+        return entity
+
+    def _put(self, digest: str, text: str) -> None:
+        """Put the text into the store."""
+        if digest in self._texts:
+            self._texts.move_to_end(digest)
+            return
+
+        size = sys.getsizeof(text)
+
+        if size > self._size_limit:
+            return
+
+        while self._texts and self._size + size > self._size_limit:
+            _, evicted = self._texts.popitem(last=False)
+            self._size -= sys.getsizeof(evicted)
+
+        self._texts[digest] = text
+        self._size += size
+
+    @classmethod
+    def _read_file(cls, path: Path) -> "TextEntity":
+        """Read and decode the file."""
+        data = path.read_bytes()
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        text = data.decode(cls._encoding, cls._errors)
+        return TextEntity(digest=digest, text=text)
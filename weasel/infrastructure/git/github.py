@@ -1,3 +1,5 @@
+import asyncio
+
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
@@ -5,7 +7,7 @@ from typing import TYPE_CHECKING, ClassVar
 
 from aiostdlib import os
 
-from weasel.domain.services.exceptions import WeaselCacheError
+from weasel.domain.services.exceptions import WeaselCacheError, WeaselError
 from weasel.domain.services.interfaces.git import GitInterface
 
 
@@ -24,6 +26,10 @@ class GitHubAdapter(GitInterface):
     _bucket: ClassVar[str] = "github"
     _headref: ClassVar[str] = "HEAD"
 
+    def __post_init__(self) -> None:
+        """Initialize the object."""
+        self._clones: dict[str, asyncio.Task[Path]] = {}
+
     async def clone(
         self,
         user: str,
@@ -33,10 +39,30 @@ class GitHubAdapter(GitInterface):
         commit: str | None = None,
         tag: str | None = None,
     ) -> Path:
-        """Clone the repository."""
+        """Clone the repository.
+
+        Notes
+        -----
+        * `HEAD`, branches and tags are resolved to commit *SHA*s (if possible) to be cached;
+        * Concurrent clones of the same reference share a single resolution and download.
+        """
         ref = commit or branch or tag or self._headref
         key = self._build_key(user, repo, ref)
 
+        if (task := self._clones.get(key)) is None:
+            task = asyncio.create_task(self._clone(user, repo, ref, resolve=commit is None))
+            task.add_done_callback(lambda _: self._clones.pop(key, None))
+            self._clones[key] = task
+
+        return await asyncio.shield(task)
+
+    async def _clone(self, user: str, repo: str, ref: str, *, resolve: bool) -> Path:
+        """Clone the repository (unless cached)."""
+        if resolve and (sha := await self._maybe_resolve(user, repo, ref)):
+            ref = sha
+
+        key = self._build_key(user, repo, ref)
+
         if ref != self._headref and (cached := await self._maybe_from_cache(key)):
             return cached
 
@@ -47,6 +73,13 @@ class GitHubAdapter(GitInterface):
 
         return path
 
+    async def _maybe_resolve(self, user: str, repo: str, ref: str) -> str | None:
+        """Resolve the reference to a commit *SHA* if possible."""
+        try:
+            return await self._github.resolve(user, repo, ref)
+        except (OSError, WeaselError):
+            return None
+
     async def _maybe_from_cache(self, key: str) -> Path | None:
         """Get the repository from the cache if exists."""
         try:
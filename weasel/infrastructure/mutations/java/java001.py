@@ -25,3 +25,8 @@ class JavaMutation(MutationInterface):
     def as_label(cls) -> str:
         """Return the mutation label."""
         return "JAVA001"
+
+    @classmethod
+    def is_target_independent(cls) -> bool:
+        """Check whether the mutation ignores `target`."""
+        return True
@@ -2,11 +2,12 @@ import ast
 
 from dataclasses import dataclass
 
+from weasel.domain.services.interfaces.ast_mutation import ASTMutationInterface
 from weasel.domain.services.interfaces.mutation import MutationInterface
 
 
 @dataclass
-class PythonMutation(MutationInterface):
+class PythonMutation(MutationInterface, ASTMutationInterface):
     """The *Python* mutation (`PY001`).
 
     Features
@@ -21,7 +22,22 @@ class PythonMutation(MutationInterface):
         """Mutate `source` using `target` as the reference."""
         return ast.unparse(ast.parse(source))
 
+    @classmethod
+    async def mutate_ast(cls, source: ast.Module, _target: ast.Module) -> ast.Module | None:
+        """Mutate `source` using `target` as the reference.
+
+        Notes
+        -----
+        * The tree itself is kept, the formatting is applied by `ast.unparse`.
+        """
+        return source
+
     @classmethod
     def as_label(cls) -> str:
         """Return the mutation label."""
         return "PY001"
+
+    @classmethod
+    def is_target_independent(cls) -> bool:
+        """Check whether the mutation ignores `target`."""
+        return True
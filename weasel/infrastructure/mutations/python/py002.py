@@ -2,11 +2,12 @@ import ast
 
 from dataclasses import dataclass
 
+from weasel.domain.services.interfaces.ast_mutation import ASTMutationInterface
 from weasel.domain.services.interfaces.mutation import MutationInterface
 
 
 @dataclass
-class PythonMutation(MutationInterface):
+class PythonMutation(MutationInterface, ASTMutationInterface):
     """The *Python* mutation (`PY002`).
 
     Features
@@ -17,22 +18,35 @@ class PythonMutation(MutationInterface):
     @classmethod
     async def mutate(cls, source: str, _target: str) -> str:
         """Mutate `source` using `target` as the reference."""
-        tree = ast.parse(source)
+        tree = cls._transform(ast.parse(source))
+        return ast.unparse(tree) if tree is not None else source
 
-        transformer = PythonTransformer()
-        tree = transformer.visit(tree)
-
-        if not transformer.is_triggered():
-            return source
-
-        tree = ast.fix_missing_locations(tree)
-        return ast.unparse(tree)
+    @classmethod
+    async def mutate_ast(cls, source: ast.Module, _target: ast.Module) -> ast.Module | None:
+        """Mutate `source` using `target` as the reference."""
+        return cls._transform(source)
 
     @classmethod
     def as_label(cls) -> str:
         """Return the mutation label."""
         return "PY002"
 
+    @classmethod
+    def is_target_independent(cls) -> bool:
+        """Check whether the mutation ignores `target`."""
+        return True
+
+    @classmethod
+    def _transform(cls, tree: ast.Module) -> ast.Module | None:
+        """Transform the tree (if triggered)."""
+        transformer = PythonTransformer()
+        tree = transformer.visit(tree)
+
+        if not transformer.is_triggered():
+            return None
+
+        return ast.fix_missing_locations(tree)
+
 
 @dataclass
 class PythonTransformer(ast.NodeTransformer):
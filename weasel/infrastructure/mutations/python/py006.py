@@ -3,18 +3,17 @@ import ast
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from networkx.algorithms.matching import max_weight_matching
-from networkx.classes import Graph
-
+from weasel.domain.services.interfaces.ast_mutation import ASTMutationInterface
 from weasel.domain.services.interfaces.mutation import MutationInterface
 
 
 if TYPE_CHECKING:
+    from weasel.domain.services.interfaces.assignment import AssignmentInterface
     from weasel.domain.services.interfaces.estimator import EstimatorInterface
 
 
 @dataclass
-class PythonMutation(MutationInterface):
+class PythonMutation(MutationInterface, ASTMutationInterface):
     """The *Python* mutation (`PY006`).
 
     Features
@@ -27,21 +26,23 @@ class PythonMutation(MutationInterface):
     * The Bubble-Down strategy is used.
     """
 
+    _assignment: "AssignmentInterface"
     _estimator: "EstimatorInterface"
 
     async def mutate(self, source: str, target: str) -> str:
         """Mutate `source` using `target` as the reference."""
-        source_tree = ast.parse(source)
-        target_tree = ast.parse(target)
+        tree = await self.mutate_ast(ast.parse(source), ast.parse(target))
+        return ast.unparse(tree) if tree is not None else source
 
-        reorderer = PythonReorderer(_estimator=self._estimator)
-        tree = await reorderer.reorder_tree(source_tree, target_tree)
+    async def mutate_ast(self, source: ast.Module, target: ast.Module) -> ast.Module | None:
+        """Mutate `source` using `target` as the reference."""
+        reorderer = PythonReorderer(_assignment=self._assignment, _estimator=self._estimator)
+        tree = await reorderer.reorder_tree(source, target)
 
         if not reorderer.is_triggered():
-            return source
+            return None
 
-        tree = ast.fix_missing_locations(tree)
-        return ast.unparse(tree)
+        return ast.fix_missing_locations(tree)
 
     @classmethod
     def as_label(cls) -> str:
@@ -58,6 +59,7 @@ class PythonReorderer:
     * Consider this class as a private one.
     """
 
+    _assignment: "AssignmentInterface"
     _estimator: "EstimatorInterface"
 
     def __post_init__(self) -> None:
@@ -78,10 +80,10 @@ class PythonReorderer:
         if not (source_blocks := self._split_into_blocks(source)):
             return []
 
-        if not (target_blocks := self._split_into_blocks(target)):
-            return source
+        target_blocks = self._split_into_blocks(target)
 
-        matchings = await self._match_blocks(source_blocks, target_blocks)
+        if not (matchings := await self._match_blocks(source_blocks, target_blocks)):
+            return source
 
         blocks: list[ast.AST | list[ast.AST]] = [[]] * len(source_blocks)
 
@@ -140,18 +142,23 @@ class PythonReorderer:
     async def _match_blocks(
         self, source: list[ast.AST | list[ast.AST]], target: list[ast.AST | list[ast.AST]]
     ) -> dict[int, int]:
-        """Match `source` and `target` blocks."""
-        graph = Graph()
+        """Match `source` and `target` blocks.
+
+        Notes
+        -----
+        * The blocks are estimated in a single batch;
+        * The pairs of classes are re-estimated after the reordering.
+        """
+        source_texts = [ast.unparse(block) for block in source]
+        target_texts = [ast.unparse(block) for block in target]
+        weights = await self._estimator.estimate_matrix(source_texts, target_texts)
 
         for index1, block1 in enumerate(source):
-            for index2, block2 in enumerate(target, start=len(source)):
-                weight = await self._compare_two_blocks(block1, block2)
-                graph.add_edge(index1, index2, weight=weight)
-
-        return {
-            min(index1, index2): max(index1, index2) - len(source)
-            for (index1, index2) in max_weight_matching(graph)
-        }
+            for index2, block2 in enumerate(target):
+                if isinstance(block1, ast.ClassDef) and isinstance(block2, ast.ClassDef):
+                    weights[index1, index2] = await self._compare_two_blocks(block1, block2)
+
+        return await self._assignment.assign(weights)
 
     @classmethod
     def _split_into_blocks(cls, source: list[ast.AST]) -> list[ast.AST | list[ast.AST]]:
@@ -41,3 +41,8 @@ class SQLMutation(MutationInterface):
     def as_label(cls) -> str:
         """Return the mutation label."""
         return "SQL001"
+
+    @classmethod
+    def is_target_independent(cls) -> bool:
+        """Check whether the mutation ignores `target`."""
+        return True
@@ -3,14 +3,13 @@ import asyncio
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from networkx.algorithms.matching import max_weight_matching
-from networkx.classes import Graph
 from sqlglot import parse
 
 from weasel.domain.services.interfaces.mutation import MutationInterface
 
 
 if TYPE_CHECKING:
+    from weasel.domain.services.interfaces.assignment import AssignmentInterface
     from weasel.domain.services.interfaces.estimator import EstimatorInterface
 
 
@@ -28,6 +27,7 @@ class SQLMutation(MutationInterface):
     * The Bubble-Down strategy is used.
     """
 
+    _assignment: "AssignmentInterface"
     _estimator: "EstimatorInterface"
 
     async def mutate(self, source: str, target: str) -> str:
@@ -47,7 +47,8 @@ class SQLMutation(MutationInterface):
         if not source_blocks or not target_blocks:
             return source
 
-        matchings = await self._match_blocks(source_blocks, target_blocks)
+        if not (matchings := await self._match_blocks(source_blocks, target_blocks)):
+            return source
 
         blocks: list[str] = [""] * len(source_blocks)
 
@@ -75,18 +76,14 @@ class SQLMutation(MutationInterface):
         return ";\n".join(blocks) + ";"
 
     async def _match_blocks(self, source: list[str], target: list[str]) -> dict[int, int]:
-        """Match `source` and `target` blocks."""
-        graph = Graph()
-
-        for index1, block1 in enumerate(source):
-            for index2, block2 in enumerate(target, start=len(source)):
-                weight = await self._estimator.estimate(block1, block2)
-                graph.add_edge(index1, index2, weight=weight)
-
-        return {
-            min(index1, index2): max(index1, index2) - len(source)
-            for (index1, index2) in max_weight_matching(graph)
-        }
+        """Match `source` and `target` blocks.
+
+        Notes
+        -----
+        * The blocks are estimated in a single batch.
+        """
+        weights = await self._estimator.estimate_matrix(source, target)
+        return await self._assignment.assign(weights)
 
     @classmethod
     def as_label(cls) -> str:
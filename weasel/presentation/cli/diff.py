@@ -11,6 +11,7 @@ import click
 
 from weasel.container import WEASEL_CONTAINER
 from weasel.domain.services.interfaces.mutation import MutationInterface
+from weasel.presentation.cli.scan import run_closing
 
 
 ENCODING: Final[str] = "utf-8"
@@ -39,7 +40,7 @@ def diff(source: str | PathLike[str], target: str | PathLike[str]) -> None:
         raise click.UsageError(detail)
 
     coroutine = matcher_service.maybe_match(source, target)
-    maybe_match = asyncio.run(coroutine)
+    maybe_match = asyncio.run(run_closing(coroutine))
 
     if maybe_match is None:
         detail = f"'{source}' and '{target}' seem to be different languages (or empty)..."
@@ -1,31 +1,54 @@
 import asyncio
+import json
 import sys
 
+from collections.abc import Awaitable, Callable, Coroutine
 from datetime import UTC, datetime
+from functools import partial
 from os import PathLike
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from typing import Any, TextIO
 
 import click
 
 from pydantic import ValidationError
 
 from weasel.container import WEASEL_CONTAINER
+from weasel.domain.entities.comparison import ComparisonEntity
 from weasel.domain.entities.contest import ContestEntity
+from weasel.domain.entities.report import ReportEntity
 
 
 @click.command()
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Reuse comparisons from a JSON(L) report.",
+)
 @click.option("--from-json", type=click.Path(exists=True, dir_okay=False), help="Load from JSON.")
 @click.option("--from-toml", type=click.Path(exists=True, dir_okay=False), help="Load from TOML.")
 @click.option("--from-yaml", type=click.Path(exists=True, dir_okay=False), help="Load from YAML.")
+@click.option(
+    "--min-probability",
+    type=click.FloatRange(0.0, 1.0),
+    default=0.0,
+    help="Drop less probable matches.",
+)
+@click.option("--top-k-matches", type=click.IntRange(min=1), help="Keep the most probable matches.")
 @click.option("--to-json", help="Write to JSON.")
+@click.option("--to-jsonl", help="Stream to JSON Lines.")
 @click.option("--to-toml", help="Write to TOML.")
 @click.option("--to-yaml", help="Write to YAML.")
 def scan(  # noqa: C901, PLR0912, PLR0913, PLR0915
+    baseline: str | PathLike[str] | None = None,
     from_json: str | PathLike[str] | None = None,
     from_toml: str | PathLike[str] | None = None,
     from_yaml: str | PathLike[str] | None = None,
+    min_probability: float = 0.0,
+    top_k_matches: int | None = None,
     to_json: str | PathLike[str] | None = None,
+    to_jsonl: str | PathLike[str] | None = None,
     to_toml: str | PathLike[str] | None = None,
     to_yaml: str | PathLike[str] | None = None,
 ) -> None:
@@ -36,7 +59,7 @@ def scan(  # noqa: C901, PLR0912, PLR0913, PLR0915
     from_files = [from_json, from_toml, from_yaml]
     from_files_count = sum(map(bool, from_files))
 
-    to_files = [to_json, to_toml, to_yaml]
+    to_files = [to_json, to_jsonl, to_toml, to_yaml]
     to_files_count = sum(map(bool, to_files))
 
     if not from_files_count:
@@ -51,6 +74,10 @@ def scan(  # noqa: C901, PLR0912, PLR0913, PLR0915
         detail = "The output file(s) is not provided (--to-*)."
         raise click.UsageError(detail)
 
+    if to_jsonl and to_files_count > 1:
+        detail = "The streamed output cannot be combined with other output files (--to-*)."
+        raise click.UsageError(detail)
+
     try:
         if from_json:
             contest = ContestEntity.from_json(Path(from_json))
@@ -67,6 +94,17 @@ def scan(  # noqa: C901, PLR0912, PLR0913, PLR0915
         detail = f"An unexpected error occurred while loading the contest file: {exception}"
         raise click.UsageError(detail) from exception
 
+    try:
+        baseline_report = load_baseline(Path(baseline)) if baseline else None
+
+    except ValidationError as exception:
+        detail = f"The baseline file seems to be broken:\n\n{exception}"
+        raise click.UsageError(detail) from exception
+
+    except Exception as exception:
+        detail = f"An unexpected error occurred while loading the baseline file: {exception}"
+        raise click.UsageError(detail) from exception
+
     title = f"{service_settings.name} {service_settings.version}"
 
     click.echo(title)
@@ -84,8 +122,26 @@ def scan(  # noqa: C901, PLR0912, PLR0913, PLR0915
     click.echo()
 
     try:
-        coroutine = scanner_service.scan(contest)
-        report = asyncio.run(coroutine)
+        if to_jsonl:
+            scan_with_sink = partial(
+                scanner_service.scan,
+                contest,
+                baseline_report,
+                min_probability=min_probability,
+                top_k_matches=top_k_matches,
+                with_digests=True,
+            )
+            asyncio.run(run_closing(stream_jsonl(scan_with_sink, Path(to_jsonl))))
+
+        else:
+            coroutine = scanner_service.scan(
+                contest,
+                baseline_report,
+                min_probability=min_probability,
+                top_k_matches=top_k_matches,
+                with_digests=bool(to_json),
+            )
+            report = asyncio.run(run_closing(coroutine))
 
     except Exception as exception:  # noqa: BLE001
         click.echo(f"Error: {exception}")
@@ -100,6 +156,9 @@ def scan(  # noqa: C901, PLR0912, PLR0913, PLR0915
 
     is_backup_used = False
 
+    if to_jsonl:
+        click.echo(f"- jsonl:    {Path(to_jsonl)}")
+
     try:
         if to_json:
             path = Path(to_json)
@@ -128,6 +187,53 @@ def scan(  # noqa: C901, PLR0912, PLR0913, PLR0915
         click.echo("The output file(s) could not be written - the backup is provided.")
 
 
+async def run_closing[T](coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run the coroutine, then close the shared *HTTP* session and the process pool."""
+    try:
+        return await coroutine
+    finally:
+        await WEASEL_CONTAINER.session_adapter().close()
+        await WEASEL_CONTAINER.executor_adapter().close()
+
+
+async def stream_jsonl(
+    scan: Callable[[Callable[[str, ComparisonEntity], Awaitable[None]]], Awaitable[ReportEntity]],
+    path: Path,
+    encoding: str = "utf-8",
+) -> None:
+    """Stream the comparisons as *JSON Lines*.
+
+    Notes
+    -----
+    * The comparisons are written as soon as they are finished (`scan` passes them to the sink);
+    * The rest of each review (e.g. the digests) is written after the scan (for `--baseline`).
+    """
+    with path.open(mode="w", encoding=encoding) as file:
+
+        async def sink(name: str, comparison: ComparisonEntity) -> None:
+            write_jsonl(file, {"comparison": comparison.model_dump(mode="json"), "task": name})
+
+        report = await scan(sink)
+
+        for review in report.reviews:
+            data = review.model_dump(mode="json", exclude={"comparisons", "name"})
+            write_jsonl(file, {**data, "task": review.name})
+
+
+def write_jsonl(file: TextIO, data: dict[str, Any]) -> None:
+    """Write the line of *JSON Lines*."""
+    file.write(json.dumps(data, sort_keys=True) + "\n")
+    file.flush()
+
+
+def load_baseline(path: Path) -> ReportEntity:
+    """Load the baseline report (*JSON Lines* if suffixed so, *JSON* otherwise)."""
+    if path.suffix == ".jsonl":
+        return ReportEntity.from_jsonl(path)
+
+    return ReportEntity.from_json(path)
+
+
 def isoformat() -> str:
     """Return the current time in ISO format."""
     return datetime.now(UTC).isoformat(sep=" ", timespec="milliseconds")
@@ -13,6 +13,11 @@ class CacheSettings(BaseModel):
     # The cache size limit (bytes).
     size_limit: NonNegativeInt = 256 * 1024 * 1024  # 256 MB
 
+    # Whether to persist the match results.
+    persist_matches: bool = True
+    # Whether to persist the language recognitions.
+    persist_recognitions: bool = True
+
     @property
     def uri(self) -> str:
         """Get the URI."""
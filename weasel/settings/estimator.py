@@ -0,0 +1,10 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class EstimatorSettings(BaseModel):
+    """The estimator settings."""
+
+    # The number of threads per batch (`-1` - all cores).
+    workers: Annotated[int, Field(ge=-1)] = 1
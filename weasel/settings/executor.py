@@ -0,0 +1,13 @@
+import os
+
+from pydantic import BaseModel, Field, NonNegativeInt
+
+
+class ExecutorSettings(BaseModel):
+    """The executor settings."""
+
+    # The number of worker processes (`0` - run in the event loop).
+    max_workers: NonNegativeInt = Field(default_factory=lambda: os.cpu_count() or 1)
+
+    # The size limit of the cached canonical forms per worker process (bytes).
+    forms_size_limit: NonNegativeInt = 64 * 1024 * 1024  # 64 MB
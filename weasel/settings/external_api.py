@@ -1,4 +1,4 @@
-from pydantic import BaseModel, NonNegativeFloat
+from pydantic import BaseModel, NonNegativeFloat, NonNegativeInt, PositiveFloat, PositiveInt
 
 
 class ExternalAPISettings(BaseModel):
@@ -6,10 +6,33 @@ class ExternalAPISettings(BaseModel):
 
     # The Bitbucket API URL.
     bitbucket_api_url: str = "https://bitbucket.org/"
+    # The Bitbucket REST API URL (used to resolve references).
+    bitbucket_rest_url: str = "https://api.bitbucket.org/"
     # The Bitbucket API connect timeout.
     bitbucket_connect_timeout: NonNegativeFloat = 5.0
+    # The maximum number of Bitbucket API requests in flight.
+    bitbucket_max_in_flight: PositiveInt = 8
+    # The number of Bitbucket API requests per second.
+    bitbucket_rate: PositiveFloat = 5.0
+    # The maximum burst of Bitbucket API requests.
+    bitbucket_burst: PositiveInt = 10
 
     # The GitHub API URL.
     github_api_url: str = "https://api.github.com/"
     # The GitHub API connect timeout.
     github_connect_timeout: NonNegativeFloat = 5.0
+    # The maximum number of GitHub API requests in flight.
+    github_max_in_flight: PositiveInt = 8
+    # The number of GitHub API requests per second.
+    github_rate: PositiveFloat = 5.0
+    # The maximum burst of GitHub API requests.
+    github_burst: PositiveInt = 10
+
+    # The maximum number of simultaneous connections (0 - unlimited).
+    connection_limit: NonNegativeInt = 100
+    # The maximum number of simultaneous connections per host (0 - unlimited).
+    connection_limit_per_host: NonNegativeInt = 10
+    # The time to keep the idle connections alive.
+    keepalive_timeout: NonNegativeFloat = 30.0
+    # The time to cache the DNS lookups (in seconds).
+    dns_cache_ttl: NonNegativeInt = 300
@@ -0,0 +1,15 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field, PositiveInt
+
+
+class FingerprintSettings(BaseModel):
+    """The fingerprint settings."""
+
+    # The number of tokens per k-gram.
+    kgram_size: PositiveInt = 5
+    # The number of k-grams per window.
+    window_size: PositiveInt = 4
+
+    # The fingerprint overlap below which files are estimated without mutations.
+    threshold: Annotated[float, Field(ge=0.0, le=1.0)] = 0.0
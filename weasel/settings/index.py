@@ -0,0 +1,17 @@
+from typing import Annotated
+
+from pydantic import BaseModel, Field, PositiveInt
+
+
+class IndexSettings(BaseModel):
+    """The candidate index settings."""
+
+    # Whether to compare only the candidate files and submissions.
+    enabled: bool = False
+
+    # The number of LSH bands (more bands - higher recall).
+    bands: PositiveInt = 32
+    # The number of rows per band (more rows - higher precision).
+    rows: PositiveInt = 2
+    # The minimum estimated Jaccard similarity of candidates.
+    threshold: Annotated[float, Field(ge=0.0, le=1.0)] = 0.1
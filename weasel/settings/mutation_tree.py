@@ -10,5 +10,7 @@ class MutationTreeSettings(BaseModel):
     degree_of_freedom: NonNegativeInt = 3
     # The maximum tree depth.
     depth: NonNegativeInt = 3
+    # The transposition table size (entries).
+    table_size: NonNegativeInt = 1024
     # The tolerance.
     tolerance: Annotated[float, Field(ge=0.0, le=1.0)] = 0.075
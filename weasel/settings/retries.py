@@ -8,3 +8,5 @@ class RetriesSettings(BaseModel):
     attemps: NonNegativeInt = 3
     # The delay between attempts (seconds).
     delay: NonNegativeFloat = 2.5
+    # The maximum delay between attempts of the API requests (seconds, exponential with jitter).
+    max_delay: NonNegativeFloat = 60.0
@@ -0,0 +1,10 @@
+from pydantic import BaseModel, PositiveInt
+
+
+class SchedulerSettings(BaseModel):
+    """The scheduler settings."""
+
+    # The maximum number of concurrent matches (across all tasks).
+    global_limit: PositiveInt = 256
+    # The maximum number of concurrent comparisons (per task).
+    task_limit: PositiveInt = 8
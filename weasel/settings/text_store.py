@@ -0,0 +1,8 @@
+from pydantic import BaseModel, NonNegativeInt
+
+
+class TextStoreSettings(BaseModel):
+    """The text store settings."""
+
+    # The store size limit (bytes).
+    size_limit: NonNegativeInt = 256 * 1024 * 1024  # 256 MB